@@ -52,3 +52,9 @@ pprint(proof_verification)
 wallet_address = "XCA1kLpg7A9c919tsQZBDYPHoLSZgCzihZPgP569CtFpJvAvQrpqW72HZzLKHRRLpSQzpdKBwJeTaUXGco7E4tHr9TynMN5yfi"
 generated_address = blockchain.generate_integrated_address(public_address=wallet_address)
 pprint(generated_address)
+
+# Serve statistics from a TTL cache, stale values are returned while one background refresh runs
+from xcash.cache import TTLCache
+
+cached_blockchain = BlockchainExplorer(ttl_cache=TTLCache(ttl=60, ttls={"get_current_block_height": 10}))
+pprint(cached_blockchain.get_blockchain_data())
@@ -38,5 +38,11 @@ pprint(delegate_voters_list)
 delegate_voters_list = explorer.get_delegate_voter_list(delegate=delegate_name)
 pprint(delegate_voters_list)
 
-
-
+# Keep an indexed snapshot of all delegates, refreshed in the background
+from xcash.delegateRegistry import DelegateRegistry
+
+registry = DelegateRegistry(explorer=explorer)
+registry.subscribe(lambda diff: pprint(diff.rank_changes))
+registry.refresh()
+pprint(registry.by_name(delegate_name))
+pprint(registry.top(10))
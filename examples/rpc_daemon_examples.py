@@ -113,3 +113,44 @@ relay_result = daemon_rpc.relay_tx(tx_ids=tx_ids)
 # sync info
 sync_info = daemon_rpc.sync_info()
 pprint(sync_info)
+
+# Batch several calls into a single request
+with daemon_rpc.batch() as batch:
+    for height in range(800000, 800010):
+        batch.add("get_block_header_by_height", {"height": height})
+pprint(batch.results)
+
+# Same with a list of calls, errors are returned per call
+results = daemon_rpc.call_many([("get_block", {"height": 800000}), "get_block_count"])
+pprint(results)
+
+# Fetch a range of blocks concurrently, results are in height order
+blocks = daemon_rpc.get_blocks(start_height=800000, end_height=801000, concurrency=8,
+                               progress=lambda chunk: print(chunk.completed, chunk.total, chunk.elapsed))
+
+# Header only scan with automatic chunk sizing
+headers = daemon_rpc.get_block_headers(start_height=800000, end_height=850000, concurrency=8)
+
+# Stream blocks one at a time, the next windows are prefetched in the background
+for block in daemon_rpc.iter_blocks(start_height=800000, end_height=900000, window=50, read_ahead=2):
+    pprint(block["result"]["block_header"]["height"])
+
+for header in daemon_rpc.iter_headers(start_height=800000, end_height=900000):
+    pprint(header["hash"])
+
+# Follow the chain tip, many consumers can subscribe to one follower
+from xcash.chainFollower import ChainFollower
+
+follower = ChainFollower(daemon=daemon_rpc)
+follower.subscribe(on_block=lambda block: print("new block", block.height, block.hash),
+                   on_rollback=lambda rollback: print("reorg, rolled back to", rollback.fork_height))
+follower.start()
+
+# Cache blocks and headers, entries close to the tip are dropped when the follower sees a reorg
+from xcash.cache import BlockCache
+
+cache = BlockCache(max_bytes=256 * 1024 * 1024, confirmations=10)
+cached_daemon = XcashDaemonRpc(cache=cache)
+follower.subscribe(on_block=cache.on_block, on_rollback=cache.on_rollback)
+block = cached_daemon.get_block(800000)
+pprint(cache.stats())
@@ -205,6 +205,22 @@ height = 800000
 incoming_transfers = wallet.get_transfers(min_height=height)
 pprint(incoming_transfers)
 
+# Follow new and changed transfers, only the blocks above the cursor are fetched on each sync
+from xcash.transferSync import TransferSync
+
+transfer_sync = TransferSync(wallet=wallet, path="transfers.json")
+for event in transfer_sync.sync():
+    print(event.kind, event.transfer["txid"], event.transfer["type"], event.transfer["amount"])
+
+# Watch many payment ids, events are sent when a payment is mined and when it has 10 confirmations
+from xcash.paymentWatcher import PaymentWatcher
+
+watcher = PaymentWatcher(wallet=wallet, confirmations=10)
+watcher.subscribe(lambda event: print(event.kind, event.payment_id, event.payment["amount"]))
+watcher.watch(["60900e5603bf96e3", "4279257e0a20608e"])
+watcher.poll()
+print(watcher.is_paid("60900e5603bf96e3"))
+
 # Get transfers based on transaction ID
 tx_id = "c36258a276018c3a4bc1f195a7fb530f50cd63a4fa765fb7c6f7f49fc051762a"
 id_transfers = wallet.get_transfers_by_txid(tx_id=tx_id)
@@ -22,4 +22,9 @@ setup(
     install_requires=[
         "requests"
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
+        "numpy": ["numpy"],
+    },
 )
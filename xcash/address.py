@@ -0,0 +1,709 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+try:
+    from Crypto.Hash import keccak as _keccak
+except ImportError:
+    _keccak = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+STANDARD = "standard"
+INTEGRATED = "integrated"
+SUBADDRESS = "subaddress"
+
+STANDARD_PREFIX = 0x5c134  # XCA..., 98 characters
+INTEGRATED_LEAD = "XCB"  # XCB..., 110 characters, carries an 8 byte payment id
+# network prefix -> address type, add the prefixes of other networks or forks here, or with register_prefix
+PREFIXES = {STANDARD_PREFIX: STANDARD}
+
+KEY_SIZE = 32
+PAYMENT_ID_SIZE = 8
+CHECKSUM_SIZE = 4
+CACHE_SIZE = 65536
+VECTOR_MIN = 64  # checksums computed with numpy from this many addresses on
+
+AddressInfo = namedtuple("AddressInfo", ["address", "valid", "type", "prefix", "spend_key", "view_key",
+                                         "payment_id", "error"])
+
+_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_INDEX = dict((char, index) for index, char in enumerate(_ALPHABET))
+# characters per encoded block of 0..8 bytes
+_ENCODED_SIZES = (0, 2, 3, 5, 6, 7, 9, 10, 11)
+_DECODED_SIZES = dict((size, index) for index, size in enumerate(_ENCODED_SIZES))
+_FULL_BLOCK = 11
+
+_ROUND_CONSTANTS = (
+    0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000,
+    0x000000000000808B, 0x0000000080000001, 0x8000000080008081, 0x8000000000008009,
+    0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+    0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003,
+    0x8000000000008002, 0x8000000000000080, 0x000000000000800A, 0x800000008000000A,
+    0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008,
+)
+_ROTATIONS = ((0, 36, 3, 41, 18), (1, 44, 10, 45, 2), (62, 6, 43, 15, 61), (28, 55, 25, 21, 56),
+              (27, 20, 39, 8, 14))
+# (target lane, rotation) of each lane in rho and pi, lanes are indexed x + 5 * y
+_RHO_PI = tuple((y + 5 * ((2 * x + 3 * y) % 5), _ROTATIONS[x][y]) for y in range(5) for x in range(5))
+_MASK = (1 << 64) - 1
+_RATE = 136
+
+
+def _keccak_f(state: list) -> list:
+    """Keccak-f[1600] permutation, unrolled over the 25 lanes
+
+    Args:
+        state (list): 25 lanes, indexed x + 5 * y
+
+    Returns:
+        list: permuted lanes
+    """
+    mask = _MASK
+    (a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15, a16, a17, a18, a19, a20, a21,
+     a22, a23, a24) = state
+    for constant in _ROUND_CONSTANTS:
+        c0 = a0 ^ a5 ^ a10 ^ a15 ^ a20
+        c1 = a1 ^ a6 ^ a11 ^ a16 ^ a21
+        c2 = a2 ^ a7 ^ a12 ^ a17 ^ a22
+        c3 = a3 ^ a8 ^ a13 ^ a18 ^ a23
+        c4 = a4 ^ a9 ^ a14 ^ a19 ^ a24
+        d0 = c4 ^ (((c1 << 1) | (c1 >> 63)) & mask)
+        d1 = c0 ^ (((c2 << 1) | (c2 >> 63)) & mask)
+        d2 = c1 ^ (((c3 << 1) | (c3 >> 63)) & mask)
+        d3 = c2 ^ (((c4 << 1) | (c4 >> 63)) & mask)
+        d4 = c3 ^ (((c0 << 1) | (c0 >> 63)) & mask)
+        b0 = a0 ^ d0
+        t = a1 ^ d1
+        b10 = ((t << 1) | (t >> 63)) & mask
+        t = a2 ^ d2
+        b20 = ((t << 62) | (t >> 2)) & mask
+        t = a3 ^ d3
+        b5 = ((t << 28) | (t >> 36)) & mask
+        t = a4 ^ d4
+        b15 = ((t << 27) | (t >> 37)) & mask
+        t = a5 ^ d0
+        b16 = ((t << 36) | (t >> 28)) & mask
+        t = a6 ^ d1
+        b1 = ((t << 44) | (t >> 20)) & mask
+        t = a7 ^ d2
+        b11 = ((t << 6) | (t >> 58)) & mask
+        t = a8 ^ d3
+        b21 = ((t << 55) | (t >> 9)) & mask
+        t = a9 ^ d4
+        b6 = ((t << 20) | (t >> 44)) & mask
+        t = a10 ^ d0
+        b7 = ((t << 3) | (t >> 61)) & mask
+        t = a11 ^ d1
+        b17 = ((t << 10) | (t >> 54)) & mask
+        t = a12 ^ d2
+        b2 = ((t << 43) | (t >> 21)) & mask
+        t = a13 ^ d3
+        b12 = ((t << 25) | (t >> 39)) & mask
+        t = a14 ^ d4
+        b22 = ((t << 39) | (t >> 25)) & mask
+        t = a15 ^ d0
+        b23 = ((t << 41) | (t >> 23)) & mask
+        t = a16 ^ d1
+        b8 = ((t << 45) | (t >> 19)) & mask
+        t = a17 ^ d2
+        b18 = ((t << 15) | (t >> 49)) & mask
+        t = a18 ^ d3
+        b3 = ((t << 21) | (t >> 43)) & mask
+        t = a19 ^ d4
+        b13 = ((t << 8) | (t >> 56)) & mask
+        t = a20 ^ d0
+        b14 = ((t << 18) | (t >> 46)) & mask
+        t = a21 ^ d1
+        b24 = ((t << 2) | (t >> 62)) & mask
+        t = a22 ^ d2
+        b9 = ((t << 61) | (t >> 3)) & mask
+        t = a23 ^ d3
+        b19 = ((t << 56) | (t >> 8)) & mask
+        t = a24 ^ d4
+        b4 = ((t << 14) | (t >> 50)) & mask
+        a0 = b0 ^ (~b1 & b2)
+        a1 = b1 ^ (~b2 & b3)
+        a2 = b2 ^ (~b3 & b4)
+        a3 = b3 ^ (~b4 & b0)
+        a4 = b4 ^ (~b0 & b1)
+        a5 = b5 ^ (~b6 & b7)
+        a6 = b6 ^ (~b7 & b8)
+        a7 = b7 ^ (~b8 & b9)
+        a8 = b8 ^ (~b9 & b5)
+        a9 = b9 ^ (~b5 & b6)
+        a10 = b10 ^ (~b11 & b12)
+        a11 = b11 ^ (~b12 & b13)
+        a12 = b12 ^ (~b13 & b14)
+        a13 = b13 ^ (~b14 & b10)
+        a14 = b14 ^ (~b10 & b11)
+        a15 = b15 ^ (~b16 & b17)
+        a16 = b16 ^ (~b17 & b18)
+        a17 = b17 ^ (~b18 & b19)
+        a18 = b18 ^ (~b19 & b15)
+        a19 = b19 ^ (~b15 & b16)
+        a20 = b20 ^ (~b21 & b22)
+        a21 = b21 ^ (~b22 & b23)
+        a22 = b22 ^ (~b23 & b24)
+        a23 = b23 ^ (~b24 & b20)
+        a24 = b24 ^ (~b20 & b21)
+        a0 ^= constant
+    return [a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15, a16, a17, a18, a19, a20, a21,
+            a22, a23, a24]
+
+
+def keccak256(data: bytes) -> bytes:
+    """Keccak-256 hash as used by CryptoNote. It pads differently from SHA3-256, so hashlib can not
+    be used. pycryptodome is used when it is installed, otherwise a pure Python implementation.
+
+    Args:
+        data (bytes): message
+
+    Returns:
+        bytes: 32 byte digest
+    """
+    if _keccak is not None:
+        return _keccak.new(digest_bits=256, data=data).digest()
+
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(bytes(-len(padded) % _RATE))
+    padded[-1] |= 0x80
+
+    state = [0] * 25
+    for offset in range(0, len(padded), _RATE):
+        for i in range(_RATE // 8):
+            state[i] ^= int.from_bytes(padded[offset + 8 * i:offset + 8 * i + 8], "little")
+        state = _keccak_f(state)
+    return b"".join(lane.to_bytes(8, "little") for lane in state[:4])
+
+
+def b58decode(text: str) -> bytes:
+    """Decode CryptoNote base58, which encodes 8 byte blocks into 11 characters each
+
+    Args:
+        text (str): base58 text
+
+    Raises:
+        ValueError: The text is not valid CryptoNote base58
+
+    Returns:
+        bytes: decoded data
+    """
+    decoded = bytearray()
+    for start in range(0, len(text), _FULL_BLOCK):
+        block = text[start:start + _FULL_BLOCK]
+        size = _DECODED_SIZES.get(len(block))
+        if size is None:
+            raise ValueError(f"Invalid base58 block length {len(block)}")
+        value = 0
+        for char in block:
+            digit = _INDEX.get(char)
+            if digit is None:
+                raise ValueError(f"Invalid base58 character {char!r}")
+            value = value * 58 + digit
+        if value >> (8 * size):
+            raise ValueError("Base58 block overflows")
+        decoded += value.to_bytes(size, "big")
+    return bytes(decoded)
+
+
+def b58encode(data: bytes) -> str:
+    """Encode CryptoNote base58
+
+    Args:
+        data (bytes): data
+
+    Returns:
+        str: base58 text
+    """
+    encoded = list()
+    for start in range(0, len(data), 8):
+        block = data[start:start + 8]
+        value = int.from_bytes(block, "big")
+        chars = [_ALPHABET[0]] * _ENCODED_SIZES[len(block)]
+        for position in range(len(chars) - 1, -1, -1):
+            value, digit = divmod(value, 58)
+            chars[position] = _ALPHABET[digit]
+        encoded.append("".join(chars))
+    return "".join(encoded)
+
+
+def read_varint(data: bytes) -> tuple:
+    """Read a little endian base 128 varint
+
+    Args:
+        data (bytes): data starting with the varint
+
+    Raises:
+        ValueError: The varint is not terminated
+
+    Returns:
+        tuple: (value, number of bytes read)
+    """
+    value = 0
+    for index, byte in enumerate(data[:10]):
+        value |= (byte & 0x7f) << (7 * index)
+        if not byte & 0x80:
+            return value, index + 1
+    raise ValueError("Unterminated varint")
+
+
+def write_varint(value: int) -> bytes:
+    """Write a little endian base 128 varint
+
+    Args:
+        value (int): non negative value
+
+    Returns:
+        bytes: varint
+    """
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7f) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _keccak_f_array(state: list) -> list:
+    """Keccak-f[1600] permutation of many states at once
+
+    Args:
+        state (list): 25 numpy uint64 arrays, one value per message, indexed x + 5 * y
+
+    Returns:
+        list: permuted lanes
+    """
+    one, sixty_three = numpy.uint64(1), numpy.uint64(63)
+    rotations = [(numpy.uint64(rotation), numpy.uint64(64 - rotation)) for _, rotation in _RHO_PI]
+    for constant in _ROUND_CONSTANTS:
+        c = [state[x] ^ state[x + 5] ^ state[x + 10] ^ state[x + 15] ^ state[x + 20] for x in range(5)]
+        d = [c[(x - 1) % 5] ^ ((c[(x + 1) % 5] << one) | (c[(x + 1) % 5] >> sixty_three)) for x in range(5)]
+        b = [None] * 25
+        for source, (target, rotation) in enumerate(_RHO_PI):
+            lane = state[source] ^ d[source % 5]
+            left, right = rotations[source]
+            b[target] = (lane << left) | (lane >> right) if rotation else lane
+        state = [b[i] ^ (~b[i - i % 5 + (i + 1) % 5] & b[i - i % 5 + (i + 2) % 5]) for i in range(25)]
+        state[0] = state[0] ^ numpy.uint64(constant)
+    return state
+
+
+def keccak256_many(messages: list) -> list:
+    """Keccak-256 of many messages, vectorized with numpy over the messages of equal length
+
+    Args:
+        messages (list): bytes
+
+    Returns:
+        list: 32 byte digest per message
+    """
+    if numpy is None or _keccak is not None or len(messages) < VECTOR_MIN:
+        return [keccak256(message) for message in messages]
+
+    lengths = dict()
+    for index, message in enumerate(messages):
+        lengths.setdefault(len(message), []).append(index)
+
+    digests = [None] * len(messages)
+    for length, indices in lengths.items():
+        blocks = length // _RATE + 1
+        padded = numpy.zeros((len(indices), blocks * _RATE), dtype=numpy.uint8)
+        padded[:, :length] = numpy.frombuffer(b"".join(messages[i] for i in indices),
+                                              dtype=numpy.uint8).reshape(len(indices), length)
+        padded[:, length] ^= 0x01
+        padded[:, -1] ^= 0x80
+        words = padded.view("<u8")
+
+        state = [numpy.zeros(len(indices), dtype=numpy.uint64) for _ in range(25)]
+        for block in range(blocks):
+            for i in range(_RATE // 8):
+                state[i] = state[i] ^ words[:, block * _RATE // 8 + i]
+            state = _keccak_f_array(state)
+        rows = numpy.stack(state[:4], axis=1).astype("<u8").tobytes()
+        for row, index in enumerate(indices):
+            digests[index] = rows[32 * row:32 * row + 32]
+    return digests
+
+
+def _invalid(address, error: str, prefix: int = None) -> AddressInfo:
+    return AddressInfo(address, False, None, prefix, None, None, None, error)
+
+
+def _split(address: str) -> tuple:
+    """Decode the base58 of an address and read its network prefix
+
+    Args:
+        address (str): XCASH address
+
+    Raises:
+        ValueError: The address is not valid base58 or too short
+
+    Returns:
+        tuple: (decoded data, prefix, length of the prefix)
+    """
+    data = b58decode(address)
+    prefix, offset = read_varint(data)
+    if len(data) < offset + CHECKSUM_SIZE:
+        raise ValueError("Address is too short")
+    return data, prefix, offset
+
+
+def _verify(address: str, data: bytes, prefix: int, offset: int, digest: bytes, kind: str = None) -> AddressInfo:
+    """Check the checksum, network prefix and size of a decoded address
+
+    Args:
+        address (str): XCASH address
+        data (bytes): decoded address
+        prefix (int): network prefix
+        offset (int): length of the prefix
+        digest (bytes): keccak256 of the data before the checksum
+        kind (str, optional): Address type of the prefix. Defaults to None, the registered type.
+
+    Returns:
+        AddressInfo: decoded address
+    """
+    if digest[:CHECKSUM_SIZE] != data[-CHECKSUM_SIZE:]:
+        return _invalid(address, "Checksum mismatch", prefix)
+
+    payload = data[offset:-CHECKSUM_SIZE]
+    kind = kind or PREFIXES.get(prefix)
+    if kind is None and address.startswith(INTEGRATED_LEAD) and len(payload) == 2 * KEY_SIZE + PAYMENT_ID_SIZE:
+        # XCASH integrated addresses are told by their lead and size until their prefix is registered
+        kind = INTEGRATED
+    if kind is None:
+        return _invalid(address, f"Unknown network prefix {prefix:#x}", prefix)
+
+    expected = 2 * KEY_SIZE + (PAYMENT_ID_SIZE if kind == INTEGRATED else 0)
+    if len(payload) != expected:
+        return _invalid(address, f"A {kind} address holds {expected} bytes, not {len(payload)}", prefix)
+
+    payment_id = payload[2 * KEY_SIZE:].hex() if kind == INTEGRATED else None
+    return AddressInfo(address, True, kind, prefix, payload[:KEY_SIZE].hex(), payload[KEY_SIZE:2 * KEY_SIZE].hex(),
+                       payment_id, None)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def decode_address(address: str) -> AddressInfo:
+    """Decode and verify an address locally: base58, network prefix and keccak checksum. Results
+    are cached, so repeated addresses are only decoded once.
+
+    Args:
+        address (str): XCASH address
+
+    Returns:
+        AddressInfo: valid, type ("standard", "integrated" or "subaddress"), prefix, spend and view
+                     key, payment id of integrated addresses, error explaining an invalid address
+    """
+    if not isinstance(address, str):
+        return _invalid(address, "Address is not a string")
+    try:
+        data, prefix, offset = _split(address)
+    except ValueError as err:
+        return _invalid(address, str(err))
+    return _verify(address, data, prefix, offset, keccak256(data[:-CHECKSUM_SIZE]))
+
+
+def _decode_chunk(addresses: list) -> list:
+    """Decode distinct addresses, hashing them together with keccak256_many
+
+    Args:
+        addresses (list): XCASH addresses
+
+    Returns:
+        list: AddressInfo per address
+    """
+    results = [None] * len(addresses)
+    decoded = list()
+    for index, address in enumerate(addresses):
+        try:
+            decoded.append((index, *_split(address)))
+        except ValueError as err:
+            results[index] = _invalid(address, str(err))
+
+    digests = keccak256_many([data[:-CHECKSUM_SIZE] for _, data, _, _ in decoded])
+    for (index, data, prefix, offset), digest in zip(decoded, digests):
+        results[index] = _verify(addresses[index], data, prefix, offset, digest)
+    return results
+
+
+def validate_addresses(addresses, processes: int = None, chunk_size: int = 20000) -> list:
+    """Validate many addresses locally, see decode_address. Every distinct address is decoded once
+    and the checksums are computed together, vectorized when numpy is installed.
+
+    Args:
+        addresses (iterable): XCASH addresses
+        processes (int, optional): Decode across a pool of this many processes, for lists of hundreds
+                                   of thousands of distinct addresses. Defaults to None, in this process.
+        chunk_size (int, optional): Addresses per task sent to the process pool. Defaults to 20000.
+
+    Returns:
+        list: AddressInfo per address, in input order
+    """
+    addresses = list(addresses)
+    distinct = list(dict.fromkeys(address for address in addresses if isinstance(address, str)))
+    if processes and len(distinct) > chunk_size:
+        chunks = [distinct[start:start + chunk_size] for start in range(0, len(distinct), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            decoded = [info for infos in executor.map(_decode_chunk, chunks) for info in infos]
+    else:
+        decoded = _decode_chunk(distinct)
+
+    results = dict(zip(distinct, decoded))
+    return [results[address] if isinstance(address, str) else _invalid(address, "Address is not a string")
+            for address in addresses]
+
+
+def register_prefix(prefix: int, kind: str) -> None:
+    """Register a network prefix, e.g. the integrated prefix read from one address the wallet made
+
+    Args:
+        prefix (int): network prefix
+        kind (str): "standard", "integrated" or "subaddress"
+
+    Raises:
+        ValueError: Unknown address type
+    """
+    if kind not in (STANDARD, INTEGRATED, SUBADDRESS):
+        raise ValueError(f"Unknown address type {kind}")
+    PREFIXES[prefix] = kind
+    decode_address.cache_clear()
+
+
+def learn_prefix(address: str, kind: str = None) -> int:
+    """Register the network prefix of an address, see register_prefix
+
+    Args:
+        address (str): XCASH address made by the wallet, e.g. an integrated address or a subaddress
+        kind (str, optional): "standard", "integrated" or "subaddress". Defaults to None, the type the
+                              address decodes as.
+
+    Raises:
+        ValueError: The address is not valid, or kind is not given for an unknown prefix
+
+    Returns:
+        int: network prefix
+    """
+    try:
+        data, prefix, offset = _split(address)
+    except (TypeError, ValueError) as err:
+        raise ValueError(f"Can not learn the prefix of an invalid address: {err}")
+    info = _verify(address, data, prefix, offset, keccak256(data[:-CHECKSUM_SIZE]), kind)
+    if not info.valid:
+        raise ValueError(f"Can not learn the prefix of an invalid address: {info.error}")
+    register_prefix(info.prefix, info.type)
+    return info.prefix
+
+
+def learn_subaddress(addresses: dict) -> int:
+    """Register the network prefix of the subaddresses from a get_address result
+
+    Args:
+        addresses (dict): result of the wallet's get_address
+
+    Raises:
+        ValueError: The result holds no subaddress
+
+    Returns:
+        int: subaddress prefix
+    """
+    for entry in addresses.get("addresses") or []:
+        if entry.get("address_index"):
+            return learn_prefix(entry["address"], SUBADDRESS)
+    raise ValueError("The account has no subaddress, create one with create_address")
+
+
+def prefix_of(kind: str):
+    """Get the registered network prefix of an address type
+
+    Args:
+        kind (str): "standard", "integrated" or "subaddress"
+
+    Returns:
+        int: network prefix, None when no prefix is registered for the type
+    """
+    for prefix, registered in PREFIXES.items():
+        if registered == kind:
+            return prefix
+    return None
+
+
+def _hex(name: str, value: str, size: int) -> bytes:
+    """Decode a hex key or payment id
+
+    Args:
+        name (str): name used in the error
+        value (str): hex text
+        size (int): expected size in bytes
+
+    Raises:
+        ValueError: The value is not hex of the expected size
+
+    Returns:
+        bytes: decoded value
+    """
+    try:
+        decoded = bytes.fromhex(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"The {name} is not hex: {value!r}")
+    if len(decoded) != size:
+        raise ValueError(f"The {name} must be {2 * size} hex characters, not {len(value)}")
+    return decoded
+
+
+def _payload(prefix: int, spend_key: str, view_key: str, payment_id: str = None) -> bytes:
+    """Assemble an address without its checksum
+
+    Args:
+        prefix (int): network prefix
+        spend_key (str): hex public spend key
+        view_key (str): hex public view key
+        payment_id (str, optional): hex 8 byte payment id of integrated addresses. Defaults to None.
+
+    Raises:
+        ValueError: A key or the payment id is not hex of the right size
+
+    Returns:
+        bytes: prefix varint, keys and payment id
+    """
+    data = write_varint(prefix) + _hex("spend key", spend_key, KEY_SIZE) + _hex("view key", view_key, KEY_SIZE)
+    if payment_id is not None:
+        data += _hex("payment id", payment_id, PAYMENT_ID_SIZE)
+    return data
+
+
+def encode_address(prefix: int, spend_key: str, view_key: str, payment_id: str = None) -> str:
+    """Encode an address locally: network prefix, public keys, payment id and keccak checksum
+
+    Args:
+        prefix (int): network prefix
+        spend_key (str): hex public spend key
+        view_key (str): hex public view key
+        payment_id (str, optional): hex 8 byte payment id, makes an integrated address. Defaults to None.
+
+    Raises:
+        ValueError: A key or the payment id is not hex of the right size
+
+    Returns:
+        str: XCASH address
+    """
+    data = _payload(prefix, spend_key, view_key, payment_id)
+    return b58encode(data + keccak256(data)[:CHECKSUM_SIZE])
+
+
+def _integrated_prefix(prefix: int = None) -> int:
+    prefix = prefix if prefix is not None else prefix_of(INTEGRATED)
+    if prefix is None:
+        raise ValueError("The integrated address prefix is not known, pass it or register it with learn_prefix "
+                         "from one integrated address made by the wallet")
+    return prefix
+
+
+def _standard_keys(standard_address: str) -> AddressInfo:
+    info = decode_address(standard_address)
+    if not info.valid:
+        raise ValueError(f"Invalid address {standard_address}: {info.error}")
+    if info.type != STANDARD:
+        raise ValueError(f"Integrated addresses are made from standard addresses, not a {info.type} address")
+    return info
+
+
+def make_integrated_address(standard_address: str, payment_id: str, prefix: int = None) -> str:
+    """Make an integrated address locally, the result of the wallet's make_integrated_address
+
+    Args:
+        standard_address (str): standard address
+        payment_id (str): 16 hex characters
+        prefix (int, optional): integrated network prefix. Defaults to the registered one, see learn_prefix.
+
+    Raises:
+        ValueError: Invalid address or payment id, or the integrated prefix is not known
+
+    Returns:
+        str: integrated address
+    """
+    info = _standard_keys(standard_address)
+    return encode_address(_integrated_prefix(prefix), info.spend_key, info.view_key, payment_id)
+
+
+def make_integrated_addresses(standard_address: str, payment_ids: list, prefix: int = None) -> list:
+    """Make the integrated addresses of many payment ids, with the checksums computed together
+
+    Args:
+        standard_address (str): standard address
+        payment_ids (list): 16 hex characters each
+        prefix (int, optional): integrated network prefix. Defaults to the registered one, see learn_prefix.
+
+    Raises:
+        ValueError: Invalid address or payment id, or the integrated prefix is not known
+
+    Returns:
+        list: integrated address per payment id
+    """
+    info = _standard_keys(standard_address)
+    head = _payload(_integrated_prefix(prefix), info.spend_key, info.view_key)
+    payloads = [head + _hex("payment id", payment_id, PAYMENT_ID_SIZE) for payment_id in payment_ids]
+    return [b58encode(data + digest[:CHECKSUM_SIZE]) for data, digest in zip(payloads, keccak256_many(payloads))]
+
+
+def _split_info(info: AddressInfo, standard_prefix: int, standard: dict) -> dict:
+    """Split a decoded integrated address
+
+    Args:
+        info (AddressInfo): decoded address
+        standard_prefix (int): network prefix of the standard address
+        standard (dict): (spend key, view key) -> standard address, integrated addresses of one
+                         wallet share their keys
+
+    Raises:
+        ValueError: The address is not a valid integrated address
+
+    Returns:
+        dict: is_subaddress, payment_id, standard_address
+    """
+    if not info.valid:
+        raise ValueError(f"Invalid address {info.address}: {info.error}")
+    if info.type != INTEGRATED:
+        raise ValueError(f"{info.address} is not an integrated address, its type is {info.type}")
+    keys = (info.spend_key, info.view_key)
+    if keys not in standard:
+        standard[keys] = encode_address(standard_prefix, *keys)
+    return {"is_subaddress": False, "payment_id": info.payment_id, "standard_address": standard[keys]}
+
+
+def split_integrated_address(integrated_address: str, standard_prefix: int = STANDARD_PREFIX) -> dict:
+    """Split an integrated address locally, the result of the wallet's split_integrated_address
+
+    Args:
+        integrated_address (str): integrated address
+        standard_prefix (int, optional): network prefix of the standard address. Defaults to STANDARD_PREFIX.
+
+    Raises:
+        ValueError: The address is not a valid integrated address
+
+    Returns:
+        dict: is_subaddress, payment_id, standard_address
+    """
+    return _split_info(decode_address(integrated_address), standard_prefix, dict())
+
+
+def split_integrated_addresses(integrated_addresses, standard_prefix: int = STANDARD_PREFIX) -> list:
+    """Split many integrated addresses locally, see split_integrated_address. The checksums are
+    verified together, see validate_addresses.
+
+    Args:
+        integrated_addresses (iterable): integrated addresses
+        standard_prefix (int, optional): network prefix of the standard address. Defaults to STANDARD_PREFIX.
+
+    Raises:
+        ValueError: An address is not a valid integrated address
+
+    Returns:
+        list: dict with is_subaddress, payment_id and standard_address per address
+    """
+    standard = dict()
+    return [_split_info(info, standard_prefix, standard) for info in validate_addresses(integrated_addresses)]
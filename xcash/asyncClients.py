@@ -0,0 +1,893 @@
+import asyncio
+import copy
+import time
+import weakref
+from collections import deque
+from itertools import islice
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from xcash.address import INTEGRATED, learn_prefix, learn_subaddress
+from xcash.blockchainExplorer import BlockchainExplorer
+from xcash.delegatesExplorer import DelegatesExplorer
+from xcash.codec import is_raw, raw
+from xcash.columns import DEFAULT_HEADER_FIELDS, fill_headers, header_buffer
+from xcash.deadline import current_deadline
+from xcash.helpers import (NON_IDEMPOTENT_METHODS, STREAM_CHUNK_SIZE, CircuitOpenError, DeadlineExceeded, Helpers,
+                           RequestError, RpcError)
+from xcash.models import BlockHeader, result
+from xcash.rpc import MAX_HEADERS_CHUNK, RangeChunk, XcashDaemonRpc, XcashRpc, XcashWalletRpc, split_range
+from xcash.sharedDelegate import SharedDelegate
+from xcash.stream import JsonStream
+
+DEFAULT_LIMIT = 200
+DEFAULT_LIMIT_PER_HOST = 100
+
+_pool_config = {"limit": DEFAULT_LIMIT,
+                "limit_per_host": DEFAULT_LIMIT_PER_HOST}
+_sessions = weakref.WeakKeyDictionary()
+_refresh_tasks = set()
+
+
+def create_async_session(limit: int = DEFAULT_LIMIT, limit_per_host: int = DEFAULT_LIMIT_PER_HOST):
+    """Create a non-blocking HTTP session backed by a connection pool
+
+    Args:
+        limit (int, optional): Maximum number of open connections. Defaults to 200.
+        limit_per_host (int, optional): Maximum number of open connections per host. Defaults to 100.
+
+    Raises:
+        ImportError: aiohttp is not installed
+
+    Returns:
+        aiohttp.ClientSession: session with a pooled connector
+    """
+    if aiohttp is None:
+        raise ImportError("Async clients require aiohttp. Install it with: pip install xcash[async]")
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+    return aiohttp.ClientSession(connector=connector)
+
+
+def get_async_session():
+    """Get the connection pool shared by all async clients of the running event loop
+
+    Returns:
+        aiohttp.ClientSession: shared session
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = create_async_session(**_pool_config)
+        _sessions[loop] = session
+    return session
+
+
+def configure_async_session(limit: int = None, limit_per_host: int = None) -> None:
+    """Configure the shared async connection pool. Applies to pools created after the call,
+    use close_async_session() to replace a pool which is already open.
+
+    Args:
+        limit (int, optional): Maximum number of open connections.
+        limit_per_host (int, optional): Maximum number of open connections per host.
+    """
+    if limit is not None:
+        _pool_config["limit"] = limit
+    if limit_per_host is not None:
+        _pool_config["limit_per_host"] = limit_per_host
+
+
+async def close_async_session() -> None:
+    """Close the shared async pool of the running event loop.
+    """
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+class AsyncSingleFlight():
+    def __init__(self):
+        """Merge concurrent identical calls of an event loop into one in-flight task
+        """
+        self.calls = dict()
+        self.shared = 0
+
+    async def do(self, key: tuple, fetch):
+        """Make a call, or wait for the identical call already in flight and share its result
+
+        Args:
+            key (tuple): identifies identical calls
+            fetch (callable): Returns an awaitable making the call
+
+        Raises:
+            DeadlineExceeded: The caller's deadline passed while waiting for the call in flight
+
+        Returns:
+            Result of the call. Waiting callers get a copy so they can not change each other's data.
+        """
+        key = (asyncio.get_running_loop(), key)
+        task = self.calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self.calls[key] = task
+            task.add_done_callback(lambda done: self.__done(key, done))
+            return await asyncio.shield(task)
+
+        self.shared += 1
+        deadline = current_deadline()
+        try:
+            result = await asyncio.wait_for(asyncio.shield(task),
+                                            None if deadline is None else max(deadline.remaining(), 0))
+        except asyncio.TimeoutError:
+            if task.done():
+                raise
+            raise DeadlineExceeded(f"Deadline of {deadline.seconds} seconds exceeded")
+        return copy.deepcopy(result)
+
+    def __done(self, key: tuple, task) -> None:
+        """Forget a finished call
+
+        Args:
+            key (tuple): key of the call
+            task (asyncio.Task): finished task
+        """
+        self.calls.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+
+async_single_flight = AsyncSingleFlight()
+
+
+class AsyncHelpers(Helpers):
+    """Non-blocking transport for the clients. Every api method of an async client
+    returns an awaitable with the same data as its sync counterpart.
+    """
+
+    @property
+    def session(self):
+        """Session used for the HTTP calls of the client
+
+        Returns:
+            aiohttp.ClientSession: own session if provided, otherwise the shared pool
+        """
+        if self._session is not None:
+            return self._session
+        return get_async_session()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session owned by the client. Clients on the shared pool leave it open for
+        the other clients, use close_async_session() to close it.
+        """
+        if self._session is not None:
+            await self._session.close()
+
+    async def cached(self, key: tuple, fetch, store=None):
+        """Serve a call from the client cache, see Helpers.cached
+
+        Args:
+            key (tuple): cache key
+            fetch (callable): Returns an awaitable making the call
+            store (callable, optional): Stores the fetched data in the cache. Defaults to None.
+
+        Returns:
+            dict: Data from the cache or the api call
+        """
+        if self.cache is None or is_raw():
+            return await fetch()
+        data = self.cache.get(key)
+        if data is None:
+            data = await fetch()
+            if store:
+                store(data)
+        return data
+
+    async def ttl_cached(self, method: str, url: str):
+        """Serve a GET call from the TTL cache, stale values are returned while a background task refreshes
+        them, see Helpers.ttl_cached
+
+        Args:
+            method (str): endpoint method name
+            url (str): request url
+
+        Returns:
+            dict: Data from the cache or the api call
+        """
+        if self.ttl_cache is None or is_raw():
+            return await self.get_data(url=url)
+
+        def fetch():
+            return self.get_data(url=url)
+
+        key = (url, method)
+        entry = self.ttl_cache.lookup(key)
+        if entry is None:
+            data = await fetch()
+            self.ttl_cache.store(key, data)
+            return data
+
+        data, fresh = entry
+        if not fresh and self.ttl_cache.begin_refresh(key):
+            task = asyncio.ensure_future(self.__refresh(key, fetch))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+        return data
+
+    async def __refresh(self, key: tuple, fetch) -> None:
+        """Fetch and store a TTL cached value
+
+        Args:
+            key (tuple): (url, endpoint method name)
+            fetch (callable): Returns an awaitable making the call
+        """
+        try:
+            self.ttl_cache.store(key, await fetch())
+        except Exception as err:
+            self.ttl_cache.fail(key, err)
+
+    async def converted(self, data, convert, raw: bool = False):
+        """Convert api data to typed records, see Helpers.converted
+
+        Args:
+            data (awaitable): Makes the api call
+            convert (callable): Builds the records from the data
+            raw (bool, optional): Keep the data as it is. Defaults to False.
+
+        Returns:
+            Records, or the data unchanged for raw calls, raw responses and clients without models
+        """
+        data = await data
+        if raw or not self.models or is_raw():
+            return data
+        return convert(data)
+
+    async def converted_items(self, items, convert, raw: bool = False):
+        """Convert streamed api items to typed records, see Helpers.converted_items
+
+        Args:
+            items (async iterable): Items of the api call
+            convert (callable): Builds a record from one item
+            raw (bool, optional): Keep the items as they are. Defaults to False.
+
+        Yields:
+            records, or the items unchanged
+        """
+        keep = raw or not self.models or is_raw()
+        async for item in items:
+            yield item if keep else convert(item)
+
+    def client_timeout(self):
+        """aiohttp timeout for the next request, see Helpers.request_timeout
+
+        Raises:
+            DeadlineExceeded: The deadline of the operation has passed
+
+        Returns:
+            aiohttp.ClientTimeout: connect and read timeouts, the whole request is capped by a surrounding Deadline
+        """
+        connect, read = self.request_timeout()
+        deadline = current_deadline()
+        return aiohttp.ClientTimeout(total=deadline.remaining() if deadline is not None else None,
+                                     connect=connect, sock_read=read)
+
+    async def process_async_response(self, response):
+        """Process response
+
+        Args:
+            response (aiohttp.ClientResponse): response from the API call
+
+        Raises:
+            RequestError: HTTP error
+
+        Returns:
+            dict: Data from the api call
+        """
+        try:
+            if response.status == 200:
+                if is_raw():
+                    return await response.read()
+                return self.json_codec.loads(await response.read())
+            else:
+                response.raise_for_status()
+        except aiohttp.ClientResponseError as err:
+            raise RequestError(err, status_code=err.status)
+
+    async def open_stream(self, url: str, data: str = None, headers: dict = None):
+        """Send a request and return the response before its body is read, see Helpers.open_stream
+
+        Args:
+            url (str): string url
+            data (str, optional): POST request body, a GET request is sent without it. Defaults to None.
+            headers (dict, optional): request headers. Defaults to None.
+
+        Raises:
+            RequestError: HTTP error, connection error or timeout
+
+        Returns:
+            aiohttp.ClientResponse: response, to be released by the caller
+        """
+        session = self.session
+        if data is None:
+            method, headers = "GET", {'Accept': 'application/json', "Content-Type": "application/json"}
+        else:
+            method = "POST"
+        try:
+            response = await session.request(method, url, data=data, headers=headers, timeout=self.client_timeout())
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+            raise RequestError(err)
+        try:
+            response.raise_for_status()
+        except aiohttp.ClientResponseError as err:
+            response.release()
+            raise RequestError(err, status_code=err.status)
+        return response
+
+    async def iter_json(self, url: str, path: tuple = (), data: str = None, headers: dict = None):
+        """Stream the items of a JSON array in the response, see Helpers.iter_json
+
+        Args:
+            url (str): string url
+            path (tuple, optional): Object keys leading to the array, "*" matches any key.
+                                    Defaults to (), a top level array.
+            data (str, optional): POST request body, a GET request is sent without it. Defaults to None.
+            headers (dict, optional): request headers. Defaults to None.
+
+        Raises:
+            RpcError: The response holds an error or ended early
+
+        Yields:
+            items of the array
+        """
+        response = await self.retried(url, lambda: self.open_stream(url, data=data, headers=headers),
+                                      idempotent=True)
+        parser = JsonStream(path, codec=self.json_codec, exception=RpcError)
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    yield item
+            parser.close()
+        finally:
+            response.release()
+
+    async def get_data(self, url: str):
+        """Get processed data from GET request. Concurrent identical requests share one call.
+
+        Args:
+            url (str): string url
+
+        Raises:
+            RequestError: Connection error or timeout
+
+        Returns:
+            dict: Data from the api call
+        """
+
+        async def fetch():
+            session = self.session
+            try:
+                async with session.get(url, headers={'Accept': 'application/json',
+                                                     "Content-Type": "application/json"},
+                                       timeout=self.client_timeout()) as response:
+                    return await self.process_async_response(response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                raise RequestError(err)
+
+        return await self.coalesced(("GET", url),
+                                    lambda: self.hedged(lambda: self.retried(url, fetch, idempotent=True)))
+
+    async def post_data(self, url: str, data: str, headers: dict = None, idempotent: bool = False):
+        """Get processed data from POST request. Concurrent identical idempotent requests share one call.
+
+        Args:
+            url (str): string url
+            data (str): request body
+            headers (dict, optional): request headers. Defaults to None.
+            idempotent (bool, optional): The request can be merged with identical ones. Defaults to False.
+
+        Raises:
+            RequestError: Connection error or timeout
+
+        Returns:
+            dict: Data from the api call
+        """
+
+        async def fetch(node_url):
+            session = self.session
+            try:
+                async with session.post(node_url, data=data, headers=headers,
+                                        timeout=self.client_timeout()) as response:
+                    return await self.process_async_response(response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                raise RequestError(err)
+
+        def call():
+            return self.routed(url, lambda node_url: self.retried(node_url, lambda: fetch(node_url), idempotent),
+                               idempotent)
+
+        if not idempotent:
+            return await call()
+        return await self.coalesced(("POST", url, data), lambda: self.hedged(call))
+
+    async def hedged(self, fetch):
+        """Make an idempotent call under the hedge policy, see Helpers.hedged. The losing call is cancelled.
+
+        Args:
+            fetch (callable): Returns an awaitable making the call
+
+        Returns:
+            dict: Data from the first answer
+        """
+        if self.hedge is None:
+            return await fetch()
+
+        self.hedge.begin_request()
+        started = time.monotonic()
+        primary = asyncio.ensure_future(fetch())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge.delay())
+            if not done and self.hedge.begin_hedge():
+                tasks.add(asyncio.ensure_future(fetch()))
+
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.hedge.record(time.monotonic() - started, hedge_won=task is not primary)
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def routed(self, url: str, fetch, idempotent: bool):
+        """Send the call to the healthiest node of the client's NodePool, see Helpers.routed
+
+        Args:
+            url (str): request url, used as is without a pool
+            fetch (callable): Returns an awaitable making the call to the url it is given
+            idempotent (bool): The call can be repeated safely and spread over nodes
+
+        Raises:
+            RequestError: The pool has no node to send the call to
+
+        Returns:
+            dict: Data from the api call
+        """
+        if self.pool is None:
+            return await fetch(url)
+
+        last_error = None
+        for node in self.pool.candidates(read_only=idempotent):
+            self.pool.begin_call(node)
+            started = time.monotonic()
+            try:
+                data = await fetch(node.url)
+            except Exception as err:
+                if not self.pool.is_node_failure(err):
+                    self.pool.record_abort(node)
+                    raise
+                self.pool.record_failure(node)
+                if not self.pool.can_fail_over(err, idempotent):
+                    raise
+                last_error = err
+            except BaseException:
+                self.pool.record_abort(node)
+                raise
+            else:
+                self.pool.record_success(node, time.monotonic() - started)
+                return data
+        if last_error is None:
+            raise RequestError("No healthy node in the pool")
+        raise last_error
+
+    async def retried(self, url: str, fetch, idempotent: bool):
+        """Make a call under the retry policy, see Helpers.retried
+
+        Args:
+            url (str): request url
+            fetch (callable): Returns an awaitable making the call
+            idempotent (bool): The call can be repeated safely
+
+        Raises:
+            CircuitOpenError: The endpoint failed repeatedly and is not called
+
+        Returns:
+            dict: Data from the api call
+        """
+        if self.retry is None:
+            return await fetch()
+
+        breaker = self.retry.breaker(url)
+        self.retry.budget.deposit()
+        attempt = 1
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit for {url} is open after repeated failures")
+            try:
+                data = await fetch()
+            except Exception as err:
+                if self.retry.is_retryable(err):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if not idempotent or not self.retry.should_retry(err, attempt):
+                    raise
+                delay = self.retry.delay(attempt)
+                if not self.retry_fits_deadline(delay):
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+            except BaseException:
+                # cancelled, e.g. the losing call of a hedge: it neither succeeded nor failed
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return data
+
+    async def coalesced(self, key: tuple, fetch):
+        """Merge the call with identical calls in flight, unless coalescing is turned off
+
+        Args:
+            key (tuple): identifies identical calls
+            fetch (callable): Returns an awaitable making the call
+
+        Returns:
+            dict: Data from the api call
+        """
+        if not self.coalesce:
+            return await fetch()
+        return await async_single_flight.do((*key, is_raw()), fetch)
+
+
+class AsyncXcashRpc(AsyncHelpers, XcashRpc):
+    """Async functionality shared by the JSON-RPC clients
+    """
+
+    async def call_many(self, calls: list) -> list:
+        """Send several calls as one JSON-RPC 2.0 batch, see XcashRpc.call_many
+
+        Args:
+            calls (list): method names or (method, params) tuples
+
+        Returns:
+            list: response per call, in the order of calls
+        """
+        envelopes = self.build_batch(calls)
+        if not envelopes:
+            return []
+
+        idempotent = not any(e["method"] in NON_IDEMPOTENT_METHODS for e in envelopes)
+        codec = self.json_codec
+        self.check_nodes()
+        with raw(False):
+            data = await self.post_data(self.rpc_url, data=codec.dumps(envelopes), headers=self.headers,
+                                        idempotent=idempotent)
+            if isinstance(data, list):
+                return self.match_batch(envelopes, data)
+
+            async def single(envelope):
+                try:
+                    return await self.post_data(self.rpc_url, data=codec.dumps(envelope), headers=self.headers,
+                                                idempotent=envelope["method"] not in NON_IDEMPOTENT_METHODS)
+                except Exception as err:
+                    return self.batch_error(envelope, str(err))
+
+            return list(await asyncio.gather(*[single(e) for e in envelopes]))
+
+
+class AsyncXcashDaemonRpc(AsyncXcashRpc, XcashDaemonRpc):
+    """Async Xcash Daemon RPC wrapper, see XcashDaemonRpc for the available methods.
+    """
+
+    def check_nodes(self) -> None:
+        """Start a background height check of the pool nodes when refresh_interval has passed
+        """
+        if self.pool is not None and self.pool.begin_refresh():
+            task = asyncio.ensure_future(self.refresh_nodes())
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+
+    async def refresh_nodes(self) -> list:
+        """Ask every pool node for its height with get_info, see XcashDaemonRpc.refresh_nodes
+
+        Returns:
+            list: health of every node, see NodePool.stats
+        """
+        rpc_data = self.json_codec.dumps({"jsonrpc": "2.0", "id": "0", "method": "get_info"})
+
+        async def check(node):
+            self.pool.begin_call(node)
+            started = time.monotonic()
+            try:
+                async with self.session.post(node.url, data=rpc_data, headers=self.headers,
+                                             timeout=self.client_timeout()) as response:
+                    height = (await self.process_async_response(response))["result"]["height"]
+            except Exception:
+                self.pool.record_failure(node)
+            else:
+                self.pool.record_success(node, time.monotonic() - started)
+                self.pool.observe_height(node, height)
+
+        try:
+            await asyncio.gather(*[check(node) for node in self.pool.nodes])
+        finally:
+            self.pool.end_refresh()
+        return self.pool.stats()
+
+    async def get_blocks(self, start_height: int, end_height: int, concurrency: int = 4, chunk_size: int = 50,
+                         progress=None) -> list:
+        """Get all blocks of a height range, see XcashDaemonRpc.get_blocks
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            concurrency (int, optional): Number of chunks fetched at the same time. Defaults to 4.
+            chunk_size (int, optional): Number of blocks per chunk. Defaults to 50.
+            progress (callable, optional): Called with a RangeChunk after every fetched chunk. Defaults to None.
+
+        Returns:
+            list: get_block response per height, in height order
+        """
+        chunks = split_range(start_height, end_height, chunk_size)
+        return await self.fetch_chunks(chunks=chunks, fetch=self.__blocks_chunk, concurrency=concurrency,
+                                       progress=progress)
+
+    async def get_block_headers(self, start_height: int, end_height: int, concurrency: int = 4,
+                                chunk_size: int = None, progress=None, raw: bool = False) -> list:
+        """Get the block headers of a height range, see XcashDaemonRpc.get_block_headers
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            concurrency (int, optional): Number of chunks fetched at the same time. Defaults to 4.
+            chunk_size (int, optional): Number of headers per call. Defaults to automatic sizing.
+            progress (callable, optional): Called with a RangeChunk after every fetched chunk. Defaults to None.
+            raw (bool, optional): Return dicts when the client returns models. Defaults to False.
+
+        Raises:
+            RpcError: The daemon returned an error for one of the chunks
+
+        Returns:
+            list: block headers in height order, BlockHeader records when the client returns models
+        """
+        if not chunk_size:
+            chunk_size = self.headers_chunk_size(start_height, end_height, concurrency)
+
+        chunks = split_range(start_height, end_height, chunk_size)
+        headers = self.fetch_chunks(chunks=chunks, fetch=self.__headers_chunk, concurrency=concurrency,
+                                    progress=progress)
+        return await self.converted(headers, BlockHeader.from_list, raw)
+
+    async def get_block_headers_array(self, start_height: int, end_height: int,
+                                      fields: tuple = DEFAULT_HEADER_FIELDS, layout: str = "struct",
+                                      concurrency: int = 4, chunk_size: int = None, progress=None):
+        """Get the numeric fields of the block headers of a height range as NumPy arrays,
+        see XcashDaemonRpc.get_block_headers_array
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            fields (tuple, optional): Header fields, see columns.HEADER_FIELDS. Defaults to DEFAULT_HEADER_FIELDS.
+            layout (str, optional): "struct" or "columns". Defaults to "struct".
+            concurrency (int, optional): Number of chunks fetched at the same time. Defaults to 4.
+            chunk_size (int, optional): Number of headers per call. Defaults to automatic sizing.
+            progress (callable, optional): Called with a RangeChunk after every fetched chunk. Defaults to None.
+
+        Raises:
+            ImportError: numpy is not installed
+            InvalidArgument: Unknown field or layout
+            RpcError: The daemon returned an error for one of the chunks
+
+        Returns:
+            numpy.ndarray, dict: one row per height in height order, empty when end_height < start_height
+        """
+        buffer = header_buffer(max(end_height - start_height + 1, 0), fields=fields, layout=layout)
+        if not chunk_size:
+            chunk_size = self.headers_chunk_size(start_height, end_height, concurrency)
+
+        async def fill(chunk):
+            fill_headers(buffer, chunk[0] - start_height, await self.__headers_chunk(chunk))
+            return []
+
+        chunks = split_range(start_height, end_height, chunk_size)
+        await self.fetch_chunks(chunks=chunks, fetch=fill, concurrency=concurrency, progress=progress)
+        return buffer
+
+    async def iter_blocks(self, start_height: int, end_height: int, window: int = 50, read_ahead: int = 2):
+        """Iterate over the blocks of a height range, see XcashDaemonRpc.iter_blocks
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            window (int, optional): Number of blocks fetched per batch. Defaults to 50.
+            read_ahead (int, optional): Number of windows prefetched ahead of the consumer. Defaults to 2.
+
+        Yields:
+            dict: get_block response, in height order
+        """
+        chunks = split_range(start_height, end_height, window)
+        async for block in self.iter_chunks(chunks=chunks, fetch=self.__blocks_chunk, read_ahead=read_ahead):
+            yield block
+
+    async def iter_headers(self, start_height: int, end_height: int, window: int = MAX_HEADERS_CHUNK,
+                           read_ahead: int = 2, raw: bool = False):
+        """Iterate over the block headers of a height range, see XcashDaemonRpc.iter_headers
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            window (int, optional): Number of headers per get_block_headers_range call. Defaults to 1000.
+            read_ahead (int, optional): Number of windows prefetched ahead of the consumer. Defaults to 2.
+            raw (bool, optional): Yield dicts when the client returns models. Defaults to False.
+
+        Raises:
+            RpcError: The daemon returned an error for one of the windows
+
+        Yields:
+            dict: block header, in height order, a BlockHeader when the client returns models
+        """
+        chunks = split_range(start_height, end_height, window)
+        headers = self.iter_chunks(chunks=chunks, fetch=self.__headers_chunk, read_ahead=read_ahead)
+        async for header in self.converted_items(headers, BlockHeader.from_dict, raw):
+            yield header
+
+    async def __blocks_chunk(self, chunk: tuple) -> list:
+        """Get the blocks of a chunk as one batch
+
+        Args:
+            chunk (tuple): (start_height, end_height)
+
+        Returns:
+            list: get_block response per height
+        """
+        return await self.call_many([("get_block", {"height": height}) for height in range(chunk[0], chunk[1] + 1)])
+
+    async def __headers_chunk(self, chunk: tuple) -> list:
+        """Get the block headers of a chunk
+
+        Args:
+            chunk (tuple): (start_height, end_height)
+
+        Raises:
+            RpcError: The daemon returned an error
+
+        Returns:
+            list: block headers
+        """
+        data = await self.get_block_headers_range(start_height=chunk[0], end_height=chunk[1], raw=True)
+        if "result" not in data:
+            raise RpcError(f"Headers {chunk[0]}-{chunk[1]} failed: {data.get('error')}")
+        return data["result"]["headers"]
+
+    @staticmethod
+    async def fetch_chunks(chunks: list, fetch, concurrency: int, progress=None) -> list:
+        """Fetch chunks concurrently and join their items in chunk order
+
+        Args:
+            chunks (list): (start_height, end_height) tuple per chunk
+            fetch (callable): Coroutine function returning the list of items of a chunk
+            concurrency (int): Number of chunks fetched at the same time
+            progress (callable, optional): Called with a RangeChunk after every fetched chunk. Defaults to None.
+
+        Returns:
+            list: items of all chunks
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        completed = 0
+
+        async def timed(chunk):
+            nonlocal completed
+            async with semaphore:
+                started = time.monotonic()
+                items = await fetch(chunk)
+            completed += 1
+            if progress:
+                progress(RangeChunk(chunk[0], chunk[1], time.monotonic() - started, completed, len(chunks)))
+            return items
+
+        results = await asyncio.gather(*[timed(chunk) for chunk in chunks])
+        return [item for items in results for item in items]
+
+    @staticmethod
+    async def iter_chunks(chunks: list, fetch, read_ahead: int):
+        """Yield the items of chunks in order while the following chunks are fetched in the background
+
+        Args:
+            chunks (list): (start_height, end_height) tuple per chunk
+            fetch (callable): Coroutine function returning the list of items of a chunk
+            read_ahead (int): Number of chunks fetched ahead of the consumer
+
+        Yields:
+            items of all chunks
+        """
+        chunks = iter(chunks)
+        pending = deque(asyncio.ensure_future(fetch(chunk)) for chunk in islice(chunks, max(1, read_ahead)))
+        try:
+            while pending:
+                items = await pending.popleft()
+                for chunk in islice(chunks, 1):
+                    pending.append(asyncio.ensure_future(fetch(chunk)))
+                for item in items:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+class AsyncXcashWalletRpc(AsyncXcashRpc, XcashWalletRpc):
+    """Async Xcash wallet rpc wrapper, see XcashWalletRpc for the available methods.
+    """
+
+    async def learn_integrated_prefix(self) -> int:
+        """Make one integrated address with the wallet and register its network prefix, see
+        XcashWalletRpc.learn_integrated_prefix
+
+        Returns:
+            int: integrated address prefix
+        """
+        return learn_prefix(result(await self.make_integrated_address())["integrated_address"], INTEGRATED)
+
+    async def learn_subaddress_prefix(self, account_index: int = 0) -> int:
+        """Read one subaddress of the wallet and register its network prefix, see
+        XcashWalletRpc.learn_subaddress_prefix
+
+        Returns:
+            int: subaddress prefix
+        """
+        return learn_subaddress(result(await self.get_address(account_index=account_index)))
+
+
+class AsyncBlockchainExplorer(AsyncHelpers, BlockchainExplorer):
+    """Async blockchain explorer wrapper, see BlockchainExplorer for the available methods.
+    """
+    pass
+
+
+class AsyncDelegatesExplorer(AsyncHelpers, DelegatesExplorer):
+    """Async delegates explorer wrapper, see DelegatesExplorer for the available methods.
+    """
+    pass
+
+
+class AsyncSharedDelegate(AsyncHelpers, SharedDelegate):
+    """Async shared delegate wrapper, see SharedDelegate for the available methods.
+    """
+
+    def connect(self, delegate_url: str) -> str:
+        """Format the delegate url. Reachability is not probed as it would block the
+        event loop, connection errors surface on the first call instead.
+
+        Args:
+            delegate_url (str): Provided url when initiating a class
+
+        Returns:
+            str: url
+        """
+        return self.check_url(delegate_url=delegate_url)
+
+    async def get_delegate_voter_list(self, wallet_address: str = None, raw: bool = False) -> list:
+        """Get a list of all delegates staking towards the shared delegate.
+
+        Args:
+            wallet_address (str, optional): The public address of the shared delegate. Defaults to None.
+            raw (bool, optional): Return dicts when the client returns models. Defaults to False.
+
+        Returns:
+            list: Delegates staking to shared delegate, Voter records when the client returns models
+        """
+        if not wallet_address:
+            wallet_address = (await self.get_delegate_website_statistic())["public_address"]
+        return await SharedDelegate.get_delegate_voter_list(self, wallet_address=wallet_address, raw=raw)
+
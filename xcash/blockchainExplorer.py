@@ -1,14 +1,23 @@
-from xcash.helpers import Helpers
+import requests
+from xcash.helpers import DEFAULT_TIMEOUT, Helpers
 
 
 class BlockchainExplorer(Helpers):
-    def __init__(self, base_api: str = "https://explorer.xcash.foundation/"):
+    def __init__(self, base_api: str = "https://explorer.xcash.foundation/", session: requests.Session = None,
+                 cache=None, ttl_cache=None, retry=None, timeout=DEFAULT_TIMEOUT, hedge=None):
         """
         Delegate constructor
 
         :delegate_url: Address of the delegate
+        :session: Own session instead of the shared connection pool
+        :cache: BlockCache for block data
+        :ttl_cache: TTLCache for blockchain statistics
+        :retry: RetryPolicy for failed calls
+        :timeout: (connect, read) timeout in seconds
+        :hedge: HedgePolicy for slow calls
         """
-        Helpers.__init__(self)
+        Helpers.__init__(self, session=session, cache=cache, ttl_cache=ttl_cache, retry=retry, timeout=timeout,
+                         hedge=hedge)
 
         self.base_api = base_api
         self.generates_supply = "getgeneratedsupply"
@@ -33,8 +42,7 @@ class BlockchainExplorer(Helpers):
         Returns:
             dict: blockchain data
         """
-        response = self.get_response(url=self.base_api + self.blockchain_data)
-        return self.process_response(response)
+        return self.ttl_cached("get_blockchain_data", self.base_api + self.blockchain_data)
 
     def get_circulating_supply(self) -> int:
         """Get current XCASH circulating supply
@@ -42,8 +50,7 @@ class BlockchainExplorer(Helpers):
         Returns:
             int: circulating supply amount
         """
-        response = self.get_response(url=self.base_api + self.circulating_supply)
-        return self.process_response(response)
+        return self.ttl_cached("get_circulating_supply", self.base_api + self.circulating_supply)
 
     def get_current_block_height(self) -> dict:
         """Get current block height of the XCASH chain 
@@ -51,8 +58,7 @@ class BlockchainExplorer(Helpers):
         Returns:
             dict: block height count/number
         """
-        response = self.get_response(url=self.base_api + self.block_height)
-        return self.process_response(response)
+        return self.ttl_cached("get_current_block_height", self.base_api + self.block_height)
 
     def get_generated_supply(self) -> int:
         """Get generated supply
@@ -60,8 +66,7 @@ class BlockchainExplorer(Helpers):
         Returns:
             int: Total generated supply amount
         """
-        response = self.get_response(url=self.base_api + self.generates_supply)
-        return self.process_response(response)
+        return self.ttl_cached("get_generated_supply", self.base_api + self.generates_supply)
 
     def get_last_block_data(self) -> dict:
         """Get last block details
@@ -69,8 +74,7 @@ class BlockchainExplorer(Helpers):
         Returns:
             dict: details on the last block
         """
-        response = self.get_response(url=self.base_api + self.last_block_data)
-        return self.process_response(response)
+        return self.get_data(url=self.base_api + self.last_block_data)
 
     def get_block_data(self, block_data) -> dict:
         """Get block data based on provided argument.
@@ -81,8 +85,25 @@ class BlockchainExplorer(Helpers):
         Returns:
             dict: block details 
         """
-        response = self.get_response(url=self.base_api + self.last_block_data + self.block_data + f'{block_data}')
-        return self.process_response(response)
+        key = ("get_block_data", f'{block_data}')
+        url = self.base_api + self.last_block_data + self.block_data + f'{block_data}'
+        return self.cached(key, lambda: self.get_data(url=url),
+                           lambda result: self.__store_block_data(key, block_data, result))
+
+    def __store_block_data(self, key: tuple, block_data, data: dict) -> None:
+        """Cache block data looked up by hash, or by height once the block is final. The tip is
+        known to the cache when it is shared with a daemon client or subscribed to a ChainFollower.
+
+        Args:
+            key (tuple): cache key
+            block_data (str, int): Block hash or block height
+            data (dict): block details
+        """
+        height = f'{block_data}'
+        if not height.isdigit():
+            self.cache.put(key, data)
+        elif self.cache.is_final(int(height)):
+            self.cache.put(key, data, height=int(height))
 
     def get_transaction_data(self, tx_hash: str) -> dict:
         """Get the transaction data based on specified transaction hash
@@ -94,8 +115,7 @@ class BlockchainExplorer(Helpers):
             dict: data on transaction
         """
 
-        response = self.get_response(url=self.base_api + self.transaction_data + self.hash_data + f'{tx_hash}')
-        return self.process_response(response)
+        return self.get_data(url=self.base_api + self.transaction_data + self.hash_data + f'{tx_hash}')
 
     def get_reserve_proof_verification(self, public_address: str, reserve_proof: str, data: str = None) -> dict:
         """Verify reserver proof based on provided arguments
@@ -108,9 +128,7 @@ class BlockchainExplorer(Helpers):
         Returns:
             dict: Three different types of results in regards to reserve proof verification
         """
-        response = self.get_response(
-            url=self.base_api + self.verify_reserve_proof + self.public_address + f'{public_address}' + self.reserve_proof + f"{reserve_proof}" + self.data + f"{data}")
-        return self.process_response(response)
+        return self.get_data(url=self.base_api + self.verify_reserve_proof + self.public_address + f'{public_address}' + self.reserve_proof + f"{reserve_proof}" + self.data + f"{data}")
 
     def generate_integrated_address(self, public_address: str, payment_id: str = None) -> dict:
         """Create integrated address for public address.
@@ -122,9 +140,7 @@ class BlockchainExplorer(Helpers):
         Returns:
             dict: details on integrated address
         """
-        response = self.get_response(
-            url=self.base_api + self.integrated_address + self.public_address + f'{public_address}' + self.payment_id + f'{payment_id}')
-        return self.process_response(response)
+        return self.get_data(url=self.base_api + self.integrated_address + self.public_address + f'{public_address}' + self.payment_id + f'{payment_id}')
 
     # Setters 
     def set_base_api(self, base_api: str) -> None:
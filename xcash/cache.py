@@ -0,0 +1,289 @@
+import threading
+import time
+from collections import OrderedDict
+
+from xcash.codec import get_codec
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_CONFIRMATIONS = 10
+DEFAULT_TTL = 60.0
+
+
+class BlockCache():
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, confirmations: int = DEFAULT_CONFIRMATIONS):
+        """LRU cache for immutable chain data. Entries looked up by hash are always kept, entries
+        looked up by height only once the block is confirmations deep.
+
+        Args:
+            max_bytes (int, optional): Memory bound, least recently used entries are evicted
+                                       beyond it. Defaults to 64 MiB.
+            confirmations (int, optional): Depth after which a block is treated as final. Defaults to 10.
+        """
+        self.max_bytes = max_bytes
+        self.confirmations = confirmations
+        self.tip_height = None
+
+        self.entries = OrderedDict()  # key -> (encoded value, size, height)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """Get a cached value and mark it as recently used
+
+        Args:
+            key (tuple): cache key
+
+        Returns:
+            copy of the cached value or None
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            encoded = entry[0]
+        return get_codec().loads(encoded)
+
+    def put(self, key, value, height: int = None) -> None:
+        """Store a value, evicting the least recently used entries beyond max_bytes. The value is kept
+        JSON encoded, so every get returns a new copy which callers may change.
+
+        Args:
+            key (tuple): cache key
+            value: value to store
+            height (int, optional): Block height for entries which must be dropped on a reorg. Defaults to None.
+        """
+        encoded = get_codec().dumps(value)
+        size = len(encoded)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            self.entries[key] = (encoded, size, height)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted_size, _) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def observe_tip(self, height: int) -> None:
+        """Record a chain height seen in a response
+
+        Args:
+            height (int): height of the chain tip
+        """
+        with self._lock:
+            if self.tip_height is None or height > self.tip_height:
+                self.tip_height = height
+
+    def is_final(self, height: int) -> bool:
+        """Check if a block is deep enough to be cached by height
+
+        Args:
+            height (int): block height
+
+        Returns:
+            bool: True when the block is at least confirmations below the known tip
+        """
+        return self.tip_height is not None and height <= self.tip_height - self.confirmations
+
+    def invalidate_above(self, height: int) -> int:
+        """Drop height bound entries above a height, used when the chain reorganises
+
+        Args:
+            height (int): last height which is still valid
+
+        Returns:
+            int: number of dropped entries
+        """
+        with self._lock:
+            stale = [key for key, entry in self.entries.items() if entry[2] is not None and entry[2] > height]
+            for key in stale:
+                self.size -= self.entries.pop(key)[1]
+            self.tip_height = height
+            return len(stale)
+
+    def on_block(self, block) -> None:
+        """ChainFollower on_block subscriber
+
+        Args:
+            block (NewBlock): new block event
+        """
+        self.observe_tip(block.height)
+
+    def on_rollback(self, rollback) -> None:
+        """ChainFollower on_rollback subscriber
+
+        Args:
+            rollback (Rollback): rollback event
+        """
+        self.invalidate_above(rollback.fork_height)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics
+        """
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Cache statistics for sizing
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, entries, bytes, max_bytes
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "hit_rate": self.hits / lookups if lookups else 0.0,
+                    "evictions": self.evictions,
+                    "entries": len(self.entries),
+                    "bytes": self.size,
+                    "max_bytes": self.max_bytes}
+
+
+class TTLCache():
+    def __init__(self, ttl: float = DEFAULT_TTL, ttls: dict = None):
+        """Time based cache which serves stale values while one background refresh runs.
+
+        Args:
+            ttl (float, optional): Seconds a value stays fresh. Defaults to 60.
+            ttls (dict, optional): Fresh time per endpoint, keyed by method name. Defaults to None.
+        """
+        self.ttl = ttl
+        self.ttls = ttls or dict()
+        self.last_error = None
+
+        self.entries = dict()  # key -> (encoded value, stored_at)
+        self.refreshing = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, key: tuple):
+        """Look up a value
+
+        Args:
+            key (tuple): (url, endpoint method name)
+
+        Returns:
+            tuple: (copy of the value, fresh) or None when nothing is cached
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            fresh = time.monotonic() - entry[1] < self.ttls.get(key[1], self.ttl)
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            encoded = entry[0]
+        return get_codec().loads(encoded), fresh
+
+    def store(self, key: tuple, value) -> None:
+        """Store a fetched value. It is kept JSON encoded, like in BlockCache, so every lookup returns a
+        new copy which callers may change.
+
+        Args:
+            key (tuple): (url, endpoint method name)
+            value: fetched value
+        """
+        encoded = get_codec().dumps(value)
+        with self._lock:
+            self.entries[key] = (encoded, time.monotonic())
+            self.refreshing.discard(key)
+
+    def begin_refresh(self, key: tuple) -> bool:
+        """Claim the refresh of a stale value
+
+        Args:
+            key (tuple): (url, endpoint method name)
+
+        Returns:
+            bool: True if the caller should refresh, False when a refresh already runs
+        """
+        with self._lock:
+            if key in self.refreshing:
+                return False
+            self.refreshing.add(key)
+            return True
+
+    def fail(self, key: tuple, err: Exception) -> None:
+        """Record a failed refresh, the stale value is kept and the next lookup retries
+
+        Args:
+            key (tuple): (url, endpoint method name)
+            err (Exception): raised exception
+        """
+        with self._lock:
+            self.last_error = err
+            self.refreshing.discard(key)
+
+    def get(self, key: tuple, fetch):
+        """Get a value, fetching it on a miss and refreshing it in a background thread when stale
+
+        Args:
+            key (tuple): (url, endpoint method name)
+            fetch (callable): Makes the call
+
+        Returns:
+            copy of the cached value, or the fetched value
+        """
+        entry = self.lookup(key)
+        if entry is None:
+            value = fetch()
+            self.store(key, value)
+            return value
+
+        value, fresh = entry
+        if not fresh and self.begin_refresh(key):
+            threading.Thread(target=self.__refresh, args=(key, fetch), daemon=True).start()
+        return value
+
+    def __refresh(self, key: tuple, fetch) -> None:
+        """Fetch and store a value
+
+        Args:
+            key (tuple): (url, endpoint method name)
+            fetch (callable): Makes the call
+        """
+        try:
+            self.store(key, fetch())
+        except Exception as err:
+            self.fail(key, err)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics
+        """
+        with self._lock:
+            self.entries.clear()
+            self.hits = self.stale_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """Cache statistics
+
+        Returns:
+            dict: hits, stale_hits, misses, entries, refreshing
+        """
+        with self._lock:
+            return {"hits": self.hits,
+                    "stale_hits": self.stale_hits,
+                    "misses": self.misses,
+                    "entries": len(self.entries),
+                    "refreshing": len(self.refreshing)}
@@ -0,0 +1,251 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from xcash.helpers import RpcError
+
+NewBlock = namedtuple("NewBlock", ["height", "hash", "header"])
+Rollback = namedtuple("Rollback", ["fork_height", "removed"])
+
+
+class ChainFollower():
+    def __init__(self, daemon, min_interval: float = 1.0, max_interval: float = 30.0, block_time: float = 300.0,
+                 history: int = 100, on_error=None):
+        """Follow the chain tip of a daemon and notify subscribers about new blocks and reorgs.
+
+        Args:
+            daemon (XcashDaemonRpc): Daemon rpc client used for polling
+            min_interval (float, optional): Shortest time between polls in seconds. Defaults to 1.0.
+            max_interval (float, optional): Longest time between polls in seconds. Defaults to 30.0.
+            block_time (float, optional): Expected block time in seconds until enough blocks were seen
+                                          to measure it. Defaults to 300.0.
+            history (int, optional): Number of recent block hashes kept for reorg detection. Defaults to 100.
+            on_error (callable, optional): Called with exceptions raised while polling in the background
+                                           or by subscribers. Defaults to None.
+        """
+        self.daemon = daemon
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.block_time = block_time
+        self.history = history
+        self.on_error = on_error
+        self.last_error = None
+
+        self.chain = OrderedDict()  # height -> (hash, timestamp)
+        self.subscribers = list()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def tip(self) -> tuple:
+        """Highest block known to the follower
+
+        Returns:
+            tuple: (height, hash) or None before the first poll
+        """
+        if not self.chain:
+            return None
+        height = next(reversed(self.chain))
+        return height, self.chain[height][0]
+
+    def subscribe(self, on_block, on_rollback=None) -> None:
+        """Subscribe to chain events
+
+        Args:
+            on_block (callable): Called with a NewBlock for every block added to the chain
+            on_rollback (callable, optional): Called with a Rollback before the blocks of a new
+                                              branch are announced. Defaults to None.
+        """
+        with self._lock:
+            self.subscribers.append((on_block, on_rollback))
+
+    def unsubscribe(self, on_block) -> None:
+        """Remove a subscription
+
+        Args:
+            on_block (callable): Callback the subscription was made with
+        """
+        with self._lock:
+            self.subscribers = [s for s in self.subscribers if s[0] != on_block]
+
+    def start(self) -> None:
+        """Start polling in a background thread
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.__run, name="xcash-chain-follower", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the background thread
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to finish. Defaults to None.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def next_interval(self) -> float:
+        """Time until the next poll. Polls are spaced out while the next block is not due and
+        run at min_interval once it is.
+
+        Returns:
+            float: seconds
+        """
+        if not self.chain:
+            return self.min_interval
+        timestamp = self.chain[next(reversed(self.chain))][1]
+        remaining = timestamp + self.measured_block_time() - time.time()
+        return min(max(remaining, self.min_interval), self.max_interval)
+
+    def measured_block_time(self) -> float:
+        """Average block time over the kept history
+
+        Returns:
+            float: seconds, block_time while fewer than two blocks are known
+        """
+        if len(self.chain) < 2:
+            return self.block_time
+        first, last = next(iter(self.chain)), next(reversed(self.chain))
+        elapsed = self.chain[last][1] - self.chain[first][1]
+        return elapsed / (last - first) if elapsed > 0 else self.block_time
+
+    def poll(self) -> list:
+        """Check the daemon for a new tip and notify subscribers. The first poll only records the tip.
+
+        Raises:
+            RpcError: The daemon returned an error
+
+        Returns:
+            list: NewBlock and Rollback events in the order they were emitted
+        """
+        with self._lock:
+            header = self.__result(self.daemon.get_last_block_header(raw=True))["block_header"]
+            if not self.chain:
+                self.__add(header)
+                return []
+
+            tip_height, tip_hash = self.tip
+            if header["height"] == tip_height and header["hash"] == tip_hash:
+                return []
+
+            events = list()
+            fork_height = self.__fork_height(header)
+            if fork_height < tip_height:
+                removed = [(height, self.chain.pop(height)[0]) for height in list(self.chain) if height > fork_height]
+                events.append(Rollback(fork_height, removed))
+
+            if header["height"] > fork_height:
+                headers = self.__result(self.daemon.get_block_headers_range(start_height=fork_height + 1,
+                                                                            end_height=header["height"],
+                                                                            raw=True))
+                for new_header in headers["headers"]:
+                    self.__add(new_header)
+                    events.append(NewBlock(new_header["height"], new_header["hash"], new_header))
+
+            subscribers = list(self.subscribers)
+
+        for event in events:
+            self.__notify(subscribers, event)
+        return events
+
+    def __fork_height(self, header: dict) -> int:
+        """Find the highest known block which is still part of the daemon's chain
+
+        Args:
+            header (dict): Header of the daemon's current tip
+
+        Returns:
+            int: height of the last common block
+        """
+        tip_height, tip_hash = self.tip
+        if header["height"] == tip_height + 1 and header.get("prev_hash") == tip_hash:
+            return tip_height
+
+        for height in reversed(list(self.chain)):
+            if height > header["height"]:
+                continue
+            if height == header["height"]:
+                current_hash = header["hash"]
+            else:
+                current = self.__result(self.daemon.get_block_header_by_height(height=height, raw=True))
+                current_hash = current["block_header"]["hash"]
+            if current_hash == self.chain[height][0]:
+                return height
+        return next(iter(self.chain)) - 1
+
+    def __add(self, header: dict) -> None:
+        """Record a block and drop the oldest ones beyond history
+
+        Args:
+            header (dict): block header
+        """
+        self.chain[header["height"]] = (header["hash"], header.get("timestamp", time.time()))
+        while len(self.chain) > self.history:
+            self.chain.popitem(last=False)
+
+    def __notify(self, subscribers: list, event) -> None:
+        """Send an event to the subscribers, a failing subscriber does not stop the others
+
+        Args:
+            subscribers (list): (on_block, on_rollback) tuples
+            event (NewBlock, Rollback): event to send
+        """
+        for on_block, on_rollback in subscribers:
+            callback = on_block if isinstance(event, NewBlock) else on_rollback
+            if callback is None:
+                continue
+            try:
+                callback(event)
+            except Exception as err:
+                self.__error(err)
+
+    def __error(self, err: Exception) -> None:
+        """Record an error and pass it to on_error
+
+        Args:
+            err (Exception): raised exception
+        """
+        self.last_error = err
+        if self.on_error:
+            self.on_error(err)
+
+    def __run(self) -> None:
+        """Poll until stopped, errors are retried after max_interval
+        """
+        while not self._stop.is_set():
+            try:
+                self.poll()
+                interval = self.next_interval()
+            except Exception as err:
+                self.__error(err)
+                interval = self.max_interval
+            self._stop.wait(interval)
+
+    @staticmethod
+    def __result(data: dict) -> dict:
+        """Get the result of a daemon response
+
+        Args:
+            data (dict): daemon response
+
+        Raises:
+            RpcError: The daemon returned an error
+
+        Returns:
+            dict: result
+        """
+        if "result" not in data:
+            raise RpcError(f"Daemon returned an error: {data.get('error')}")
+        return data["result"]
@@ -0,0 +1,117 @@
+import contextvars
+import json
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_raw = contextvars.ContextVar("xcash_raw", default=False)
+
+
+class JsonCodec():
+    """JSON codec based on the standard library
+    """
+    name = "json"
+
+    def dumps(self, obj):
+        """Encode a request body
+
+        Args:
+            obj: data to encode
+
+        Returns:
+            str: JSON text
+        """
+        return json.dumps(obj)
+
+    def loads(self, data):
+        """Decode a response body
+
+        Args:
+            data (bytes, str): JSON document
+
+        Returns:
+            decoded data
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on orjson, several times faster on large responses. Documents orjson rejects,
+    like ones containing NaN, are decoded by the standard library instead.
+    """
+    name = "orjson"
+
+    def dumps(self, obj):
+        """Encode a request body
+
+        Args:
+            obj: data to encode
+
+        Returns:
+            bytes: JSON text
+        """
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        """Decode a response body
+
+        Args:
+            data (bytes, str): JSON document
+
+        Returns:
+            decoded data
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+
+_codec = OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+def get_codec() -> JsonCodec:
+    """Get the codec used by clients which were not given their own
+
+    Returns:
+        JsonCodec: orjson when it is installed, otherwise the standard library
+    """
+    return _codec
+
+
+def set_codec(codec: JsonCodec) -> None:
+    """Replace the shared codec, e.g. with JsonCodec() to turn orjson off or with a wrapper around
+    another JSON library offering dumps and loads
+
+    Args:
+        codec (JsonCodec): codec for all clients which were not given their own
+    """
+    global _codec
+    _codec = codec
+
+
+@contextmanager
+def raw(enabled: bool = True):
+    """Return the undecoded response bytes of the calls made inside the with block, for callers which
+    forward payloads unchanged. Caches are bypassed while raw responses are on.
+
+    Args:
+        enabled (bool, optional): False turns raw responses off inside an outer raw block. Defaults to True.
+    """
+    token = _raw.set(enabled)
+    try:
+        yield
+    finally:
+        _raw.reset(token)
+
+
+def is_raw() -> bool:
+    """Check if raw responses are on
+
+    Returns:
+        bool: True inside a raw block
+    """
+    return _raw.get()
@@ -0,0 +1,83 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from xcash.helpers import InvalidArgument
+
+# numeric block header fields and their array types
+HEADER_FIELDS = {
+    "height": "u8",
+    "timestamp": "u8",
+    "difficulty": "u8",
+    "reward": "u8",
+    "block_size": "u8",
+    "block_weight": "u8",
+    "num_txes": "u4",
+    "major_version": "u1",
+    "minor_version": "u1",
+    "nonce": "u4",
+    "depth": "u8",
+}
+DEFAULT_HEADER_FIELDS = ("height", "timestamp", "difficulty", "reward", "block_size", "num_txes", "major_version")
+LAYOUTS = ("struct", "columns")
+
+
+def header_buffer(count: int, fields: tuple = DEFAULT_HEADER_FIELDS, layout: str = "struct"):
+    """Allocate the arrays for count block headers
+
+    Args:
+        count (int): number of headers
+        fields (tuple, optional): header fields, see HEADER_FIELDS. Defaults to DEFAULT_HEADER_FIELDS.
+        layout (str, optional): "struct" for one structured array, "columns" for one array per field.
+                                Defaults to "struct".
+
+    Raises:
+        ImportError: numpy is not installed
+        InvalidArgument: Unknown field or layout
+
+    Returns:
+        numpy.ndarray, dict: structured array, or dict of field name -> array
+    """
+    if numpy is None:
+        raise ImportError("Columnar exports require numpy. Install it with: pip install xcash[numpy]")
+    unknown = [field for field in fields if field not in HEADER_FIELDS]
+    if unknown:
+        raise InvalidArgument(f"Unknown header fields {unknown}, choose from {list(HEADER_FIELDS)}")
+    if layout not in LAYOUTS:
+        raise InvalidArgument(f"Unknown layout {layout}, choose from {list(LAYOUTS)}")
+
+    if layout == "columns":
+        return dict((field, numpy.zeros(count, dtype=HEADER_FIELDS[field])) for field in fields)
+    return numpy.zeros(count, dtype=[(field, HEADER_FIELDS[field]) for field in fields])
+
+
+def buffer_fields(buffer) -> tuple:
+    """Get the fields of a header buffer
+
+    Args:
+        buffer (numpy.ndarray, dict): buffer from header_buffer
+
+    Returns:
+        tuple: field names
+    """
+    if isinstance(buffer, dict):
+        return tuple(buffer)
+    return buffer.dtype.names
+
+
+def fill_headers(buffer, offset: int, headers: list) -> int:
+    """Copy block headers into a buffer, fields a header lacks stay 0
+
+    Args:
+        buffer (numpy.ndarray, dict): buffer from header_buffer
+        offset (int): row of the first header
+        headers (list): header dicts
+
+    Returns:
+        int: number of rows written
+    """
+    end = offset + len(headers)
+    for field in buffer_fields(buffer):
+        buffer[field][offset:end] = [header.get(field) or 0 for header in headers]
+    return len(headers)
@@ -0,0 +1,79 @@
+import contextvars
+import time
+from contextlib import contextmanager
+
+_deadline = contextvars.ContextVar("xcash_deadline", default=None)
+_timeout = contextvars.ContextVar("xcash_timeout", default=None)
+
+
+class Deadline():
+    def __init__(self, seconds: float):
+        """Time budget for an operation spanning several calls. Inside a with block every call
+        gets at most the remaining time as its timeout, nested deadlines keep the earlier one.
+
+        Args:
+            seconds (float): Seconds the operation may take
+        """
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+        self._token = None
+
+    def __enter__(self):
+        current = _deadline.get()
+        if current is not None and current.expires < self.expires:
+            self._token = _deadline.set(current)
+        else:
+            self._token = _deadline.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _deadline.reset(self._token)
+
+    def remaining(self) -> float:
+        """Time left
+
+        Returns:
+            float: seconds, zero or less once expired
+        """
+        return self.expires - time.monotonic()
+
+    def expired(self) -> bool:
+        """Check if the deadline passed
+
+        Returns:
+            bool: True once no time is left
+        """
+        return self.remaining() <= 0
+
+
+@contextmanager
+def timeout(connect: float = None, read: float = None):
+    """Override the client timeouts for the calls made inside the with block
+
+    Args:
+        connect (float, optional): Seconds to wait for a connection. Defaults to the client setting.
+        read (float, optional): Seconds to wait for response data. Defaults to the client setting.
+    """
+    token = _timeout.set((connect, read))
+    try:
+        yield
+    finally:
+        _timeout.reset(token)
+
+
+def current_deadline() -> Deadline:
+    """Deadline of the running operation
+
+    Returns:
+        Deadline: innermost active deadline or None
+    """
+    return _deadline.get()
+
+
+def current_timeout() -> tuple:
+    """Timeouts set with the timeout context manager
+
+    Returns:
+        tuple: (connect, read) where None keeps the client setting, or None outside a timeout block
+    """
+    return _timeout.get()
@@ -0,0 +1,318 @@
+import threading
+import time
+from collections import namedtuple
+
+from xcash.models import Delegate, as_int
+
+DelegateDiff = namedtuple("DelegateDiff", ["added", "removed", "rank_changes", "vote_changes"])
+RankChange = namedtuple("RankChange", ["delegate_name", "old_rank", "new_rank"])
+VoteChange = namedtuple("VoteChange", ["delegate_name", "old_votes", "new_votes"])
+
+
+def _value(delegate, name: str):
+    """Read a field of a delegate dict or Delegate record
+
+    Args:
+        delegate (dict, Delegate): delegate
+        name (str): field name
+
+    Returns:
+        field value, None when it is missing
+    """
+    if isinstance(delegate, dict):
+        return delegate.get(name)
+    return getattr(delegate, name, None)
+
+
+def _identity(delegate) -> str:
+    return _value(delegate, "public_address") or _value(delegate, "delegate_name")
+
+
+def _votes(delegate) -> int:
+    return as_int(_value(delegate, "total_vote_count")) or 0
+
+
+class DelegateSnapshot():
+    """Delegates at one point in time, ranked by votes and indexed by name, public address and IP
+    """
+    __slots__ = ("delegates", "taken_at", "by_name", "by_address", "by_ip", "ranks")
+
+    def __init__(self, delegates: list, taken_at: float = None):
+        """Build the indexes of a delegate list
+
+        Args:
+            delegates (list): delegate dicts or Delegate records
+            taken_at (float, optional): Time the list was fetched. Defaults to now.
+        """
+        self.delegates = tuple(sorted(delegates, key=lambda delegate: (-_votes(delegate),
+                                                                        _value(delegate, "delegate_name") or "")))
+        self.taken_at = taken_at or time.time()
+        self.by_name = dict()
+        self.by_address = dict()
+        self.by_ip = dict()
+        self.ranks = dict()  # identity -> rank, 1 is the delegate with the most votes
+        for rank, delegate in enumerate(self.delegates, 1):
+            self.by_name[_value(delegate, "delegate_name")] = delegate
+            self.by_address[_value(delegate, "public_address")] = delegate
+            self.by_ip.setdefault(_value(delegate, "IP_address"), []).append(delegate)
+            self.ranks[_identity(delegate)] = rank
+
+    def __len__(self):
+        return len(self.delegates)
+
+    def get(self, key: str):
+        """Find a delegate by name or public address
+
+        Args:
+            key (str): delegate name or public address
+
+        Returns:
+            dict, Delegate: delegate, None when it is not registered
+        """
+        return self.by_name.get(key) or self.by_address.get(key)
+
+    def rank(self, key: str) -> int:
+        """Rank of a delegate by votes
+
+        Args:
+            key (str): delegate name or public address
+
+        Returns:
+            int: rank starting at 1, None when the delegate is not registered
+        """
+        delegate = self.get(key)
+        return None if delegate is None else self.ranks[_identity(delegate)]
+
+    def diff(self, other) -> DelegateDiff:
+        """Compare with a newer snapshot
+
+        Args:
+            other (DelegateSnapshot): newer snapshot
+
+        Returns:
+            DelegateDiff: added and removed delegates, RankChange and VoteChange per delegate in both
+        """
+        old = dict((_identity(delegate), delegate) for delegate in self.delegates)
+        new = dict((_identity(delegate), delegate) for delegate in other.delegates)
+        added = [delegate for identity, delegate in new.items() if identity not in old]
+        removed = [delegate for identity, delegate in old.items() if identity not in new]
+
+        rank_changes = list()
+        vote_changes = list()
+        for identity, delegate in new.items():
+            if identity not in old:
+                continue
+            name = _value(delegate, "delegate_name")
+            if self.ranks[identity] != other.ranks[identity]:
+                rank_changes.append(RankChange(name, self.ranks[identity], other.ranks[identity]))
+            old_votes, new_votes = _votes(old[identity]), _votes(delegate)
+            if old_votes != new_votes:
+                vote_changes.append(VoteChange(name, old_votes, new_votes))
+        return DelegateDiff(added, removed, rank_changes, vote_changes)
+
+
+class DelegateRegistry():
+    def __init__(self, explorer, interval: float = 300.0, on_error=None):
+        """Keep an indexed snapshot of all delegates, refreshed in the background. Reads use the
+        snapshot and never touch the network.
+
+        Args:
+            explorer (DelegatesExplorer): Delegates explorer client
+            interval (float, optional): Seconds between refreshes when no ChainFollower drives them,
+                                        about one block. Defaults to 300.0.
+            on_error (callable, optional): Called with exceptions raised while refreshing in the
+                                           background or by subscribers. Defaults to None.
+        """
+        self.explorer = explorer
+        self.interval = interval
+        self.on_error = on_error
+        self.last_error = None
+
+        self.snapshot = None  # DelegateSnapshot, None before the first refresh
+        self.subscribers = list()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __len__(self):
+        return len(self.snapshot) if self.snapshot else 0
+
+    def get(self, key: str):
+        """Find a delegate by name or public address
+
+        Args:
+            key (str): delegate name or public address
+
+        Returns:
+            dict, Delegate: delegate, None when it is not registered or before the first refresh
+        """
+        return self.snapshot.get(key) if self.snapshot else None
+
+    def by_name(self, delegate_name: str):
+        """Find a delegate by name
+
+        Args:
+            delegate_name (str): delegate name
+
+        Returns:
+            dict, Delegate: delegate, None when it is not registered
+        """
+        return self.snapshot.by_name.get(delegate_name) if self.snapshot else None
+
+    def by_address(self, public_address: str):
+        """Find a delegate by public address
+
+        Args:
+            public_address (str): public address
+
+        Returns:
+            dict, Delegate: delegate, None when it is not registered
+        """
+        return self.snapshot.by_address.get(public_address) if self.snapshot else None
+
+    def by_ip(self, ip_address: str) -> list:
+        """Find the delegates running on an IP address or host name
+
+        Args:
+            ip_address (str): IP address or host name
+
+        Returns:
+            list: delegates
+        """
+        return list(self.snapshot.by_ip.get(ip_address, ())) if self.snapshot else []
+
+    def rank(self, key: str) -> int:
+        """Rank of a delegate by votes
+
+        Args:
+            key (str): delegate name or public address
+
+        Returns:
+            int: rank starting at 1, None when the delegate is not registered
+        """
+        return self.snapshot.rank(key) if self.snapshot else None
+
+    def top(self, count: int) -> list:
+        """Delegates with the most votes
+
+        Args:
+            count (int): number of delegates
+
+        Returns:
+            list: delegates by rank
+        """
+        return list(self.snapshot.delegates[:count]) if self.snapshot else []
+
+    def subscribe(self, on_change) -> None:
+        """Subscribe to changes between snapshots
+
+        Args:
+            on_change (callable): Called with a DelegateDiff after every refresh which changed something
+        """
+        with self._lock:
+            self.subscribers.append(on_change)
+
+    def unsubscribe(self, on_change) -> None:
+        """Remove a subscription
+
+        Args:
+            on_change (callable): Callback the subscription was made with
+        """
+        with self._lock:
+            self.subscribers = [s for s in self.subscribers if s != on_change]
+
+    def refresh(self) -> DelegateDiff:
+        """Fetch all delegates and replace the snapshot, see apply
+
+        Returns:
+            DelegateDiff: changes since the previous snapshot, None on the first refresh
+        """
+        delegates = self.explorer.get_all_delegates(raw=True)
+        return self.apply(delegates)
+
+    def apply(self, delegates: list) -> DelegateDiff:
+        """Replace the snapshot with a get_all_delegates response and notify subscribers of the changes.
+        Async clients fetch the delegates themselves and pass them here.
+
+        Args:
+            delegates (list): delegate dicts of get_all_delegates
+
+        Returns:
+            DelegateDiff: changes since the previous snapshot, None on the first refresh
+        """
+        if self.explorer.models:
+            delegates = Delegate.from_list(delegates)
+        snapshot = DelegateSnapshot(delegates)
+        with self._lock:
+            previous, self.snapshot = self.snapshot, snapshot
+            subscribers = list(self.subscribers)
+        if previous is None:
+            return None
+
+        diff = previous.diff(snapshot)
+        if any(diff):
+            for on_change in subscribers:
+                try:
+                    on_change(diff)
+                except Exception as err:
+                    self.__error(err)
+        return diff
+
+    def on_block(self, block) -> None:
+        """Refresh in the background on the next block, to subscribe to a ChainFollower. Blocks which
+        arrive during a refresh lead to one more refresh.
+
+        Args:
+            block (NewBlock): block event
+        """
+        self._wake.set()
+
+    def start(self) -> None:
+        """Refresh now and then in a background thread
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.__run, name="xcash-delegate-registry", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the background thread
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to finish. Defaults to None.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __error(self, err: Exception) -> None:
+        """Record an error and pass it to on_error
+
+        Args:
+            err (Exception): raised exception
+        """
+        self.last_error = err
+        if self.on_error:
+            self.on_error(err)
+
+    def __run(self) -> None:
+        """Refresh until stopped, after every interval or block
+        """
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.refresh()
+            except Exception as err:
+                self.__error(err)
+            self._wake.wait(self.interval)
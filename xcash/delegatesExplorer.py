@@ -1,10 +1,13 @@
-from xcash.helpers import Helpers
+import requests
+from xcash.helpers import DEFAULT_TIMEOUT, Helpers
+from xcash.models import Delegate, Voter
 from pprint import pprint
 
 
 class DelegatesExplorer(Helpers):
-    def __init__(self, base_url: str = "http://delegates.xcash.foundation/"):
-        super().__init__()
+    def __init__(self, base_url: str = "http://delegates.xcash.foundation/", session: requests.Session = None,
+                 ttl_cache=None, retry=None, timeout=DEFAULT_TIMEOUT, hedge=None):
+        super().__init__(session=session, ttl_cache=ttl_cache, retry=retry, timeout=timeout, hedge=hedge)
         self.base_url = base_url
         self.delegates_website_get_statistics = "delegateswebsitegetstatistics"
         self.get_delegates = "getdelegates"
@@ -21,17 +24,19 @@ class DelegatesExplorer(Helpers):
         Returns:
             dict: general statistics of the DPOPS system
         """
-        response = self.get_response(url=self.base_url + self.delegates_website_get_statistics)
-        return self.process_response(response)
+        return self.ttl_cached("get_delegate_website_statistics",
+                               self.base_url + self.delegates_website_get_statistics)
 
-    def get_all_delegates(self) -> list :
+    def get_all_delegates(self, raw: bool = False) -> list :
         """Get all delegates registered to XCASH DPops system
 
+        Args:
+            raw (bool, optional): Return dicts when the client returns models. Defaults to False.
+
         Returns:
-            list: list of delegates
+            list: list of delegates, Delegate records when the client returns models
         """
-        response = self.get_response(url=self.base_url + self.get_delegates)
-        return self.process_response(response)
+        return self.converted(self.get_data(url=self.base_url + self.get_delegates), Delegate.from_list, raw)
 
     def get_delegate_statistics(self, delegate: str) -> dict:
         """Get general statistics of the delegate
@@ -42,8 +47,7 @@ class DelegatesExplorer(Helpers):
         Returns:
             dict: delegate general statistics
         """
-        response = self.get_response(url=self.base_url + self.delegate_stats + self.param1 + f'{delegate}')
-        return self.process_response(response)
+        return self.get_data(url=self.base_url + self.delegate_stats + self.param1 + f'{delegate}')
 
     def get_delegate_information(self, delegate: str) -> dict:
         """Get delegate information 
@@ -54,20 +58,33 @@ class DelegatesExplorer(Helpers):
         Returns:
             dict: delegate information
         """
-        response = self.get_response(url=self.base_url + self.delegate_info + self.param1 + f'{delegate}')
-        return self.process_response(response)
+        return self.get_data(url=self.base_url + self.delegate_info + self.param1 + f'{delegate}')
 
-    def get_delegate_voter_list(self, delegate: str) -> list:
+    def get_delegate_voter_list(self, delegate: str, raw: bool = False) -> list:
         """Get list of voters for delegate
 
         Args:
             delegate (str): delegate name or address
+            raw (bool, optional): Return dicts when the client returns models. Defaults to False.
+
+        Returns:
+            list: list of voters, Voter records when the client returns models
+        """
+        voters = self.get_data(url=self.base_url + self.delegate_voter_list + self.param1 + f'{delegate}')
+        return self.converted(voters, Voter.from_list, raw)
+
+    def iter_delegate_voter_list(self, delegate: str, raw: bool = False):
+        """Stream the voters of a delegate one at a time while the response arrives
+
+        Args:
+            delegate (str): delegate name or address
+            raw (bool, optional): Yield dicts when the client returns models. Defaults to False.
 
         Returns:
-            list: list of voters
+            generator: voter dicts, Voter records when the client returns models
         """
-        response = self.get_response(url=self.base_url + self.delegate_voter_list + self.param1 + f'{delegate}')
-        return self.process_response(response)
+        voters = self.iter_json(url=self.base_url + self.delegate_voter_list + self.param1 + f'{delegate}')
+        return self.converted_items(voters, Voter.from_dict, raw)
 
     def get_round_statistics(self, block_height: int)-> dict:
         """Get round statistics 
@@ -78,8 +95,7 @@ class DelegatesExplorer(Helpers):
         Returns:
             dict: The complete block that contains all of the reserve bytes
         """
-        response = self.get_response(url=self.base_url + self.round_statistics + self.param1 + f'{block_height}')
-        return self.process_response(response)
+        return self.get_data(url=self.base_url + self.round_statistics + self.param1 + f'{block_height}')
 
     #Setters
     def set_base_url(self, base_url: str) -> None:
@@ -0,0 +1,146 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+
+class HedgePolicy():
+    def __init__(self, percentile: float = 95.0, min_delay: float = 0.05, max_delay: float = 2.0,
+                 max_rate: float = 0.1, window: int = 200, min_samples: int = 20, max_workers: int = 32):
+        """Hedge slow idempotent reads: when a call has not answered within the chosen latency
+        percentile, a duplicate is sent and the first answer wins. With a NodePool the duplicate
+        usually goes to another node, otherwise it uses another pooled connection.
+
+        Args:
+            percentile (float, optional): Latency percentile after which a duplicate is sent. Defaults to 95.
+            min_delay (float, optional): Shortest wait before hedging in seconds. Defaults to 0.05.
+            max_delay (float, optional): Longest wait before hedging in seconds, also used until
+                                         min_samples latencies were seen. Defaults to 2.0.
+            max_rate (float, optional): Maximum share of calls which are hedged. Defaults to 0.1.
+            window (int, optional): Number of recent latencies the percentile is taken from. Defaults to 200.
+            min_samples (int, optional): Latencies needed before the percentile is used. Defaults to 20.
+            max_workers (int, optional): Threads running the calls of sync clients. Defaults to 32.
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_rate = max_rate
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """Time to wait for the first answer before hedging
+
+        Returns:
+            float: seconds, the percentile of the recent latencies within min_delay and max_delay
+        """
+        with self._lock:
+            if len(self.latencies) < self.min_samples:
+                return self.max_delay
+            latencies = sorted(self.latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))
+        return min(max(latencies[index], self.min_delay), self.max_delay)
+
+    def begin_request(self) -> None:
+        """Count a hedgeable call
+        """
+        with self._lock:
+            self.requests += 1
+
+    def begin_hedge(self) -> bool:
+        """Claim a duplicate call
+
+        Returns:
+            bool: False when max_rate of the calls were hedged already
+        """
+        with self._lock:
+            if self.hedged + 1 > self.requests * self.max_rate:
+                return False
+            self.hedged += 1
+            return True
+
+    def record(self, latency: float, hedge_won: bool = False) -> None:
+        """Record the answer of a call
+
+        Args:
+            latency (float): seconds until the answer
+            hedge_won (bool, optional): The duplicate answered first. Defaults to False.
+        """
+        with self._lock:
+            self.latencies.append(latency)
+            if hedge_won:
+                self.hedge_wins += 1
+
+    def run(self, fetch):
+        """Make a call, sending a duplicate when it is slow. The losing call of a sync client can
+        not be interrupted, it finishes in the background and its answer is dropped.
+
+        Args:
+            fetch (callable): Makes the call
+
+        Returns:
+            Data of the first successful answer
+        """
+        self.begin_request()
+        executor = self.executor()
+        started = time.monotonic()
+        primary = executor.submit(contextvars.copy_context().run, fetch)
+        try:
+            data = primary.result(timeout=self.delay())
+        except FutureTimeoutError:
+            pass
+        else:
+            self.record(time.monotonic() - started)
+            return data
+
+        if not self.begin_hedge():
+            data = primary.result()
+            self.record(time.monotonic() - started)
+            return data
+
+        hedge = executor.submit(contextvars.copy_context().run, fetch)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    self.record(time.monotonic() - started, hedge_won=future is hedge)
+                    return future.result()
+        return primary.result()
+
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool running the calls of sync clients, created on first use
+
+        Returns:
+            ThreadPoolExecutor: executor
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="xcash-hedge")
+            return self._executor
+
+    def stats(self) -> dict:
+        """Hedging statistics
+
+        Returns:
+            dict: requests, hedged, hedge_rate, hedge_wins, win_rate (share of hedges answering first), delay
+        """
+        delay = self.delay()
+        with self._lock:
+            return {"requests": self.requests,
+                    "hedged": self.hedged,
+                    "hedge_rate": self.hedged / self.requests if self.requests else 0.0,
+                    "hedge_wins": self.hedge_wins,
+                    "win_rate": self.hedge_wins / self.hedged if self.hedged else 0.0,
+                    "delay": delay}
@@ -1,9 +1,52 @@
 import binascii
 
-import json
+import copy
 import os
+import threading
+import time
 import requests
-from re import match
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from decimal import Decimal, InvalidOperation
+from requests.adapters import HTTPAdapter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from xcash.address import (PAYMENT_ID_SIZE, decode_address, make_integrated_addresses, split_integrated_addresses,
+                           validate_addresses)
+from xcash.codec import get_codec, is_raw
+from xcash.deadline import current_deadline, current_timeout
+from xcash.stream import JsonStream
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_TIMEOUT = (10.0, 120.0)  # (connect, read) seconds
+STREAM_CHUNK_SIZE = 64 * 1024
+DECIMALS = 6
+ATOMIC_UNITS = 10 ** DECIMALS
+MAX_ATOMIC = 2 ** 63 - 1
+_QUANTUM = Decimal(1).scaleb(-DECIMALS)
+
+_pool_config = {"pool_connections": DEFAULT_POOL_CONNECTIONS,
+                "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+                "pool_block": False}
+_session = None
+_session_lock = threading.Lock()
+
+# RPC methods which change state; repeating or merging them could e.g. send a payment twice or drop one
+NON_IDEMPOTENT_METHODS = frozenset([
+    "submit_block", "relay_tx", "flush_txpool", "set_bans",
+    "transfer", "transfer_split", "sign_transfer", "submit_transfer", "sweep_dust", "sweep_all", "sweep_single",
+    "create_address", "label_address", "create_account", "label_account", "tag_accounts", "untag_accounts",
+    "set_account_tag_description", "store", "make_integrated_address", "stop_wallet", "rescan_blockchain",
+    "set_tx_notes", "set_attribute", "import_outputs", "import_key_images", "add_address_book",
+    "delete_address_book", "refresh", "rescan_spent", "create_wallet", "open_wallet", "close_wallet",
+    "change_wallet_password", "prepare_multisig", "make_multisig", "export_multisig_info", "import_multisig_info",
+    "finalize_multisig", "sign_multisig", "submit_multisig",
+    "vote", "delegate_register", "delegate_update", "delegate_remove",
+])
 
 
 class XcashException(Exception):
@@ -55,10 +98,385 @@ class MissingRequiredParama(XcashException):
         pass
 
 
-class Helpers():
-    def __init__(self):
+class InvalidDestinations(XcashException):
+    def __init__(self, message, errors: list = None):
+        self.message = message
+        self.errors = errors or []
+        super().__init__(self.message)
+        pass
+
+
+class InvalidUri(XcashException):
+    def __init__(self, message, errors: list = None):
+        self.message = message
+        self.errors = errors or []
+        super().__init__(self.message)
+        pass
+
+
+class RpcError(XcashException):
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
         pass
 
+
+class RequestError(XcashException):
+    def __init__(self, message, status_code: int = None):
+        self.message = message
+        self.status_code = status_code
+        super().__init__(self.message)
+        pass
+
+
+class CircuitOpenError(XcashException):
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
+        pass
+
+
+class DeadlineExceeded(XcashException):
+    def __init__(self, message):
+        self.message = message
+        super().__init__(self.message)
+        pass
+
+
+def create_session(pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                   pool_block: bool = False) -> requests.Session:
+    """Create a keep-alive HTTP session backed by a connection pool
+
+    Args:
+        pool_connections (int, optional): Number of hosts to keep connection pools for. Defaults to 10.
+        pool_maxsize (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+        pool_block (bool, optional): Block when all connections of a host are in use instead of
+                                     opening a throwaway connection. Defaults to False.
+
+    Returns:
+        requests.Session: session with pooled adapters mounted for http and https
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Get the connection pool shared by all clients which were not given their own session
+
+    Returns:
+        requests.Session: shared session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session(**_pool_config)
+    return _session
+
+
+def configure_session(pool_connections: int = None, pool_maxsize: int = None, pool_block: bool = None) -> None:
+    """Configure the shared connection pool. Existing clients pick up the new pool on their next call.
+
+    Args:
+        pool_connections (int, optional): Number of hosts to keep connection pools for.
+        pool_maxsize (int, optional): Maximum number of connections kept open per host.
+        pool_block (bool, optional): Block when all connections of a host are in use.
+    """
+    global _session
+    with _session_lock:
+        if pool_connections is not None:
+            _pool_config["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            _pool_config["pool_maxsize"] = pool_maxsize
+        if pool_block is not None:
+            _pool_config["pool_block"] = pool_block
+        old_session, _session = _session, None
+    if old_session is not None:
+        old_session.close()
+
+
+def close_session() -> None:
+    """Close all connections of the shared pool. A new pool is created on the next call.
+    """
+    global _session
+    with _session_lock:
+        old_session, _session = _session, None
+    if old_session is not None:
+        old_session.close()
+
+
+def to_atomic(amount) -> int:
+    """Convert an XCASH amount to atomic units exactly. Floats are read as their shortest decimal
+    representation, so 0.29 is 290000 and not 289999.
+
+    Args:
+        amount (int, float, str, Decimal): Xcash amount, at least zero with at most six decimals
+
+    Raises:
+        AmountTypeError: The amount is not a finite number, is negative or has more than six decimals
+
+    Returns:
+        int: amount in atomic units
+    """
+    if isinstance(amount, bool):
+        raise AmountTypeError(f"Amount {amount!r} is not a number")
+    if isinstance(amount, int):
+        if amount < 0:
+            raise AmountTypeError(f"Amount {amount!r} is negative")
+        return amount * ATOMIC_UNITS
+    if isinstance(amount, float) and 0 <= amount < 2 ** 32:
+        # a float with up to six decimals is the float nearest to atomic / 10**6, below 2**32 XCASH
+        # no other six decimal amount is that close
+        atomic = round(amount * ATOMIC_UNITS)
+        if atomic / ATOMIC_UNITS == amount:
+            return atomic
+    try:
+        value = Decimal(repr(amount) if isinstance(amount, float) else amount)
+        if not value.is_finite():
+            raise InvalidOperation
+        exact = value.quantize(_QUANTUM)
+    except (InvalidOperation, TypeError, ValueError):
+        raise AmountTypeError(f"Amount {amount!r} is not a finite number")
+    if value != exact:
+        raise AmountTypeError(f"Amount {amount!r} has more than {DECIMALS} decimals")
+    if value < 0:
+        raise AmountTypeError(f"Amount {amount!r} is negative")
+    return int(exact.scaleb(DECIMALS))
+
+
+def from_atomic(atomic: int) -> Decimal:
+    """Convert atomic units to an exact XCASH amount
+
+    Args:
+        atomic (int): amount in atomic units
+
+    Returns:
+        Decimal: Xcash amount with six decimals
+    """
+    return Decimal(int(atomic)).scaleb(-DECIMALS)
+
+
+def to_atomic_many(amounts):
+    """Convert many XCASH amounts to atomic units exactly, see to_atomic. NumPy integer and float
+    arrays are converted in one vectorized pass into an int64 array, other inputs item by item
+    into a list.
+
+    Args:
+        amounts (list, numpy.ndarray): Xcash amounts
+
+    Raises:
+        AmountTypeError: An amount is not a finite number, is negative, has more than six decimals or
+                         does not fit into int64
+
+    Returns:
+        list, numpy.ndarray: amounts in atomic units
+    """
+    if numpy is not None and isinstance(amounts, numpy.ndarray) and amounts.dtype.kind in "iuf":
+        return _to_atomic_array(amounts)
+    return [to_atomic(amount) for amount in amounts]
+
+
+def from_atomic_many(atomics):
+    """Convert many atomic amounts to XCASH. NumPy arrays are divided in one vectorized pass into a
+    float64 array holding the nearest float of each amount, other inputs give exact Decimals.
+
+    Args:
+        atomics (list, numpy.ndarray): amounts in atomic units
+
+    Returns:
+        list, numpy.ndarray: Xcash amounts
+    """
+    if numpy is not None and isinstance(atomics, numpy.ndarray):
+        return atomics / ATOMIC_UNITS
+    return [from_atomic(atomic) for atomic in atomics]
+
+
+def _to_atomic_array(amounts):
+    """Vectorized to_atomic for NumPy number arrays
+
+    Args:
+        amounts (numpy.ndarray): integer or float Xcash amounts
+
+    Raises:
+        AmountTypeError: An amount is not a finite number, is negative, has more than six decimals
+                         or does not fit into int64
+
+    Returns:
+        numpy.ndarray: int64 atomic amounts
+    """
+    if amounts.size and amounts.min() < 0:
+        raise AmountTypeError(f"Amount {amounts.min().item()!r} is negative")
+    if amounts.dtype.kind in "iu":
+        if amounts.size and amounts.max() > MAX_ATOMIC // ATOMIC_UNITS:
+            raise AmountTypeError("Amounts do not fit into int64 atomic units")
+        return amounts.astype(numpy.int64) * ATOMIC_UNITS
+
+    amounts = amounts.astype(numpy.float64)
+    if not numpy.isfinite(amounts).all():
+        raise AmountTypeError("Amounts must be finite numbers")
+    if amounts.size and amounts.max() * ATOMIC_UNITS >= MAX_ATOMIC:
+        raise AmountTypeError("Amounts do not fit into int64 atomic units")
+
+    # the fast path of to_atomic for all amounts at once, the few it does not settle take the exact path
+    atomics = numpy.rint(amounts * ATOMIC_UNITS)
+    exact = numpy.flatnonzero((atomics / ATOMIC_UNITS != amounts) | (amounts >= 2 ** 32))
+    atomics = atomics.astype(numpy.int64)
+    atomics.flat[exact] = [to_atomic(float(amount)) for amount in amounts.flat[exact]]
+    return atomics
+
+
+class Destinations(list):
+    """Destinations prepared by Helpers.build_destinations, amounts are in atomic units already
+    """
+    pass
+
+
+class SingleFlight():
+    def __init__(self):
+        """Merge concurrent identical calls into one in-flight call
+        """
+        self.calls = dict()
+        self.shared = 0
+        self._lock = threading.Lock()
+
+    def do(self, key: tuple, fetch):
+        """Make a call, or wait for the identical call already in flight and share its result
+
+        Args:
+            key (tuple): identifies identical calls
+            fetch (callable): Makes the call
+
+        Raises:
+            DeadlineExceeded: The caller's deadline passed while waiting for the call in flight
+
+        Returns:
+            Result of the call. Waiting callers get a copy so they can not change each other's data.
+        """
+        with self._lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self.calls[key] = future
+            else:
+                self.shared += 1
+
+        if not leader:
+            deadline = current_deadline()
+            try:
+                result = future.result(timeout=None if deadline is None else max(deadline.remaining(), 0))
+            except FutureTimeout:
+                if future.done():
+                    raise
+                raise DeadlineExceeded(f"Deadline of {deadline.seconds} seconds exceeded")
+            return copy.deepcopy(result)
+
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._lock:
+                del self.calls[key]
+
+
+single_flight = SingleFlight()
+
+
+class Helpers():
+    coalesce = True
+    pool = None
+    codec = None
+    models = False  # return typed records from xcash.models instead of dicts
+    integrated_prefix = None  # network prefix of integrated addresses, None uses the one registered in xcash.address
+
+    def __init__(self, session: requests.Session = None, cache=None, ttl_cache=None, retry=None,
+                 timeout=DEFAULT_TIMEOUT, hedge=None):
+        """Shared client functionality
+
+        Args:
+            session (requests.Session, optional): Session used instead of the shared connection pool.
+                                                  It is closed together with the client. Defaults to None.
+            cache (BlockCache, optional): Cache for immutable chain data. Defaults to None.
+            ttl_cache (TTLCache, optional): Cache for statistics which change once per block. Defaults to None.
+            retry (RetryPolicy, optional): Retry and circuit breaker policy. Defaults to None, no retries.
+            timeout (float, tuple, optional): Seconds to wait for a connection and for response data,
+                                              a single value is used for both. Defaults to (10, 120).
+            hedge (HedgePolicy, optional): Send a duplicate of slow idempotent reads. Defaults to None.
+        """
+        self._session = session
+        self.cache = cache
+        self.ttl_cache = ttl_cache
+        self.retry = retry
+        self.timeout = timeout
+        self.hedge = hedge
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """Session used for the HTTP calls of the client
+
+        Returns:
+            requests.Session: own session if provided, otherwise the shared pool
+        """
+        if self._session is not None:
+            return self._session
+        return get_session()
+
+    @property
+    def json_codec(self):
+        """Codec used to encode requests and decode responses
+
+        Returns:
+            JsonCodec: codec set on the client, otherwise the shared codec
+        """
+        if self.codec is not None:
+            return self.codec
+        return get_codec()
+
+    def close(self) -> None:
+        """Close the session owned by the client. Clients on the shared pool leave it open for
+        the other clients, use close_session() to close it.
+        """
+        if self._session is not None:
+            self._session.close()
+
+    def request_timeout(self) -> tuple:
+        """Timeouts for the next request: the client timeout, overridden by a surrounding
+        timeout() block and capped by the time left of a surrounding Deadline
+
+        Raises:
+            DeadlineExceeded: The deadline of the operation has passed
+
+        Returns:
+            tuple: (connect, read) seconds, None waits forever
+        """
+        connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+        override = current_timeout()
+        if override is not None:
+            connect = connect if override[0] is None else override[0]
+            read = read if override[1] is None else override[1]
+
+        deadline = current_deadline()
+        if deadline is not None:
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                raise DeadlineExceeded(f"Deadline of {deadline.seconds} seconds exceeded")
+            connect = remaining if connect is None else min(connect, remaining)
+            read = remaining if read is None else min(read, remaining)
+        return connect, read
+
     @staticmethod
     def check_url(delegate_url):
         """Check the delegate url
@@ -83,19 +501,47 @@ class Helpers():
         Returns:
             int: Human readable verzion of XCASH amount
         """
-        return atomic / (10 ** 6)
+        return atomic / ATOMIC_UNITS
 
     def get_atomic(self, xcash_amount) -> int:
-        """Convert XCASH to atomic value
+        """Convert XCASH to atomic value exactly, see to_atomic
 
         Args:
-            xcash_amount (float, int): Xcash amount
+            xcash_amount (float, int, str, Decimal): Xcash amount
+
+        Raises:
+            AmountTypeError: The amount is not a finite number, is negative or has more than six decimals
 
         Returns:
             int: xcash amount in atomic reprezentation
         """
 
-        return int(xcash_amount * (10 ** 6))
+        return to_atomic(xcash_amount)
+
+    def get_amounts(self, atomics) -> list:
+        """Convert many atomic amounts to XCASH, see from_atomic_many
+
+        Args:
+            atomics (list, numpy.ndarray): amounts in atomic units
+
+        Returns:
+            list, numpy.ndarray: exact Decimals for lists, float64 for NumPy arrays
+        """
+        return from_atomic_many(atomics)
+
+    def get_atomics(self, xcash_amounts) -> list:
+        """Convert many XCASH amounts to atomic units exactly, see to_atomic_many
+
+        Args:
+            xcash_amounts (list, numpy.ndarray): Xcash amounts
+
+        Raises:
+            AmountTypeError: An amount is not a finite number, is negative or has more than six decimals
+
+        Returns:
+            list, numpy.ndarray: ints for lists, int64 for NumPy arrays
+        """
+        return to_atomic_many(xcash_amounts)
 
     def process_response(self, response):
         """Process response
@@ -104,22 +550,24 @@ class Helpers():
             response (dict): response from the API call
 
         Raises:
-            Exception: HTTP error
-            Exception: Connection Error
+            RequestError: HTTP error
+            RequestError: Connection Error
 
         Returns:
-            dict: Data from the api call
+            dict: Data from the api call, bytes inside a raw() block
         """
         try:
 
             if response.status_code == 200:
-                return response.json()
+                if is_raw():
+                    return response.content
+                return self.json_codec.loads(response.content)
             else:
                 response.raise_for_status()
         except requests.exceptions.HTTPError as err:
-            raise Exception(err)
+            raise RequestError(err, status_code=response.status_code)
         except requests.exceptions.ConnectionError as err:
-            raise Exception(err)
+            raise RequestError(err)
 
     def get_response(self, url: str):
         """Get response from GET request
@@ -130,22 +578,402 @@ class Helpers():
         Returns:
             dict: Response from api call
         """
-        response = requests.get(url=url, headers={'Accept': 'application/json',
-                                                  "Content-Type": "application/json"})
+        response = self.session.get(url=url, headers={'Accept': 'application/json',
+                                                      "Content-Type": "application/json"},
+                                    timeout=self.request_timeout())
+
+        return response
+
+    def post_response(self, url: str, data: str, headers: dict = None):
+        """Get response from POST request
+
+        Args:
+            url (str): string url
+            data (str): request body
+            headers (dict, optional): request headers. Defaults to None.
+
+        Returns:
+            dict: Response from api call
+        """
+        response = self.session.post(url, data=data, headers=headers, timeout=self.request_timeout())
 
         return response
 
-    def get_payment_id(self) -> str:
+    def open_stream(self, url: str, data: str = None, headers: dict = None):
+        """Send a request and return the response before its body is read
+
+        Args:
+            url (str): string url
+            data (str, optional): POST request body, a GET request is sent without it. Defaults to None.
+            headers (dict, optional): request headers. Defaults to None.
+
+        Raises:
+            RequestError: HTTP error
+
+        Returns:
+            requests.Response: streamed response, to be closed by the caller
+        """
+        if data is None:
+            response = self.session.get(url, headers={'Accept': 'application/json',
+                                                      "Content-Type": "application/json"},
+                                        stream=True, timeout=self.request_timeout())
+        else:
+            response = self.session.post(url, data=data, headers=headers, stream=True, timeout=self.request_timeout())
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as err:
+            response.close()
+            raise RequestError(err, status_code=response.status_code)
+        return response
+
+    def iter_json(self, url: str, path: tuple = (), data: str = None, headers: dict = None):
+        """Stream the items of a JSON array in the response, parsing the body while it arrives so
+        memory stays flat for responses of any size. Streams are not coalesced, cached or hedged.
+
+        Args:
+            url (str): string url
+            path (tuple, optional): Object keys leading to the array, "*" matches any key.
+                                    Defaults to (), a top level array.
+            data (str, optional): POST request body, a GET request is sent without it. Defaults to None.
+            headers (dict, optional): request headers. Defaults to None.
+
+        Raises:
+            RpcError: The response holds an error or ended early
+
+        Yields:
+            items of the array
+        """
+        response = self.retried(url, lambda: self.open_stream(url, data=data, headers=headers), idempotent=True)
+        parser = JsonStream(path, codec=self.json_codec, exception=RpcError)
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+            parser.close()
+        finally:
+            response.close()
+
+    def get_data(self, url: str):
+        """Get processed data from GET request. Concurrent identical requests share one call.
+
+        Args:
+            url (str): string url
+
+        Returns:
+            dict: Data from the api call
+        """
+
+        def fetch():
+            response = self.get_response(url=url)
+            return self.process_response(response)
+
+        return self.coalesced(("GET", url), lambda: self.hedged(lambda: self.retried(url, fetch, idempotent=True)))
+
+    def post_data(self, url: str, data: str, headers: dict = None, idempotent: bool = False):
+        """Get processed data from POST request. Concurrent identical idempotent requests share one call.
+
+        Args:
+            url (str): string url
+            data (str): request body
+            headers (dict, optional): request headers. Defaults to None.
+            idempotent (bool, optional): The request can be merged with identical ones. Defaults to False.
+
+        Returns:
+            dict: Data from the api call
+        """
+
+        def fetch(node_url):
+            response = self.post_response(node_url, data=data, headers=headers)
+            return self.process_response(response=response)
+
+        def call():
+            return self.routed(url, lambda node_url: self.retried(node_url, lambda: fetch(node_url), idempotent),
+                               idempotent)
+
+        if not idempotent:
+            return call()
+        return self.coalesced(("POST", url, data), lambda: self.hedged(call))
+
+    def hedged(self, fetch):
+        """Make an idempotent call under the hedge policy, sending a duplicate when it is slow
+
+        Args:
+            fetch (callable): Makes the call
+
+        Returns:
+            dict: Data from the first answer
+        """
+        if self.hedge is None:
+            return fetch()
+        return self.hedge.run(fetch)
+
+    def routed(self, url: str, fetch, idempotent: bool):
+        """Send the call to the healthiest node of the client's NodePool, failing over to the next
+        node when one is unavailable. Calls which change state only fail over when they never
+        reached the node.
+
+        Args:
+            url (str): request url, used as is without a pool
+            fetch (callable): Makes the call to the url it is given
+            idempotent (bool): The call can be repeated safely and spread over nodes
+
+        Raises:
+            RequestError: The pool has no node to send the call to
+
+        Returns:
+            dict: Data from the api call
+        """
+        if self.pool is None:
+            return fetch(url)
+
+        last_error = None
+        for node in self.pool.candidates(read_only=idempotent):
+            self.pool.begin_call(node)
+            started = time.monotonic()
+            try:
+                data = fetch(node.url)
+            except Exception as err:
+                if not self.pool.is_node_failure(err):
+                    self.pool.record_abort(node)
+                    raise
+                self.pool.record_failure(node)
+                if not self.pool.can_fail_over(err, idempotent):
+                    raise
+                last_error = err
+            except BaseException:
+                self.pool.record_abort(node)
+                raise
+            else:
+                self.pool.record_success(node, time.monotonic() - started)
+                return data
+        if last_error is None:
+            raise RequestError("No healthy node in the pool")
+        raise last_error
+
+    def coalesced(self, key: tuple, fetch):
+        """Merge the call with identical calls in flight, unless coalescing is turned off
+
+        Args:
+            key (tuple): identifies identical calls
+            fetch (callable): Makes the call
+
+        Returns:
+            dict: Data from the api call
+        """
+        if not self.coalesce:
+            return fetch()
+        return single_flight.do((*key, is_raw()), fetch)
+
+    def retried(self, url: str, fetch, idempotent: bool):
+        """Make a call under the retry policy. Idempotent calls are repeated with backoff while the
+        retry budget allows it, and calls fail fast while the endpoint's circuit is open.
+
+        Args:
+            url (str): request url
+            fetch (callable): Makes the call
+            idempotent (bool): The call can be repeated safely
+
+        Raises:
+            CircuitOpenError: The endpoint failed repeatedly and is not called
+
+        Returns:
+            dict: Data from the api call
+        """
+        if self.retry is None:
+            return fetch()
+
+        breaker = self.retry.breaker(url)
+        self.retry.budget.deposit()
+        attempt = 1
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit for {url} is open after repeated failures")
+            try:
+                data = fetch()
+            except Exception as err:
+                if self.retry.is_retryable(err):
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if not idempotent or not self.retry.should_retry(err, attempt):
+                    raise
+                delay = self.retry.delay(attempt)
+                if not self.retry_fits_deadline(delay):
+                    raise
+                time.sleep(delay)
+                attempt += 1
+            except BaseException:
+                # cancelled, e.g. the losing call of a hedge: it neither succeeded nor failed
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return data
+
+    @staticmethod
+    def retry_fits_deadline(delay: float) -> bool:
+        """Check if a retry after delay can still finish within the surrounding Deadline
+
+        Args:
+            delay (float): seconds before the retry
+
+        Returns:
+            bool: False when the deadline passes before the retry is sent
+        """
+        deadline = current_deadline()
+        return deadline is None or deadline.remaining() > delay
+
+    def cached(self, key: tuple, fetch, store=None):
+        """Serve a call from the client cache, fetching and storing it on a miss
+
+        Args:
+            key (tuple): cache key
+            fetch (callable): Makes the call
+            store (callable, optional): Stores the fetched data in the cache. Defaults to None.
+
+        Returns:
+            dict: Data from the cache or the api call
+        """
+        if self.cache is None or is_raw():
+            return fetch()
+        data = self.cache.get(key)
+        if data is None:
+            data = fetch()
+            if store:
+                store(data)
+        return data
+
+    def ttl_cached(self, method: str, url: str):
+        """Serve a GET call from the TTL cache, stale values are returned while they are refreshed. Entries
+        are keyed by url and method, so clients of different endpoints can share a cache.
+
+        Args:
+            method (str): endpoint method name
+            url (str): request url
+
+        Returns:
+            dict: Data from the cache or the api call
+        """
+        if self.ttl_cache is None or is_raw():
+            return self.get_data(url=url)
+        return self.ttl_cache.get((url, method), lambda: self.get_data(url=url))
+
+    def converted(self, data, convert, raw: bool = False):
+        """Convert api data to typed records when the client returns models
+
+        Args:
+            data: Data from the api call
+            convert (callable): Builds the records from the data
+            raw (bool, optional): Keep the data as it is. Defaults to False.
+
+        Returns:
+            Records, or the data unchanged for raw calls, raw responses and clients without models
+        """
+        if raw or not self.models or is_raw():
+            return data
+        return convert(data)
+
+    def converted_items(self, items, convert, raw: bool = False):
+        """Convert streamed api items to typed records when the client returns models
+
+        Args:
+            items (iterable): Items of the api call
+            convert (callable): Builds a record from one item
+            raw (bool, optional): Keep the items as they are. Defaults to False.
+
+        Returns:
+            iterable: records, or the items unchanged
+        """
+        if raw or not self.models or is_raw():
+            return items
+        return map(convert, items)
+
+    def get_payment_id(self, size: int = 32) -> str:
         """Create payment ID for wallet
 
+        Args:
+            size (int, optional): Bytes of the id, integrated addresses carry 8 byte ids. Defaults to 32.
+
         Returns:
             str: random payment id
         """
 
-        random_32_bytes = os.urandom(32)
-        payment_id = "".join(map(chr, binascii.hexlify(random_32_bytes)))
+        random_bytes = os.urandom(size)
+        payment_id = "".join(map(chr, binascii.hexlify(random_bytes)))
         return payment_id
 
+    def local_integrated_address(self, standard_address: str, payment_id: str = None) -> dict:
+        """Make an integrated address in process, without the wallet's make_integrated_address
+
+        Args:
+            standard_address (str): Standard public address
+            payment_id (str, optional): 16 characters hex encoded. Defaults to random.
+
+        Raises:
+            InvalidArgument: Invalid address or payment id, or the integrated prefix is not known
+
+        Returns:
+            dict: integrated_address, payment_id
+        """
+        return self.local_integrated_addresses(standard_address, payment_ids=[payment_id] if payment_id else None,
+                                               count=1)[0]
+
+    def local_integrated_addresses(self, standard_address: str, count: int = None, payment_ids: list = None) -> list:
+        """Make many integrated addresses of one standard address in process
+
+        Args:
+            standard_address (str): Standard public address
+            count (int, optional): Number of addresses with random payment ids. Defaults to None.
+            payment_ids (list, optional): 16 characters hex encoded each, used instead of random ids.
+                                          Defaults to None.
+
+        Raises:
+            InvalidArgument: Invalid address or payment id, or the integrated prefix is not known
+
+        Returns:
+            list: dict with integrated_address and payment_id per payment id
+        """
+        if payment_ids is None:
+            if count is None:
+                raise MissingRequiredParameter("Pass count or payment_ids")
+            payment_ids = [self.get_payment_id(PAYMENT_ID_SIZE) for _ in range(count)]
+        try:
+            addresses = make_integrated_addresses(standard_address, payment_ids, prefix=self.integrated_prefix)
+        except ValueError as err:
+            raise InvalidArgument(str(err))
+        return [{"integrated_address": address, "payment_id": payment_id}
+                for address, payment_id in zip(addresses, payment_ids)]
+
+    def local_split_integrated_address(self, integrated_address: str) -> dict:
+        """Split an integrated address in process, without the wallet's split_integrated_address
+
+        Args:
+            integrated_address (str): Integrated address
+
+        Raises:
+            InvalidArgument: The address is not a valid integrated address
+
+        Returns:
+            dict: is_subaddress, payment_id, standard_address
+        """
+        return self.local_split_integrated_addresses([integrated_address])[0]
+
+    def local_split_integrated_addresses(self, integrated_addresses) -> list:
+        """Split many integrated addresses in process, with the checksums verified together
+
+        Args:
+            integrated_addresses (iterable): Integrated addresses
+
+        Raises:
+            InvalidArgument: An address is not a valid integrated address
+
+        Returns:
+            list: dict with is_subaddress, payment_id and standard_address per address
+        """
+        try:
+            return split_integrated_addresses(integrated_addresses)
+        except ValueError as err:
+            raise InvalidArgument(str(err))
+
     def check_function_params(self, allowed_keys, kwargs):
         for k, v in kwargs.items():
             if k not in allowed_keys:
@@ -181,14 +1009,17 @@ class Helpers():
         Returns:
             list: List of ready to send destinations formatted for RPC.
         """
+        if isinstance(destinations, Destinations):
+            return list(destinations)
+
         allowed = ("address", "amount")
 
         new_transfers = list()
         for d in destinations:
             formated_destination = dict(((k.lower(), v) for k, v in d.items()))
             if all(key in formated_destination for key in allowed):
-                if not isinstance(formated_destination.get("amount"), (int, float)):
-                    raise AmountTypeError("Amount needs to be either integer or float.")
+                if not isinstance(formated_destination.get("amount"), (int, float, Decimal)):
+                    raise AmountTypeError("Amount needs to be either integer, float or Decimal.")
                 else:
                     formated_destination["amount"] = self.get_atomic(formated_destination.get("amount"))
                 if not isinstance(formated_destination.get("address"), str):
@@ -200,9 +1031,90 @@ class Helpers():
                 raise MissingRequiredParama(f"One of the required params is missing. Required are {required}")
         return new_transfers
 
+    def build_destinations(self, rows, merge: bool = True) -> list:
+        """Prepare the destinations of a mass payout in one pass. Addresses are validated together,
+        amounts converted to atomic units exactly and payments to the same address merged. Every
+        invalid row is reported at once, including amounts which are not positive or have more than six decimals.
+
+        Args:
+            rows (iterable): {"address": "XCA...", "amount": 1.5} dicts, keys in any case, or (address, amount) pairs
+            merge (bool, optional): Sum the amounts of rows sharing an address. Defaults to True.
+
+        Raises:
+            InvalidDestinations: Rows are invalid, errors lists (row index, message) for each of them
+
+        Returns:
+            Destinations: {"address", "amount"} dicts in atomic units, in the order addresses first appear.
+                          Pass them to transfer or transfer_split as they are.
+        """
+        parsed = list()
+        errors = list()
+        for index, row in enumerate(rows):
+            if isinstance(row, dict):
+                address, amount = row.get("address"), row.get("amount")
+                if address is None or amount is None:
+                    lowered = dict((str(key).lower(), value) for key, value in row.items())
+                    address, amount = lowered.get("address"), lowered.get("amount")
+            else:
+                try:
+                    address, amount = row
+                except (TypeError, ValueError):
+                    errors.append((index, "Row is neither a dict nor an (address, amount) pair"))
+                    continue
+
+            if address is None or amount is None:
+                errors.append((index, "Row requires address & amount"))
+                continue
+            if not isinstance(address, str):
+                errors.append((index, f"Address {address!r} is not a string"))
+                continue
+            try:
+                atomic = to_atomic(amount)
+            except AmountTypeError as err:
+                errors.append((index, err.message))
+                continue
+            if atomic <= 0:
+                errors.append((index, f"Amount {amount!r} is not positive"))
+                continue
+            parsed.append((index, address, atomic))
+
+        distinct = list(dict.fromkeys(address for _, address, _ in parsed))
+        infos = dict(zip(distinct, self.validate_addresses(distinct)))
+        amounts = dict()
+        destinations = Destinations()
+        for index, address, atomic in parsed:
+            if not infos[address].valid:
+                errors.append((index, f"Invalid address {address!r}: {infos[address].error}"))
+                continue
+            if not merge:
+                destinations.append({"address": address, "amount": atomic})
+            elif address in amounts:
+                amounts[address]["amount"] += atomic
+            else:
+                amounts[address] = {"address": address, "amount": atomic}
+                destinations.append(amounts[address])
+
+        if errors:
+            errors.sort()
+            raise InvalidDestinations(f"{len(errors)} invalid destination rows, first: row {errors[0][0]} "
+                                      f"{errors[0][1]}", errors=errors)
+        return destinations
+
     def validate_address(self, address: str) -> bool:
-        """Xcash address to verify
+        """Xcash address to verify locally, see address.decode_address
         Args:
-            address (str): Public address to be verified for length and
+            address (str): Public address to be verified for base58, network prefix and checksum
+        """
+        return isinstance(address, str) and decode_address(address).valid
+
+    def validate_addresses(self, addresses, processes: int = None) -> list:
+        """Verify many addresses locally, see address.validate_addresses
+
+        Args:
+            addresses (iterable): Public addresses
+            processes (int, optional): Decode across a pool of this many processes. Defaults to None.
+
+        Returns:
+            list: AddressInfo per address with valid, type and error
         """
-        return match(r'^XCA[A-Za-z0-9]{95}$|^XCB[A-Za-z0-9]{107}', address) is not None
+        return validate_addresses(addresses, processes=processes)
@@ -0,0 +1,185 @@
+import sys
+from decimal import Decimal, InvalidOperation
+
+from xcash.helpers import RpcError
+
+TRANSFER_TYPES = ("in", "out", "pending", "failed", "pool")
+
+
+def as_int(value):
+    """Convert an amount or counter to int, numbers sent as strings included
+
+    Args:
+        value: int, float or numeric string
+
+    Returns:
+        int: value, truncated when it has a fraction. Values which are not numbers are returned unchanged.
+    """
+    if isinstance(value, int) or value is None:
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(Decimal(value))
+        except (InvalidOperation, TypeError, ValueError):
+            return value
+
+
+def interned(value):
+    """Intern a string which repeats across records, like an address or a delegate name
+
+    Args:
+        value: string
+
+    Returns:
+        str: the one shared copy of the string
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def unchanged(value):
+    return value
+
+
+def result(data: dict) -> dict:
+    """Get the result of a JSON-RPC response
+
+    Args:
+        data (dict): rpc response
+
+    Raises:
+        RpcError: The rpc returned an error
+
+    Returns:
+        dict: result
+    """
+    if "result" not in data:
+        raise RpcError(f"Rpc returned an error: {data.get('error')}")
+    return data["result"]
+
+
+def result_items(data: dict, *keys) -> list:
+    """Get the lists of a JSON-RPC result, the rpc leaves out empty lists
+
+    Args:
+        data (dict): rpc response
+        keys (str): keys of the lists
+
+    Raises:
+        RpcError: The rpc returned an error
+
+    Returns:
+        list: items of all lists in the order of keys
+    """
+    items = list()
+    for key in keys:
+        items.extend(result(data).get(key) or [])
+    return items
+
+
+class Model():
+    """Compact record of an api result. Known fields are stored in slots, amounts as ints and
+    repeated strings interned; fields the model does not know are kept in extra.
+    """
+    __slots__ = ("extra",)
+    fields = ()  # (name, converter) per slot
+    aliases = {}  # api key -> field name, for apis naming the same field differently
+
+    def __init__(self, **kwargs):
+        for name, convert in self.fields:
+            value = kwargs.pop(name, None)
+            setattr(self, name, None if value is None else convert(value))
+        self.extra = kwargs or None
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Build a record from an api dict
+
+        Args:
+            data (dict): api data
+
+        Returns:
+            Model: record
+        """
+        values = dict()
+        for key, value in data.items():
+            values[cls.aliases.get(key, key)] = value
+        return cls(**values)
+
+    @classmethod
+    def from_list(cls, items: list) -> list:
+        """Build records from a list of api dicts
+
+        Args:
+            items (list): api data
+
+        Returns:
+            list: records
+        """
+        return [cls.from_dict(item) for item in items]
+
+    def to_dict(self) -> dict:
+        """Convert the record back to a dict, with the model's field names
+
+        Returns:
+            dict: fields which are set, and the extra fields
+        """
+        data = dict((name, getattr(self, name)) for name, _ in self.fields if getattr(self, name) is not None)
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        shown = ", ".join(f"{name}={getattr(self, name)!r}" for name, _ in self.fields[:3])
+        return f"{type(self).__name__}({shown})"
+
+
+class BlockHeader(Model):
+    fields = (("height", as_int), ("hash", str), ("timestamp", as_int), ("prev_hash", str),
+              ("major_version", as_int), ("minor_version", as_int), ("nonce", as_int), ("depth", as_int),
+              ("difficulty", as_int), ("cumulative_difficulty", as_int), ("reward", as_int),
+              ("block_size", as_int), ("block_weight", as_int), ("num_txes", as_int), ("orphan_status", bool),
+              ("miner_tx_hash", str), ("pow_hash", str))
+    __slots__ = tuple(name for name, _ in fields)
+
+
+class Transfer(Model):
+    fields = (("txid", str), ("type", interned), ("amount", as_int), ("fee", as_int), ("height", as_int),
+              ("timestamp", as_int), ("address", interned), ("payment_id", interned),
+              ("confirmations", as_int), ("unlock_time", as_int), ("locked", bool), ("subaddr_index", unchanged),
+              ("note", str), ("double_spend_seen", bool), ("destinations", unchanged), ("global_index", as_int),
+              ("key_image", str), ("spent", bool), ("frozen", bool), ("unlocked", bool))
+    __slots__ = tuple(name for name, _ in fields)
+    aliases = {"tx_hash": "txid", "block_height": "height"}
+
+
+class Delegate(Model):
+    fields = (("delegate_name", interned), ("public_address", interned), ("total_vote_count", as_int),
+              ("IP_address", interned), ("delegate_fee", unchanged), ("online_status", unchanged),
+              ("shared_delegate_status", unchanged), ("block_verifier_score", as_int),
+              ("block_verifier_total_rounds", as_int), ("block_verifier_online_total_rounds", as_int),
+              ("block_verifier_online_percentage", unchanged), ("block_producer_total_rounds", as_int),
+              ("block_producer_block_heights", unchanged), ("about", str), ("website", str), ("team", str),
+              ("server_specs", str))
+    __slots__ = tuple(name for name, _ in fields)
+
+
+class Voter(Model):
+    fields = (("public_address", interned), ("delegate", interned), ("amount", as_int), ("reserve_proof", str))
+    __slots__ = tuple(name for name, _ in fields)
+    aliases = {"public_address_created_reserve_proof": "public_address", "public_address_voted_for": "delegate",
+               "total": "amount"}
+
+
+class Payment(Model):
+    fields = (("payment_id", interned), ("tx_hash", str), ("amount", as_int), ("block_height", as_int),
+              ("unlock_time", as_int), ("address", interned), ("subaddr_index", unchanged),
+              ("date_and_time", unchanged), ("tx_key", str))
+    __slots__ = tuple(name for name, _ in fields)
+    aliases = {"public_address": "address", "total": "amount"}
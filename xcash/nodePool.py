@@ -0,0 +1,281 @@
+import random
+import threading
+import time
+
+import requests
+
+from xcash.helpers import CircuitOpenError, InvalidArgument, RequestError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from urllib3.exceptions import NewConnectionError
+except ImportError:
+    NewConnectionError = None
+
+
+class Node():
+    def __init__(self, url: str):
+        """Health record of one daemon
+
+        Args:
+            url (str): Daemon rpc url
+        """
+        self.url = url
+        self.latency = None
+        self.error_rate = 0.0
+        self.height = None
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_failure = 0.0
+
+    def __repr__(self):
+        return f"Node({self.url!r})"
+
+
+class NodePool():
+    def __init__(self, urls: list, smoothing: float = 0.2, max_lag: int = 2, failure_threshold: int = 3,
+                 cooldown: float = 10.0, refresh_interval: float = 30.0, spread: bool = True):
+        """Route calls over several daemons by health. A node's health comes from its rolling average
+        latency, its error rate and how far its height lags the best known tip. Read-only calls are
+        spread over the healthy nodes, calls which change state go to the healthiest one.
+
+        Args:
+            urls (list): Daemon rpc urls
+            smoothing (float, optional): Weight of the newest sample in the rolling averages. Defaults to 0.2.
+            max_lag (int, optional): Blocks a node may lag the best tip and still be healthy. Defaults to 2.
+            failure_threshold (int, optional): Consecutive failures after which a node is only used as
+                                               a last resort until cooldown passed. Defaults to 3.
+            cooldown (float, optional): Seconds a failing node is avoided. Defaults to 10.0.
+            refresh_interval (float, optional): Seconds between node height checks. Defaults to 30.0.
+            spread (bool, optional): Spread read-only calls over the healthy nodes. Defaults to True.
+        """
+        if not urls:
+            raise InvalidArgument("NodePool needs at least one url")
+        self.nodes = [Node(url) for url in urls]
+        self.smoothing = smoothing
+        self.max_lag = max_lag
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.refresh_interval = refresh_interval
+        self.spread = spread
+        self.failovers = 0
+
+        self._refreshed = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def best_height(self) -> int:
+        """Highest height reported by any node
+
+        Returns:
+            int: height or None before the first refresh
+        """
+        heights = [node.height for node in self.nodes if node.height is not None]
+        return max(heights) if heights else None
+
+    def is_healthy(self, node: Node) -> bool:
+        """Check if a node is in sync and not failing
+
+        Args:
+            node (Node): pool node
+
+        Returns:
+            bool: False while the node lags more than max_lag blocks or is cooling down after failures
+        """
+        best = self.best_height
+        if best is not None and (node.height is None or best - node.height > self.max_lag):
+            return False
+        if node.consecutive_failures >= self.failure_threshold:
+            return time.monotonic() - node.last_failure >= self.cooldown
+        return True
+
+    def score(self, node: Node) -> float:
+        """Expected cost of sending a call to a node, lower is better
+
+        Args:
+            node (Node): pool node
+
+        Returns:
+            float: latency weighted by load and error rate, zero for nodes without samples
+        """
+        latency = node.latency or 0.0
+        return latency * (1 + node.in_flight) * (1 + 10 * node.error_rate)
+
+    def candidates(self, read_only: bool = True) -> list:
+        """Nodes in the order a call should try them
+
+        Args:
+            read_only (bool, optional): The call does not change state and can go to any healthy node.
+                                        Defaults to True.
+
+        Returns:
+            list: healthy nodes by score, then the others. For spread read-only calls the first node
+                  is the better of two random healthy nodes.
+        """
+        with self._lock:
+            healthy = sorted((node for node in self.nodes if self.is_healthy(node)), key=self.score)
+            others = sorted((node for node in self.nodes if node not in healthy),
+                            key=lambda node: (node.consecutive_failures, self.score(node)))
+            if read_only and self.spread and len(healthy) > 1:
+                first = min(random.sample(healthy, 2), key=self.score)
+                healthy.remove(first)
+                healthy.insert(0, first)
+            return healthy + others
+
+    def begin_call(self, node: Node) -> None:
+        """Record a call sent to a node
+
+        Args:
+            node (Node): pool node
+        """
+        with self._lock:
+            node.in_flight += 1
+            node.calls += 1
+
+    def record_success(self, node: Node, elapsed: float) -> None:
+        """Record an answered call
+
+        Args:
+            node (Node): pool node
+            elapsed (float): seconds the call took
+        """
+        with self._lock:
+            node.in_flight -= 1
+            node.latency = elapsed if node.latency is None else \
+                node.latency + self.smoothing * (elapsed - node.latency)
+            node.error_rate -= self.smoothing * node.error_rate
+            node.consecutive_failures = 0
+
+    def record_failure(self, node: Node) -> None:
+        """Record a failed call
+
+        Args:
+            node (Node): pool node
+        """
+        with self._lock:
+            node.in_flight -= 1
+            node.error_rate += self.smoothing * (1 - node.error_rate)
+            node.failures += 1
+            node.consecutive_failures += 1
+            node.last_failure = time.monotonic()
+
+    def record_abort(self, node: Node) -> None:
+        """Record a call which ended with an error the node is not responsible for
+
+        Args:
+            node (Node): pool node
+        """
+        with self._lock:
+            node.in_flight -= 1
+
+    def observe_height(self, node: Node, height: int) -> None:
+        """Record the height a node reported
+
+        Args:
+            node (Node): pool node
+            height (int): node's chain height
+        """
+        with self._lock:
+            node.height = height
+
+    def begin_refresh(self) -> bool:
+        """Claim the periodic height check
+
+        Returns:
+            bool: True if the caller should check the node heights now
+        """
+        with self._lock:
+            if self._refreshing:
+                return False
+            if self._refreshed is not None and time.monotonic() - self._refreshed < self.refresh_interval:
+                return False
+            self._refreshing = True
+            return True
+
+    def end_refresh(self) -> None:
+        """Mark the height check as finished
+        """
+        with self._lock:
+            self._refreshing = False
+            self._refreshed = time.monotonic()
+
+    @staticmethod
+    def is_node_failure(err: Exception) -> bool:
+        """Check if an error means the node is unavailable, as opposed to a bad call
+
+        Args:
+            err (Exception): raised exception
+
+        Returns:
+            bool: True for connection errors, timeouts, open circuits and 429 or 5xx responses
+        """
+        if isinstance(err, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, CircuitOpenError)):
+            return True
+        if isinstance(err, RequestError):
+            return err.status_code is None or err.status_code == 429 or err.status_code >= 500
+        return False
+
+    @staticmethod
+    def is_unsent(err: Exception) -> bool:
+        """Check if a call failed before it reached the node, so a call which changes state can go
+        to another node without running twice
+
+        Args:
+            err (Exception): raised exception
+
+        Returns:
+            bool: True when no connection was made or the node's circuit was open
+        """
+        if isinstance(err, (requests.exceptions.ConnectTimeout, CircuitOpenError)):
+            return True
+        if isinstance(err, requests.exceptions.ConnectionError) and err.args and NewConnectionError is not None:
+            return isinstance(getattr(err.args[0], "reason", None), NewConnectionError)
+        if isinstance(err, RequestError) and aiohttp is not None:
+            return isinstance(err.message, aiohttp.ClientConnectorError)
+        return False
+
+    def can_fail_over(self, err: Exception, read_only: bool) -> bool:
+        """Decide if a failed call is sent to the next node
+
+        Args:
+            err (Exception): raised exception
+            read_only (bool): The call does not change state
+
+        Returns:
+            bool: True for node failures of read-only calls and for calls which never reached the node
+        """
+        if not self.is_node_failure(err):
+            return False
+        if read_only or self.is_unsent(err):
+            with self._lock:
+                self.failovers += 1
+            return True
+        return False
+
+    def stats(self) -> list:
+        """Health of every node
+
+        Returns:
+            list: dict per node with url, healthy, latency, error_rate, height, lag, in_flight, calls, failures
+        """
+        best = self.best_height
+        with self._lock:
+            return [{"url": node.url,
+                     "healthy": self.is_healthy(node),
+                     "latency": node.latency,
+                     "error_rate": node.error_rate,
+                     "height": node.height,
+                     "lag": best - node.height if best is not None and node.height is not None else None,
+                     "in_flight": node.in_flight,
+                     "calls": node.calls,
+                     "failures": node.failures} for node in self.nodes]
@@ -0,0 +1,306 @@
+import threading
+from collections import namedtuple
+
+from xcash.models import as_int, result
+
+PaymentEvent = namedtuple("PaymentEvent", ["kind", "payment_id", "payment", "confirmations"])
+
+SEEN = "seen"  # the payment was mined, it has fewer confirmations than required
+CONFIRMED = "confirmed"  # the payment reached the required confirmations
+REMOVED = "removed"  # the block of an unconfirmed payment was rolled back
+
+
+def payment_key(payment: dict) -> tuple:
+    """Identify a payment, one transaction can pay several subaddresses with one payment id
+
+    Args:
+        payment (dict): payment of get_bulk_payments
+
+    Returns:
+        tuple: (tx_hash, subaddress index)
+    """
+    index = payment.get("subaddr_index") or {}
+    return payment.get("tx_hash"), index.get("major", 0), index.get("minor", 0)
+
+
+class PaymentWatcher():
+    def __init__(self, wallet, confirmations: int = 10, chunk_size: int = 1000, start_height: int = 0,
+                 interval: float = 30.0, on_error=None):
+        """Watch a large set of payment ids for incoming payments. Every poll asks the wallet only for
+        the blocks which are new or not yet deep enough, with get_bulk_payments in chunks of ids.
+        Payments are indexed by payment id, so paid and received lookups do not touch the wallet.
+
+        Args:
+            wallet (XcashWalletRpc): Wallet rpc client
+            confirmations (int, optional): Confirmations after which a payment is confirmed. Defaults to 10.
+            chunk_size (int, optional): Payment ids per get_bulk_payments call. Defaults to 1000.
+            start_height (int, optional): Height the cursor starts at. Defaults to 0.
+            interval (float, optional): Seconds between polls in the background. Defaults to 30.0.
+            on_error (callable, optional): Called with exceptions raised while polling in the background
+                                           or by subscribers. Defaults to None.
+        """
+        self.wallet = wallet
+        self.confirmations = confirmations
+        self.chunk_size = chunk_size
+        self.interval = interval
+        self.on_error = on_error
+        self.last_error = None
+
+        self.height = start_height  # wallet height at the last poll
+        self.open = set()  # watched payment ids
+        self.backfill = dict()  # min block height -> payment ids added since the last poll
+        self.requested = dict()  # backfill of the last requests(), dropped once apply succeeds
+        self.payments = dict()  # payment id -> {payment key -> payment}
+        self.confirmed = dict()  # payment id -> confirmed amount
+        self.unconfirmed = dict()  # payment id -> {payment key -> payment} below the required confirmations
+        self.subscribers = list()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def watch(self, payment_ids, since: int = None) -> None:
+        """Add payment ids to the watched set
+
+        Args:
+            payment_ids (iterable): payment ids, 16 or 64 hex characters
+            since (int, optional): Block height after which earlier payments to the ids are looked up
+                                   on the next poll. Defaults to None, only payments from now on.
+        """
+        with self._lock:
+            payment_ids = set(payment_ids)
+            self.open.update(payment_ids)
+            if since is not None and since < self.window_start():
+                self.backfill.setdefault(since, set()).update(payment_ids)
+
+    def unwatch(self, payment_ids, forget: bool = False) -> None:
+        """Remove payment ids from the watched set
+
+        Args:
+            payment_ids (iterable): payment ids
+            forget (bool, optional): Also drop their payments from the index. Defaults to False.
+        """
+        with self._lock:
+            for payment_id in payment_ids:
+                self.open.discard(payment_id)
+                self.unconfirmed.pop(payment_id, None)
+                if forget:
+                    self.payments.pop(payment_id, None)
+                    self.confirmed.pop(payment_id, None)
+
+    def subscribe(self, on_payment) -> None:
+        """Subscribe to payment events
+
+        Args:
+            on_payment (callable): Called with a PaymentEvent for every seen, confirmed or removed payment
+        """
+        with self._lock:
+            self.subscribers.append(on_payment)
+
+    def unsubscribe(self, on_payment) -> None:
+        """Remove a subscription
+
+        Args:
+            on_payment (callable): Callback the subscription was made with
+        """
+        with self._lock:
+            self.subscribers = [s for s in self.subscribers if s != on_payment]
+
+    def is_paid(self, payment_id: str, amount: int = 1) -> bool:
+        """Check whether a payment id received an amount in confirmed payments
+
+        Args:
+            payment_id (str): payment id
+            amount (int, optional): amount due in atomic units. Defaults to 1, any payment.
+
+        Returns:
+            bool: paid
+        """
+        return self.confirmed.get(payment_id, 0) >= amount
+
+    def received(self, payment_id: str, confirmed: bool = True) -> int:
+        """Amount received by a payment id
+
+        Args:
+            payment_id (str): payment id
+            confirmed (bool, optional): Only count confirmed payments. Defaults to True.
+
+        Returns:
+            int: amount in atomic units
+        """
+        if confirmed:
+            return self.confirmed.get(payment_id, 0)
+        return sum(as_int(payment["amount"]) for payment in self.payments.get(payment_id, {}).values())
+
+    def payments_of(self, payment_id: str) -> list:
+        """Payments received by a payment id
+
+        Args:
+            payment_id (str): payment id
+
+        Returns:
+            list: payment dicts, confirmed and unconfirmed
+        """
+        return list(self.payments.get(payment_id, {}).values())
+
+    def window_start(self) -> int:
+        """Height above which payments are fetched on every poll, lower payments are confirmed
+
+        Returns:
+            int: height, exclusive
+        """
+        return max(self.height - self.confirmations, 0)
+
+    def requests(self) -> list:
+        """Arguments of the get_bulk_payments calls for the next poll, pass the responses to apply.
+        The ids added with since stay in the backfill until apply succeeds, so a failed poll
+        requests them again.
+
+        Returns:
+            list: (payment_ids, min_block_height) per call
+        """
+        with self._lock:
+            self.requested = dict((since, set(payment_ids)) for since, payment_ids in self.backfill.items())
+            groups = [(sorted(self.open), self.window_start())]
+            groups.extend((sorted(payment_ids & self.open), since) for since, payment_ids in self.requested.items())
+        return [(payment_ids[start:start + self.chunk_size], min_block_height)
+                for payment_ids, min_block_height in groups
+                for start in range(0, len(payment_ids), self.chunk_size)]
+
+    def poll(self) -> list:
+        """Fetch the payments above the cursor and notify subscribers, see apply
+
+        Raises:
+            RpcError: The wallet returned an error
+
+        Returns:
+            list: PaymentEvent per seen, confirmed or removed payment
+        """
+        height = result(self.wallet.get_wallet_height())["height"]
+        responses = [self.wallet.get_bulk_payments(payment_ids=payment_ids, min_block_height=min_block_height,
+                                                   raw=True)
+                     for payment_ids, min_block_height in self.requests()]
+        return self.apply(height, responses)
+
+    def apply(self, height: int, responses: list) -> list:
+        """Index the payments of get_bulk_payments responses, made with requests(), move the cursor and
+        notify subscribers. Async clients fetch the height and payments themselves and pass them here.
+
+        Args:
+            height (int): wallet height read before the payments were fetched
+            responses (list): get_bulk_payments responses
+
+        Raises:
+            RpcError: The wallet returned an error
+
+        Returns:
+            list: PaymentEvent per seen, confirmed or removed payment
+        """
+        fetched = dict()
+        for data in responses:
+            for payment in result(data).get("payments") or []:
+                fetched[(payment.get("payment_id"), payment_key(payment))] = payment
+
+        with self._lock:
+            window_start = self.window_start()
+            events = list()
+            for (payment_id, key), payment in fetched.items():
+                if payment_id not in self.open:
+                    continue
+                confirmations = height - as_int(payment.get("block_height") or 0)
+                known = self.payments.setdefault(payment_id, {}).get(key)
+                waiting = self.unconfirmed.get(payment_id, {})
+                if known is not None and key not in waiting:
+                    continue
+                self.payments[payment_id][key] = payment
+                if confirmations >= self.confirmations:
+                    waiting.pop(key, None)
+                    self.confirmed[payment_id] = self.confirmed.get(payment_id, 0) + as_int(payment["amount"])
+                    events.append(PaymentEvent(CONFIRMED, payment_id, payment, confirmations))
+                else:
+                    self.unconfirmed.setdefault(payment_id, {})[key] = payment
+                    if known is None:
+                        events.append(PaymentEvent(SEEN, payment_id, payment, confirmations))
+
+            for payment_id, waiting in list(self.unconfirmed.items()):
+                for key, payment in list(waiting.items()):
+                    if (payment_id, key) not in fetched and as_int(payment.get("block_height") or 0) > window_start:
+                        del waiting[key]
+                        del self.payments[payment_id][key]
+                        events.append(PaymentEvent(REMOVED, payment_id, payment, 0))
+                if not waiting:
+                    del self.unconfirmed[payment_id]
+
+            self.height = max(height, self.height)
+            # ids watched while the poll ran stay for the next one
+            for since, payment_ids in self.requested.items():
+                remaining = self.backfill.get(since, set()) - payment_ids
+                if remaining:
+                    self.backfill[since] = remaining
+                else:
+                    self.backfill.pop(since, None)
+            self.requested = dict()
+            subscribers = list(self.subscribers)
+
+        for event in events:
+            self.__notify(subscribers, event)
+        return events
+
+    def start(self) -> None:
+        """Start polling in a background thread
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.__run, name="xcash-payment-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        """Stop the background thread
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread to finish. Defaults to None.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __notify(self, subscribers: list, event: PaymentEvent) -> None:
+        """Send an event to the subscribers, a failing subscriber does not stop the others
+
+        Args:
+            subscribers (list): callbacks
+            event (PaymentEvent): event to send
+        """
+        for on_payment in subscribers:
+            try:
+                on_payment(event)
+            except Exception as err:
+                self.__error(err)
+
+    def __error(self, err: Exception) -> None:
+        """Record an error and pass it to on_error
+
+        Args:
+            err (Exception): raised exception
+        """
+        self.last_error = err
+        if self.on_error:
+            self.on_error(err)
+
+    def __run(self) -> None:
+        """Poll until stopped
+        """
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as err:
+                self.__error(err)
+            self._stop.wait(self.interval)
@@ -0,0 +1,196 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class RetryBudget():
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, max_tokens: float = 100.0):
+        """Token bucket which limits retries to a share of the requests, so retries can not
+        multiply the load on a struggling node.
+
+        Args:
+            ratio (float, optional): Retries allowed per request. Defaults to 0.1.
+            min_per_second (float, optional): Retries allowed per second regardless of traffic. Defaults to 1.0.
+            max_tokens (float, optional): Maximum number of saved up retries. Defaults to 100.0.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.exhausted = 0
+        self._refilled = time.monotonic()
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record a request
+        """
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry from the budget
+
+        Returns:
+            bool: True if the retry is allowed
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.max_tokens, self.tokens + (now - self._refilled) * self.min_per_second)
+            self._refilled = now
+            if self.tokens < 1:
+                self.exhausted += 1
+                return False
+            self.tokens -= 1
+            return True
+
+
+default_budget = RetryBudget()
+
+
+class CircuitBreaker():
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Fail fast while an endpoint is down. The circuit opens after failure_threshold
+        consecutive failures and lets one trial call through after reset_timeout.
+
+        Args:
+            failure_threshold (int, optional): Consecutive failures which open the circuit. Defaults to 5.
+            reset_timeout (float, optional): Seconds before a trial call is allowed. Defaults to 30.0.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.rejected = 0
+        self._opened = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check if a call may go out
+
+        Returns:
+            bool: False while the circuit is open
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a call reached the endpoint
+        """
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def release(self) -> None:
+        """Give back the trial call of a half open circuit when the call was cancelled before it
+        succeeded or failed, so the next call is let through as the trial
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold or when a trial call failed
+        """
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened = time.monotonic()
+
+
+class RetryPolicy():
+    def __init__(self, attempts: int = 3, backoff: float = 0.2, max_backoff: float = 5.0,
+                 budget: RetryBudget = default_budget, retry_statuses: tuple = RETRY_STATUSES,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Retry failed idempotent calls with exponential backoff and full jitter, and keep a
+        circuit breaker per endpoint. Calls which change state are never retried.
+
+        Args:
+            attempts (int, optional): Maximum number of attempts per call. Defaults to 3.
+            backoff (float, optional): Base delay in seconds, doubled every attempt. Defaults to 0.2.
+            max_backoff (float, optional): Maximum delay in seconds. Defaults to 5.0.
+            budget (RetryBudget, optional): Budget the retries are taken from. Defaults to the global budget.
+            retry_statuses (tuple, optional): HTTP statuses which are retried. Defaults to 429, 502, 503, 504.
+            failure_threshold (int, optional): Consecutive failures which open an endpoint's circuit. Defaults to 5.
+            reset_timeout (float, optional): Seconds an open circuit fails fast. Defaults to 30.0.
+        """
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.budget = budget
+        self.retry_statuses = retry_statuses
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers = dict()
+        self._lock = threading.Lock()
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """Circuit breaker of the endpoint serving a url
+
+        Args:
+            url (str): request url
+
+        Returns:
+            CircuitBreaker: breaker shared by all urls of the same scheme, host and port
+        """
+        parts = urlsplit(url)
+        endpoint = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            breaker = self.breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self.breakers[endpoint] = breaker
+            return breaker
+
+    def is_retryable(self, err: Exception) -> bool:
+        """Check if an error is caused by the endpoint being unavailable
+
+        Args:
+            err (Exception): raised exception
+
+        Returns:
+            bool: True for connection errors, timeouts and retry_statuses
+        """
+        if isinstance(err, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        if not hasattr(err, "status_code"):
+            return False
+        return err.status_code is None or err.status_code in self.retry_statuses
+
+    def should_retry(self, err: Exception, attempt: int) -> bool:
+        """Decide if a failed attempt of an idempotent call is repeated
+
+        Args:
+            err (Exception): raised exception
+            attempt (int): number of the failed attempt, starting at 1
+
+        Returns:
+            bool: True if the call should be repeated
+        """
+        return attempt < self.attempts and self.is_retryable(err) and self.budget.withdraw()
+
+    def delay(self, attempt: int) -> float:
+        """Delay before the next attempt
+
+        Args:
+            attempt (int): number of the failed attempt, starting at 1
+
+        Returns:
+            float: seconds
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
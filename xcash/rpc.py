@@ -1,18 +1,206 @@
+import contextvars
 import requests
-import json
-from xcash.helpers import Helpers
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import count, islice
+from xcash.address import INTEGRATED, learn_prefix, learn_subaddress
+from xcash.codec import raw
+from xcash.columns import DEFAULT_HEADER_FIELDS, fill_headers, header_buffer
+from xcash.helpers import DEFAULT_TIMEOUT, NON_IDEMPOTENT_METHODS, Helpers, RpcError
+from xcash.models import TRANSFER_TYPES, BlockHeader, Payment, Transfer, result, result_items
+from xcash.nodePool import NodePool
+from xcash.uri import URI_FIELDS, URI_SCHEME, make_uri, make_uris, parse_uri, parse_uris
 
+RPC_INTERNAL_ERROR = -32603
+MAX_HEADERS_CHUNK = 1000
 
-class XcashDaemonRpc(Helpers):
-    def __init__(self, rpc_url: str = "http://localhost:18281/json_rpc"):
+RangeChunk = namedtuple("RangeChunk", ["start_height", "end_height", "elapsed", "completed", "total"])
+
+
+def split_range(start_height: int, end_height: int, chunk_size: int) -> list:
+    """Split an inclusive height range into chunks
+
+    Args:
+        start_height (int): First height of the range
+        end_height (int): Last height of the range
+        chunk_size (int): Maximum number of heights per chunk
+
+    Returns:
+        list: (start_height, end_height) tuple per chunk
+    """
+    return [(start, min(start + chunk_size - 1, end_height))
+            for start in range(start_height, end_height + 1, chunk_size)]
+
+
+class RpcBatch():
+    def __init__(self, rpc):
+        """Collect JSON-RPC calls and send them in a single POST when leaving the with block.
+
+        Args:
+            rpc (XcashRpc): Rpc client the batch is sent with
+        """
+        self.rpc = rpc
+        self.calls = list()
+        self.results = None
+
+    def add(self, method: str, params=None) -> int:
+        """Add a call to the batch
+
+        Args:
+            method (str): Supported method by the RPC
+            params (dict, list, optional): Additional params to be sent through. Defaults to None.
+
+        Returns:
+            int: index of the call result in results
+        """
+        self.calls.append((method, params))
+        return len(self.calls) - 1
+
+    def execute(self) -> list:
+        """Send the collected calls
+
+        Returns:
+            list: response per call, in the order calls were added
+        """
+        self.results = self.rpc.call_many(self.calls)
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.execute()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.results = await self.rpc.call_many(self.calls)
+
+
+class XcashRpc(Helpers):
+    """Functionality shared by the JSON-RPC clients
+    """
+    _rpc_ids = count(1)
+
+    def check_nodes(self) -> None:
+        """Refresh the health of the pool nodes, clients without a NodePool have nothing to check
+        """
+        pass
+
+    def build_batch(self, calls: list) -> list:
+        """Build JSON-RPC envelopes with unique ids
+
+        Args:
+            calls (list): method names or (method, params) tuples
+
+        Returns:
+            list: envelopes ready to be sent
+        """
+        envelopes = list()
+        for call in calls:
+            method, params = (call, None) if isinstance(call, str) else call
+            envelope = {"jsonrpc": "2.0", "id": str(next(self._rpc_ids)), "method": method}
+            if params:
+                envelope["params"] = params
+            envelopes.append(envelope)
+        return envelopes
+
+    @staticmethod
+    def batch_error(envelope: dict, message: str) -> dict:
+        """Error envelope for a batch item which did not get a response
+
+        Args:
+            envelope (dict): Envelope of the batch item
+            message (str): Error message
+
+        Returns:
+            dict: JSON-RPC error response
+        """
+        return {"jsonrpc": "2.0", "id": envelope["id"],
+                "error": {"code": RPC_INTERNAL_ERROR, "message": message}}
+
+    def match_batch(self, envelopes: list, data) -> list:
+        """Match batch responses back to their calls by id
+
+        Args:
+            envelopes (list): Sent envelopes
+            data (list): Batch response from the RPC
+
+        Returns:
+            list: response per envelope, in the order of envelopes
+        """
+        responses = dict((item.get("id"), item) for item in data if isinstance(item, dict))
+        return [responses.get(e["id"]) or self.batch_error(e, "No response for batch item") for e in envelopes]
+
+    def call_many(self, calls: list) -> list:
+        """Send several calls as one JSON-RPC 2.0 batch. Errors of single calls are returned in
+        their response and do not fail the rest of the batch. RPC servers which do not support
+        batches answer with a single envelope, the calls are then sent one by one.
+
+        Args:
+            calls (list): method names or (method, params) tuples
+
+        Returns:
+            list: response per call, in the order of calls
+        """
+        envelopes = self.build_batch(calls)
+        if not envelopes:
+            return []
+
+        idempotent = not any(e["method"] in NON_IDEMPOTENT_METHODS for e in envelopes)
+        codec = self.json_codec
+        self.check_nodes()
+        with raw(False):
+            data = self.post_data(self.rpc_url, data=codec.dumps(envelopes), headers=self.headers,
+                                  idempotent=idempotent)
+            if isinstance(data, list):
+                return self.match_batch(envelopes, data)
+
+            results = list()
+            for envelope in envelopes:
+                try:
+                    results.append(self.post_data(self.rpc_url, data=codec.dumps(envelope), headers=self.headers,
+                                                  idempotent=envelope["method"] not in NON_IDEMPOTENT_METHODS))
+                except Exception as err:
+                    results.append(self.batch_error(envelope, str(err)))
+            return results
+
+    def batch(self) -> RpcBatch:
+        """Collect calls in a with block and send them as one batch on exit
+
+        Returns:
+            RpcBatch: batch, results are available in batch.results after the block
+        """
+        return RpcBatch(self)
+
+
+class XcashDaemonRpc(XcashRpc):
+    def __init__(self, rpc_url: str = "http://localhost:18281/json_rpc", session: requests.Session = None,
+                 cache=None, retry=None, timeout=DEFAULT_TIMEOUT, hedge=None):
         """Xcash Daemon RPC simple wrapper
 
         Args:
-            rpc_url (str, optional): Rpc url wallet. Defaults to "http://localhost:18281/json_rpc".
+            rpc_url (str, list, NodePool, optional): Rpc url of the daemon, or a list of urls or a NodePool
+                                                     to route calls over several daemons.
+                                                     Defaults to "http://localhost:18281/json_rpc".
+            session (requests.Session, optional): Own session instead of the shared connection pool. Defaults to None.
+            cache (BlockCache, optional): Cache for blocks, headers and block hashes. Defaults to None.
+            retry (RetryPolicy, optional): Retry and circuit breaker policy. Defaults to None.
+            timeout (float, tuple, optional): (connect, read) timeout in seconds. Defaults to (10, 120).
+            hedge (HedgePolicy, optional): Send a duplicate of slow read-only calls. Defaults to None.
         """
 
-        self.rpc_url = rpc_url
-        super().__init__()
+        if isinstance(rpc_url, NodePool):
+            self.pool = rpc_url
+        elif not isinstance(rpc_url, str):
+            self.pool = NodePool(rpc_url)
+        self.rpc_url = self.pool.nodes[0].url if self.pool is not None else rpc_url
+        super().__init__(session=session, cache=cache, retry=retry, timeout=timeout, hedge=hedge)
         self.headers = {'Content-Type': 'application/json'}
 
     def __xcash_daemon_post(self, method: str, params=None) -> dict:
@@ -26,15 +214,45 @@ class XcashDaemonRpc(Helpers):
             dict: result from api call
         """
         if params:
-            rpc_data = json.dumps({"jsonrpc": "2.0", "id": "0",
-                                   "method": method, "params": params})
+            rpc_data = self.json_codec.dumps({"jsonrpc": "2.0", "id": "0",
+                                              "method": method, "params": params})
 
         else:
-            rpc_data = json.dumps({"jsonrpc": "2.0", "id": "0",
-                                   "method": method})
-
-        response = requests.post(self.rpc_url, data=rpc_data, headers=self.headers)
-        return self.process_response(response=response)
+            rpc_data = self.json_codec.dumps({"jsonrpc": "2.0", "id": "0",
+                                              "method": method})
+
+        self.check_nodes()
+        return self.post_data(self.rpc_url, data=rpc_data, headers=self.headers,
+                              idempotent=method not in NON_IDEMPOTENT_METHODS)
+
+    def check_nodes(self) -> None:
+        """Start a background height check of the pool nodes when refresh_interval has passed
+        """
+        if self.pool is not None and self.pool.begin_refresh():
+            threading.Thread(target=self.refresh_nodes, name="xcash-node-refresh", daemon=True).start()
+
+    def refresh_nodes(self) -> list:
+        """Ask every pool node for its height with get_info, nodes which do not answer count as failed
+
+        Returns:
+            list: health of every node, see NodePool.stats
+        """
+        rpc_data = self.json_codec.dumps({"jsonrpc": "2.0", "id": "0", "method": "get_info"})
+        try:
+            for node in self.pool.nodes:
+                self.pool.begin_call(node)
+                started = time.monotonic()
+                try:
+                    data = self.process_response(self.post_response(node.url, data=rpc_data, headers=self.headers))
+                    height = data["result"]["height"]
+                except Exception:
+                    self.pool.record_failure(node)
+                else:
+                    self.pool.record_success(node, time.monotonic() - started)
+                    self.pool.observe_height(node, height)
+        finally:
+            self.pool.end_refresh()
+        return self.pool.stats()
 
     def get_block_count(self) -> dict:
         """Look up how many blocks are in the longest chain known to the node. 
@@ -56,7 +274,10 @@ class XcashDaemonRpc(Helpers):
         Returns:
             dict: block hash string
         """
-        data = self.__xcash_daemon_post(method="on_get_block_hash", params=[block_height])
+        data = self.cached(("on_get_block_hash", block_height),
+                           lambda: self.__xcash_daemon_post(method="on_get_block_hash", params=[block_height]),
+                           lambda result: self.__store_height(("on_get_block_hash", block_height), block_height,
+                                                              result))
         return data
 
     def get_block_template(self, wallet_address: str, reserve_size: int) -> dict:
@@ -87,49 +308,58 @@ class XcashDaemonRpc(Helpers):
         data = self.__xcash_daemon_post(method="submit_block", params=block_blob_data)
         return data
 
-    def get_last_block_header(self) -> dict:
+    def get_last_block_header(self, raw: bool = False) -> dict:
         """Block header information for the most recent block is easily
             retrieved with this method. No inputs are needed.
 
+        Args:
+            raw (bool, optional): Return the response dict when the client returns models. Defaults to False.
+
         Returns:
-            dict: Structure containing block header
+            dict: Structure containing block header, or a BlockHeader when the client returns models
         """
 
         data = self.__xcash_daemon_post(method="get_last_block_header")
-        return data
+        return self.converted(data, self.__block_header, raw)
 
-    def get_block_header_by_hash(self, hash: str) -> dict:
+    def get_block_header_by_hash(self, hash: str, raw: bool = False) -> dict:
         """Block header information can be retrieved using either a block's hash 
         or height. This method includes a block's hash as an input parameter to 
         retrieve basic information about the block.
 
         Args:
             hash (str): The block's sha256 hash.
+            raw (bool, optional): Return the response dict when the client returns models. Defaults to False.
 
         Returns:
-            dict: block_header, status and boolean of untrusted
+            dict: block_header, status and boolean of untrusted, or a BlockHeader when the client returns models
         """
         params = {"hash": hash}
 
-        data = self.__xcash_daemon_post(method="get_block_header_by_hash", params=params)
-        return data
+        data = self.cached(("get_block_header", "hash", hash),
+                           lambda: self.__xcash_daemon_post(method="get_block_header_by_hash", params=params),
+                           lambda result: self.__store_block("get_block_header", result))
+        return self.converted(data, self.__block_header, raw)
 
-    def get_block_header_by_height(self, height: int) -> dict:
+    def get_block_header_by_height(self, height: int, raw: bool = False) -> dict:
         """Similar to get_block_header_by_hash above, this method includes a block's height 
         as an input parameter to retrieve basic information about the block.
 
         Args:
             height (str): he block's height.
+            raw (bool, optional): Return the response dict when the client returns models. Defaults to False.
 
         Returns:
-            dict: block_header, status and boolean of untrusted
+            dict: block_header, status and boolean of untrusted, or a BlockHeader when the client returns models
         """
         params = {"height": height}
 
-        data = self.__xcash_daemon_post(method="get_block_header_by_height", params=params)
-        return data
+        data = self.cached(("get_block_header", "height", height),
+                           lambda: self.__xcash_daemon_post(method="get_block_header_by_height", params=params),
+                           lambda result: self.__store_block("get_block_header", result))
+        return self.converted(data, self.__block_header, raw)
 
-    def get_block_headers_range(self, start_height: int, end_height: int) -> dict:
+    def get_block_headers_range(self, start_height: int, end_height: int, raw: bool = False) -> dict:
         """Similar to get_block_header_by_height above, but for a range of blocks. 
         This method includes a starting block height and an ending block height as parameters 
         to retrieve basic information about the range of blocks.
@@ -137,13 +367,29 @@ class XcashDaemonRpc(Helpers):
         Args:
             start_height (int): The starting blocks height
             end_height (int): The ending block's height
+            raw (bool, optional): Return the response dict when the client returns models. Defaults to False.
 
         Returns:
-            dict: _description_
+            dict: headers, status and boolean of untrusted, or a list of BlockHeader when the client returns models
         """
         params = {"start_height": start_height, "end_height": end_height}
         data = self.__xcash_daemon_post(method="get_block_headers_range", params=params)
-        return data
+        return self.converted(data, lambda data: BlockHeader.from_list(result_items(data, "headers")), raw)
+
+    @staticmethod
+    def __block_header(data: dict) -> BlockHeader:
+        """Build the record of a single block header response
+
+        Args:
+            data (dict): rpc response
+
+        Raises:
+            RpcError: The daemon returned an error
+
+        Returns:
+            BlockHeader: header
+        """
+        return BlockHeader.from_dict(result(data)["block_header"])
 
     def get_block(self, height_hash) -> dict:
         """Similar to get_block_header_by_height above, but for a range of blocks. 
@@ -164,7 +410,42 @@ class XcashDaemonRpc(Helpers):
         else:
             raise Exception("Integer for the query by height, str for query by hash")
 
-        return self.__xcash_daemon_post("get_block", params)
+        key = ("get_block",) + next(iter(params.items()))
+        return self.cached(key, lambda: self.__xcash_daemon_post("get_block", params),
+                           lambda result: self.__store_block("get_block", result))
+
+    def __store_block(self, method: str, data: dict) -> None:
+        """Cache a block or header response by hash, and by height once the block is final. The
+        cached response leaves out the header's depth.
+
+        Args:
+            method (str): cache key prefix
+            data (dict): response containing a block_header
+        """
+        header = data.get("result", {}).get("block_header")
+        if not header:
+            return
+        height = header["height"]
+        if "depth" in header:
+            self.cache.observe_tip(height + header["depth"])
+
+        # depth grows with every block, a stored value would be served as current
+        stored = dict(data, result=dict(data["result"], block_header=dict(header)))
+        stored["result"]["block_header"].pop("depth", None)
+        self.cache.put((method, "hash", header["hash"]), stored)
+        if self.cache.is_final(height):
+            self.cache.put((method, "height", height), stored, height=height)
+
+    def __store_height(self, key: tuple, height: int, data: dict) -> None:
+        """Cache a response looked up by height once the block is final
+
+        Args:
+            key (tuple): cache key
+            height (int): block height
+            data (dict): response
+        """
+        if "result" in data and self.cache.is_final(height):
+            self.cache.put(key, data, height=height)
 
     def get_connections(self) -> dict:
         """Retrieve information about incoming and outgoing connections to your node.
@@ -281,17 +562,252 @@ class XcashDaemonRpc(Helpers):
 
         return self.__xcash_daemon_post(method="sync_info")
 
+    def get_blocks(self, start_height: int, end_height: int, concurrency: int = 4, chunk_size: int = 50,
+                   progress=None) -> list:
+        """Get all blocks of a height range. The range is split into chunks which are fetched
+        concurrently, each chunk as one batch of get_block calls. Keep the connection pool at least
+        as large as concurrency, see configure_session.
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            concurrency (int, optional): Number of chunks fetched at the same time. Defaults to 4.
+            chunk_size (int, optional): Number of blocks per chunk. Defaults to 50.
+            progress (callable, optional): Called with a RangeChunk after every fetched chunk. Defaults to None.
+
+        Returns:
+            list: get_block response per height, in height order
+        """
+        chunks = split_range(start_height, end_height, chunk_size)
+        return self.__fetch_chunks(chunks=chunks, fetch=self.__blocks_chunk, concurrency=concurrency,
+                                   progress=progress)
+
+    def get_block_headers(self, start_height: int, end_height: int, concurrency: int = 4, chunk_size: int = None,
+                          progress=None, raw: bool = False) -> list:
+        """Get the block headers of a height range with concurrent get_block_headers_range calls.
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            concurrency (int, optional): Number of chunks fetched at the same time. Defaults to 4.
+            chunk_size (int, optional): Number of headers per call. Defaults to the range spread evenly
+                                        over concurrency, at most 1000.
+            progress (callable, optional): Called with a RangeChunk after every fetched chunk. Defaults to None.
+            raw (bool, optional): Return dicts when the client returns models. Defaults to False.
+
+        Raises:
+            RpcError: The daemon returned an error for one of the chunks
+
+        Returns:
+            list: block headers in height order, BlockHeader records when the client returns models
+        """
+        if not chunk_size:
+            chunk_size = self.headers_chunk_size(start_height, end_height, concurrency)
+
+        chunks = split_range(start_height, end_height, chunk_size)
+        headers = self.__fetch_chunks(chunks=chunks, fetch=self.__headers_chunk, concurrency=concurrency,
+                                      progress=progress)
+        return self.converted(headers, BlockHeader.from_list, raw)
+
+    def get_block_headers_array(self, start_height: int, end_height: int, fields: tuple = DEFAULT_HEADER_FIELDS,
+                                layout: str = "struct", concurrency: int = 4, chunk_size: int = None,
+                                progress=None):
+        """Get the numeric fields of the block headers of a height range as NumPy arrays. The arrays
+        are allocated once and every chunk is copied in as soon as it arrives, so the headers of a
+        full chain export are never held as dicts all at once. Requires numpy.
 
-class XcashWalletRpc(Helpers):
-    def __init__(self, wallet_rpc_url: str = "http://localhost:18285/json_rpc"):
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            fields (tuple, optional): Header fields, see columns.HEADER_FIELDS. Defaults to height, timestamp,
+                                      difficulty, reward, block_size, num_txes and major_version.
+            layout (str, optional): "struct" for one structured array, "columns" for a dict of one array
+                                    per field. Defaults to "struct".
+            concurrency (int, optional): Number of chunks fetched at the same time. Defaults to 4.
+            chunk_size (int, optional): Number of headers per call. Defaults to automatic sizing.
+            progress (callable, optional): Called with a RangeChunk after every fetched chunk. Defaults to None.
+
+        Raises:
+            ImportError: numpy is not installed
+            InvalidArgument: Unknown field or layout
+            RpcError: The daemon returned an error for one of the chunks
+
+        Returns:
+            numpy.ndarray, dict: one row per height in height order, empty when end_height < start_height
+        """
+        buffer = header_buffer(max(end_height - start_height + 1, 0), fields=fields, layout=layout)
+        if not chunk_size:
+            chunk_size = self.headers_chunk_size(start_height, end_height, concurrency)
+
+        def fill(chunk):
+            fill_headers(buffer, chunk[0] - start_height, self.__headers_chunk(chunk))
+            return []
+
+        chunks = split_range(start_height, end_height, chunk_size)
+        self.__fetch_chunks(chunks=chunks, fetch=fill, concurrency=concurrency, progress=progress)
+        return buffer
+
+    def iter_blocks(self, start_height: int, end_height: int, window: int = 50, read_ahead: int = 2):
+        """Iterate over the blocks of a height range one block at a time. The next windows are
+        prefetched in the background while the current one is consumed, so at most
+        read_ahead + 1 windows are held in memory.
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            window (int, optional): Number of blocks fetched per batch. Defaults to 50.
+            read_ahead (int, optional): Number of windows prefetched ahead of the consumer. Defaults to 2.
+
+        Yields:
+            dict: get_block response, in height order
+        """
+        chunks = split_range(start_height, end_height, window)
+        return self.__iter_chunks(chunks=chunks, fetch=self.__blocks_chunk, read_ahead=read_ahead)
+
+    def iter_headers(self, start_height: int, end_height: int, window: int = MAX_HEADERS_CHUNK,
+                     read_ahead: int = 2, raw: bool = False):
+        """Iterate over the block headers of a height range one header at a time, prefetching
+        the next windows in the background like iter_blocks.
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            window (int, optional): Number of headers per get_block_headers_range call. Defaults to 1000.
+            read_ahead (int, optional): Number of windows prefetched ahead of the consumer. Defaults to 2.
+            raw (bool, optional): Yield dicts when the client returns models. Defaults to False.
+
+        Raises:
+            RpcError: The daemon returned an error for one of the windows
+
+        Yields:
+            dict: block header, in height order, a BlockHeader when the client returns models
+        """
+        chunks = split_range(start_height, end_height, window)
+        headers = self.__iter_chunks(chunks=chunks, fetch=self.__headers_chunk, read_ahead=read_ahead)
+        return self.converted_items(headers, BlockHeader.from_dict, raw)
+
+    def __blocks_chunk(self, chunk: tuple) -> list:
+        """Get the blocks of a chunk as one batch
+
+        Args:
+            chunk (tuple): (start_height, end_height)
+
+        Returns:
+            list: get_block response per height
+        """
+        return self.call_many([("get_block", {"height": height}) for height in range(chunk[0], chunk[1] + 1)])
+
+    def __headers_chunk(self, chunk: tuple) -> list:
+        """Get the block headers of a chunk
+
+        Args:
+            chunk (tuple): (start_height, end_height)
+
+        Raises:
+            RpcError: The daemon returned an error
+
+        Returns:
+            list: block headers
+        """
+        data = self.get_block_headers_range(start_height=chunk[0], end_height=chunk[1], raw=True)
+        if "result" not in data:
+            raise RpcError(f"Headers {chunk[0]}-{chunk[1]} failed: {data.get('error')}")
+        return data["result"]["headers"]
+
+    @staticmethod
+    def headers_chunk_size(start_height: int, end_height: int, concurrency: int) -> int:
+        """Spread a header range evenly over the workers, within what the daemon returns per call
+
+        Args:
+            start_height (int): The starting blocks height
+            end_height (int): The ending block's height
+            concurrency (int): Number of chunks fetched at the same time
+
+        Returns:
+            int: number of headers per get_block_headers_range call
+        """
+        total = end_height - start_height + 1
+        return max(1, min(MAX_HEADERS_CHUNK, -(-total // max(1, concurrency))))
+
+    def __fetch_chunks(self, chunks: list, fetch, concurrency: int, progress=None) -> list:
+        """Fetch chunks concurrently and join their items in chunk order. The workers run in a copy of
+        the caller's context, so a surrounding Deadline or timeout() applies to every chunk.
+
+        Args:
+            chunks (list): (start_height, end_height) tuple per chunk
+            fetch (callable): Returns the list of items of a chunk
+            concurrency (int): Number of chunks fetched at the same time
+            progress (callable, optional): Called with a RangeChunk after every fetched chunk. Defaults to None.
+
+        Returns:
+            list: items of all chunks
+        """
+
+        def timed(chunk):
+            started = time.monotonic()
+            items = fetch(chunk)
+            return items, time.monotonic() - started
+
+        results = [None] * len(chunks)
+        executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        try:
+            futures = dict((executor.submit(contextvars.copy_context().run, timed, chunk), index)
+                           for index, chunk in enumerate(chunks))
+            for completed, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                results[index], elapsed = future.result()
+                if progress:
+                    progress(RangeChunk(chunks[index][0], chunks[index][1], elapsed, completed, len(chunks)))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return [item for items in results for item in items]
+
+    @staticmethod
+    def __iter_chunks(chunks: list, fetch, read_ahead: int):
+        """Yield the items of chunks in order while the following chunks are fetched in the background
+
+        Args:
+            chunks (list): (start_height, end_height) tuple per chunk
+            fetch (callable): Returns the list of items of a chunk
+            read_ahead (int): Number of chunks fetched ahead of the consumer
+
+        Yields:
+            items of all chunks
+        """
+        read_ahead = max(1, read_ahead)
+        executor = ThreadPoolExecutor(max_workers=read_ahead)
+        chunks = iter(chunks)
+        try:
+            pending = deque(executor.submit(contextvars.copy_context().run, fetch, chunk)
+                            for chunk in islice(chunks, read_ahead))
+            while pending:
+                items = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(contextvars.copy_context().run, fetch, chunk))
+                yield from items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class XcashWalletRpc(XcashRpc):
+    uri_scheme = URI_SCHEME  # scheme of the payment uris made and parsed locally
+
+    def __init__(self, wallet_rpc_url: str = "http://localhost:18285/json_rpc", session: requests.Session = None,
+                 retry=None, timeout=DEFAULT_TIMEOUT):
         """Xcash wallet rpc wrapper.
 
         Args:
             wallet_rpc_url (str, optional): Rpc address. Defaults to "http://localhost:18285/json_rpc".
+            session (requests.Session, optional): Own session instead of the shared connection pool. Defaults to None.
+            retry (RetryPolicy, optional): Retry and circuit breaker policy. Transfers are never retried.
+                                           Defaults to None.
+            timeout (float, tuple, optional): (connect, read) timeout in seconds. Raise the read timeout
+                                              for slow calls like rescan_blockchain. Defaults to (10, 120).
         """
         self.rpc_url = wallet_rpc_url
 
-        super().__init__()
+        super().__init__(session=session, retry=retry, timeout=timeout)
         self.headers = {'Content-Type': 'application/json'}
 
     def __xcash_wallet_post(self, method: str, params=None) -> dict:
@@ -305,16 +821,31 @@ class XcashWalletRpc(Helpers):
             dict: result from api call
         """
         if params:
-            rpc_data = json.dumps({"jsonrpc": "2.0", "id": "0",
-                                   "method": method, "params": params})
+            rpc_data = self.json_codec.dumps({"jsonrpc": "2.0", "id": "0",
+                                              "method": method, "params": params})
 
         else:
-            rpc_data = json.dumps({"jsonrpc": "2.0", "id": "0",
-                                   "method": method})
+            rpc_data = self.json_codec.dumps({"jsonrpc": "2.0", "id": "0",
+                                              "method": method})
+
+        return self.post_data(self.rpc_url, data=rpc_data, headers=self.headers,
+                              idempotent=method not in NON_IDEMPOTENT_METHODS)
 
-        response = requests.post(self.rpc_url, data=rpc_data, headers=self.headers)
+    def __xcash_wallet_stream(self, method: str, path: tuple, params=None):
+        """Post to XCASH Wallet RPC and stream the items of a list in the result
 
-        return self.process_response(response=response)
+        Args:
+            method (str): Supported method by XCASH Wallet RPC
+            path (tuple): Keys leading to the list, see Helpers.iter_json
+            params (dict, optional): Additional params to be sent through. Defaults to None.
+
+        Returns:
+            generator: items of the list
+        """
+        envelope = {"jsonrpc": "2.0", "id": "0", "method": method}
+        if params:
+            envelope["params"] = params
+        return self.iter_json(self.rpc_url, path=path, data=self.json_codec.dumps(envelope), headers=self.headers)
 
     def get_balance(self, account_index: int = 0, sub_address_indicies: list = None) -> dict:
         """Return the wallet's balance.
@@ -586,7 +1117,7 @@ class XcashWalletRpc(Helpers):
         """
         params = {"tx_data_hex ": tx_data_hex}
 
-        return self.__xcash_wallet_post(method="submint_transfer", params=params)
+        return self.__xcash_wallet_post(method="submit_transfer", params=params)
 
     def sweep_dust(self, **kwargs) -> dict:
         """Send all dust outputs back to the wallet's, to make them easier to spend (and mix).
@@ -602,7 +1133,7 @@ class XcashWalletRpc(Helpers):
         """
         allowed = ["get_tx_keys", "do_not_relay", "get_tx_hex", "get_tx_metadata"]
         self.check_params(allowed_keys=allowed, params=kwargs)
-        return self.__xcash_wallet_post(method="submint_transfer", params=kwargs)
+        return self.__xcash_wallet_post(method="sweep_dust", params=kwargs)
 
     def sweep_all(self, address: str, account_index: int = 0, mixin: int = 20, **kwargs) -> dict:
         """Send all unlocked balance to an address.
@@ -668,22 +1199,24 @@ class XcashWalletRpc(Helpers):
         """
         return self.__xcash_wallet_post(method="store")
 
-    def get_payments(self, payment_id: str) -> dict:
+    def get_payments(self, payment_id: str, raw: bool = False) -> dict:
         """Get a list of incoming payments using a given payment id.
         Args:
             payment_id (str, optional): Payment ID used to find the payments (16 characters hex).. Defaults to None.
+            raw (bool, optional): Return the response dict when the client returns models. Defaults to False.
 
         Returns:
-            dict: payments
+            dict: payments, a list of Payment records when the client returns models
         """
 
         params = {}
         if payment_id:
             params.update({"payment_id": payment_id})
 
-        return self.__xcash_wallet_post(method="get_payments", params=params)
+        data = self.__xcash_wallet_post(method="get_payments", params=params)
+        return self.converted(data, self.__payments, raw)
 
-    def get_bulk_payments(self, payment_ids: list, min_block_height: int) -> dict:
+    def get_bulk_payments(self, payment_ids: list, min_block_height: int, raw: bool = False) -> dict:
         """Get a list of incoming payments using a given payment id, or a list of 
         payments ids, from a given height. This method is the preferred method over
          get_paymentsbecause it has the same functionality but is more extendable.
@@ -692,15 +1225,32 @@ class XcashWalletRpc(Helpers):
         Args:
             payment_ids (list): Payment IDs used to find the payments (16 characters hex).
             min_block_height (int): The block height at which to start looking for payments.
+            raw (bool, optional): Return the response dict when the client returns models. Defaults to False.
 
         Returns:
-            dict: List of payments
+            dict: List of payments, Payment records when the client returns models
         """
         params = {"payment_ids": payment_ids, "min_block_height": min_block_height}
-        return self.__xcash_wallet_post(method="get_payments", params=params)
+        data = self.__xcash_wallet_post(method="get_bulk_payments", params=params)
+        return self.converted(data, self.__payments, raw)
+
+    @staticmethod
+    def __payments(data: dict) -> list:
+        """Build the records of a payments response
+
+        Args:
+            data (dict): rpc response
+
+        Raises:
+            RpcError: The wallet returned an error
+
+        Returns:
+            list: Payment records
+        """
+        return Payment.from_list(result_items(data, "payments"))
 
     def incoming_transfers(self, transfer_type: str, account_index: int = 0, subaddrr_indices: list = None,
-                           verbose: bool = True) -> dict:
+                           verbose: bool = True, raw: bool = False) -> dict:
 
         """Return a list of incoming transfers to the wallet
 
@@ -711,13 +1261,36 @@ class XcashWalletRpc(Helpers):
             account_index (int, optional): Return transfers for this account. Defaults to 0.
             subaddrr_indices (list, optional):  Return transfers sent to these subaddresses.. Defaults to None.
             verbose (bool, optional): Enable verbose output. Defaults to True.
+            raw (bool, optional): Return the response dict when the client returns models. Defaults to False.
 
         Returns:
-            dict: list of transfers
+            dict: list of transfers, Transfer records when the client returns models
         """
         params = {"transfer_type": transfer_type, "account_index": account_index, "subaddrr_indices": subaddrr_indices,
                   "verbose": verbose}
-        return self.__xcash_wallet_post(method="incoming_transfers", params=params)
+        data = self.__xcash_wallet_post(method="incoming_transfers", params=params)
+        return self.converted(data, lambda data: Transfer.from_list(result_items(data, "transfers")), raw)
+
+    def iter_incoming_transfers(self, transfer_type: str, account_index: int = 0, subaddrr_indices: list = None,
+                                verbose: bool = True, raw: bool = False):
+        """Stream the incoming transfers of the wallet one at a time while the response arrives,
+        see incoming_transfers. Memory stays flat for wallets of any size.
+
+        Args:
+            transfer_type (str): "all", "available" or "unavailable"
+            account_index (int, optional): Return transfers for this account. Defaults to 0.
+            subaddrr_indices (list, optional):  Return transfers sent to these subaddresses.. Defaults to None.
+            verbose (bool, optional): Enable verbose output. Defaults to True.
+            raw (bool, optional): Yield dicts when the client returns models. Defaults to False.
+
+        Returns:
+            generator: transfer dicts, Transfer records when the client returns models
+        """
+        params = {"transfer_type": transfer_type, "account_index": account_index, "subaddrr_indices": subaddrr_indices,
+                  "verbose": verbose}
+        transfers = self.__xcash_wallet_stream(method="incoming_transfers", path=("result", "transfers"),
+                                               params=params)
+        return self.converted_items(transfers, Transfer.from_dict, raw)
 
     def query_key(self, key_type: str) -> dict:
         """Return the spend or view private key.
@@ -760,6 +1333,34 @@ class XcashWalletRpc(Helpers):
         params = {"integrated_address": integrated_address, }
         return self.__xcash_wallet_post(method="split_integrated_address", params=params)
 
+    def learn_integrated_prefix(self) -> int:
+        """Make one integrated address with the wallet and register its network prefix, after which
+        local_integrated_address and local_split_integrated_address work without round trips.
+
+        Raises:
+            RpcError: The rpc returned an error
+
+        Returns:
+            int: integrated address prefix
+        """
+        return learn_prefix(result(self.make_integrated_address())["integrated_address"], INTEGRATED)
+
+    def learn_subaddress_prefix(self, account_index: int = 0) -> int:
+        """Read one subaddress of the wallet and register its network prefix, after which local
+        validation accepts subaddresses
+
+        Args:
+            account_index (int, optional): Account to read the subaddress from. Defaults to 0.
+
+        Raises:
+            RpcError: The rpc returned an error
+            ValueError: The account has no subaddress, create one with create_address
+
+        Returns:
+            int: subaddress prefix
+        """
+        return learn_subaddress(result(self.get_address(account_index=account_index)))
+
     def stop_wallet(self):
         """Stops the wallet, storing the curretn state
 
@@ -963,9 +1564,12 @@ class XcashWalletRpc(Helpers):
             params.update({"message": message})
         return self.__xcash_wallet_post(method="check_reserve_proof", params=params)
 
-    def get_transfers(self, **kwargs) -> dict:
+    def get_transfers(self, raw: bool = False, **kwargs) -> dict:
         """Returns a list of transfers.
 
+        Args:
+            raw (bool, optional): Return the response dict when the client returns models. Defaults to False.
+
         Kwargs: 
             in (bool, optional): Include incoming
             out (bool, optional): Include outgoing
@@ -979,7 +1583,8 @@ class XcashWalletRpc(Helpers):
             subaddr_indices (list, optional): List of subaddress indices to query for transfers. (Defaults to empty - all indices)
 
         Returns:
-            dict: out list, pending list, failed list, pool list
+            dict: out list, pending list, failed list, pool list. With models one list of Transfer records,
+                  their type tells which list they belong to.
         """
 
         allowed = ["in", "out", 'pending', "failed", "pool", "filter_by_height", "min_height", "max_height",
@@ -989,7 +1594,29 @@ class XcashWalletRpc(Helpers):
         params = {}
         if kwargs:
             params.update(kwargs)
-        return self.__xcash_wallet_post(method="get_transfers", params=params)
+        data = self.__xcash_wallet_post(method="get_transfers", params=params)
+        return self.converted(data, lambda data: Transfer.from_list(result_items(data, *TRANSFER_TYPES)), raw)
+
+    def iter_transfers(self, raw: bool = False, **kwargs):
+        """Stream transfers one at a time while the response arrives, see get_transfers. The "type" of
+        each transfer tells which list (in, out, pending, failed, pool) it belongs to. Memory stays
+        flat for wallets of any size.
+
+        Args:
+            raw (bool, optional): Yield dicts when the client returns models. Defaults to False.
+
+        Kwargs:
+            Same as get_transfers
+
+        Returns:
+            generator: transfer dicts, Transfer records when the client returns models
+        """
+        allowed = ["in", "out", 'pending', "failed", "pool", "filter_by_height", "min_height", "max_height",
+                   "account_index", "subaddr_indices"]
+
+        self.check_params(allowed_keys=allowed, params=kwargs)
+        transfers = self.__xcash_wallet_stream(method="get_transfers", path=("result", "*"), params=dict(kwargs))
+        return self.converted_items(transfers, Transfer.from_dict, raw)
 
     def get_transfers_by_txid(self, tx_id: str, account_index: int = 0) -> dict:
         """Show information about a transfer to/from this address.
@@ -1105,6 +1732,69 @@ class XcashWalletRpc(Helpers):
         params = {"uri": uri}
         return self.__xcash_wallet_post(method="parse_uri", params=params)
 
+    def local_make_uri(self, address: str, **kwargs) -> str:
+        """Create a payment URI in process, the uri make_uri returns, with the address checked locally.
+
+        Args:
+            address (str): Wallet address
+
+        Kwargs:
+            amount (int, optional): the integer amount to receive, in atomic units
+            payment_id (str, optional): 16 or 64 character hexadecimal payment id
+            recipient_name (str, optional): name of the payment recipient
+            tx_description (str, optional): Description of the reason for the tx
+
+        Raises:
+            InvalidUri: Invalid or non XCASH address, payment id or amount
+
+        Returns:
+            str: uri
+        """
+        self.check_params(allowed_keys=URI_FIELDS, params=kwargs)
+        return make_uri(address, scheme=self.uri_scheme, **kwargs)
+
+    def local_make_uris(self, rows) -> list:
+        """Create many payment URIs in process, see local_make_uri
+
+        Args:
+            rows (iterable): dicts with address and optionally amount, payment_id, recipient_name, tx_description
+
+        Raises:
+            InvalidUri: Rows are invalid, errors lists (item index, message) for each of them
+
+        Returns:
+            list: uri per row
+        """
+        return make_uris(rows, scheme=self.uri_scheme)
+
+    def local_parse_uri(self, uri: str) -> dict:
+        """Parse a payment URI in process, the result parse_uri returns, with the address checked locally.
+
+        Args:
+            uri (str): This contains all the payment input information as a properly formatted payment URI
+
+        Raises:
+            InvalidUri: The uri is malformed or holds an invalid or non XCASH address, payment id or amount
+
+        Returns:
+            dict: uri with address, payment_id, amount, recipient_name, tx_description, unknown_parameters
+        """
+        return parse_uri(uri, scheme=self.uri_scheme)
+
+    def local_parse_uris(self, uris) -> list:
+        """Parse many payment URIs in process, see local_parse_uri
+
+        Args:
+            uris (iterable): payment URIs
+
+        Raises:
+            InvalidUri: Uris are invalid, errors lists (item index, message) for each of them
+
+        Returns:
+            list: local_parse_uri result per uri
+        """
+        return parse_uris(uris, scheme=self.uri_scheme)
+
     def get_address_book(self, entries: list) -> dict:
         """Retrieves entries from the address book.
         Args:
@@ -1128,7 +1818,7 @@ class XcashWalletRpc(Helpers):
             dict: The index of the address book entry as INT
         """
         params = {"address": address, "description": description, "payment_id": payment_id}
-        return self.__xcash_wallet_post(method="get_address_book", params=params)
+        return self.__xcash_wallet_post(method="add_address_book", params=params)
 
     def delete_address_book(self, index: int) -> dict:
         """Delete an entry from the address book.
@@ -1319,12 +2009,34 @@ class XcashWalletRpc(Helpers):
         return self.__xcash_wallet_post(method="get_version")
 
 
-class XcashDpopsWalletRpc(Helpers):
-    def __init__(self, rpc_url: str = "http://localhost:18285/json_rpc"):
+class XcashDpopsWalletRpc(XcashRpc):
+    def __init__(self, rpc_url: str = "http://localhost:18285/json_rpc", session: requests.Session = None,
+                 retry=None, timeout=DEFAULT_TIMEOUT):
 
-        super().__init__()
+        super().__init__(session=session, retry=retry, timeout=timeout)
         self.headers = {'Content-Type': 'application/json'}
-        self_rpc_url = rpc_url
+        self.rpc_url = rpc_url
+
+    def __xcash_daemon_post(self, method: str, params=None) -> dict:
+        """Post to XCASH DPOPS Wallet RPC
+
+        Args:
+            method (str): Supported method by XCASH DPOPS Wallet RPC
+            params (dict, optional): Additional params to be sent through. Defaults to None.
+
+        Returns:
+            dict: result from api call
+        """
+        if params:
+            rpc_data = self.json_codec.dumps({"jsonrpc": "2.0", "id": "0",
+                                              "method": method, "params": params})
+
+        else:
+            rpc_data = self.json_codec.dumps({"jsonrpc": "2.0", "id": "0",
+                                              "method": method})
+
+        return self.post_data(self.rpc_url, data=rpc_data, headers=self.headers,
+                              idempotent=method not in NON_IDEMPOTENT_METHODS)
 
     def vote(self, delegate: str) -> dict:
         """Place your vote for a delegate
@@ -1336,7 +2048,7 @@ class XcashDpopsWalletRpc(Helpers):
             dict: tatus of the vote call.
         """
         params = {"delegate_data": delegate}
-        data = self.__xcash(method="vote", params=params)
+        data = self.__xcash_daemon_post(method="vote", params=params)
         return data
 
     def register_delegate(self, delegate_name: str, delegate_ip_address: str) -> dict:
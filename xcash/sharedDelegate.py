@@ -1,18 +1,13 @@
 import requests
-from xcash.helpers import Helpers
+from xcash.helpers import DEFAULT_TIMEOUT, Helpers
+from xcash.models import Payment, Voter
 
 
 class SharedDelegate(Helpers):
-    def __init__(self, delegate_url: str):
-        Helpers.__init__(self)
-        try:
-            url = self.check_url(delegate_url=delegate_url)
-            requests.get(url)
-            self.delegate_api = url
-        except requests.ConnectionError:
-            raise ConnectionError
-        except requests.exceptions.MissingSchema:
-            raise requests.exceptions.MissingSchema
+    def __init__(self, delegate_url: str, session: requests.Session = None, retry=None,
+                 timeout=DEFAULT_TIMEOUT, hedge=None):
+        Helpers.__init__(self, session=session, retry=retry, timeout=timeout, hedge=hedge)
+        self.delegate_api = self.connect(delegate_url=delegate_url)
 
         self.delegate_website_statistics = "shareddelegateswebsitegetstatistics"
         self.delegate_found_blocks = "getblocksfound"
@@ -20,6 +15,27 @@ class SharedDelegate(Helpers):
         self.public_address_payment_info = "getpublicaddresspaymentinformation"
         self.delegate_voter_list = "getdelegatesvoterslist"
 
+    def connect(self, delegate_url: str) -> str:
+        """Check that the delegate api is reachable
+
+        Args:
+            delegate_url (str): Provided url when initiating a class
+
+        Raises:
+            ConnectionError: Delegate api can not be reached
+
+        Returns:
+            str: url
+        """
+        try:
+            url = self.check_url(delegate_url=delegate_url)
+            self.session.get(url, timeout=self.request_timeout())
+            return url
+        except requests.ConnectionError:
+            raise ConnectionError
+        except requests.exceptions.MissingSchema:
+            raise requests.exceptions.MissingSchema
+
     def get_blocks_found(self, start: int = 1, amount="all") -> list:
         """Get blocks found by the shared delegate
 
@@ -31,24 +47,34 @@ class SharedDelegate(Helpers):
             list: list of blocks with details
         """
 
-        response = self.get_response(
-            url=self.delegate_api + f"{self.delegate_found_blocks}?start={start}&amount={amount}")
-        return self.process_response(response)
+        return self.get_data(url=self.delegate_api + f"{self.delegate_found_blocks}?start={start}&amount={amount}")
+
+    def iter_blocks_found(self, start: int = 1, amount="all"):
+        """Stream the blocks found by the shared delegate one at a time while the response arrives
+
+        Args:
+            start (int, optional): Start of the block query. Defaults to 1.
+            amount (str, int, optional): Number of blocks to return. Defaults to "all".
+
+        Returns:
+            generator: block dicts
+        """
+        return self.iter_json(url=self.delegate_api + f"{self.delegate_found_blocks}?start={start}&amount={amount}")
 
-    def get_delegate_voter_list(self, wallet_address: str = None) -> list:
+    def get_delegate_voter_list(self, wallet_address: str = None, raw: bool = False) -> list:
         """Get a list of all delegates staking towards the shared delegate.
 
         Args:
             wallet_address (str, optional): The public address of the shared delegate. Defaults to None.
+            raw (bool, optional): Return dicts when the client returns models. Defaults to False.
 
         Returns:
-            list: Delegates staking to shared delegate
+            list: Delegates staking to shared delegate, Voter records when the client returns models
         """
         if not wallet_address:
             wallet_address = self.get_delegate_website_statistic()["public_address"]
-        response = self.get_response(
-            url=self.delegate_api + f"{self.delegate_voter_list}?parameter1={wallet_address}")
-        return self.process_response(response)
+        voters = self.get_data(url=self.delegate_api + f"{self.delegate_voter_list}?parameter1={wallet_address}")
+        return self.converted(voters, Voter.from_list, raw)
 
     def get_delegate_website_statistic(self) -> dict:
         """Get statistics about the shared delegate
@@ -57,8 +83,7 @@ class SharedDelegate(Helpers):
             dict: Statistical details and characteristics of shared delegate
         """
 
-        response = self.get_response(url=self.delegate_api + self.delegate_website_statistics)
-        return self.process_response(response)
+        return self.get_data(url=self.delegate_api + self.delegate_website_statistics)
 
     def get_public_address_information(self, public_address: str) -> dict:
         """	Get statistics about any delegate that has staked on the shared delegate
@@ -70,24 +95,23 @@ class SharedDelegate(Helpers):
             dict: statistics for the chosen delegate
         """
 
-        response = self.get_response(
-            url=self.delegate_api + f"{self.public_address_info}?public_address={public_address}")
-        return self.process_response(response)
+        return self.get_data(url=self.delegate_api + f"{self.public_address_info}?public_address={public_address}")
 
-    def get_public_address_payment_information(self, public_address: str, start: int = 1, amount="all") -> list:
+    def get_public_address_payment_information(self, public_address: str, start: int = 1, amount="all",
+                                               raw: bool = False) -> list:
         """Get payment information about any delegate that has staked on the shared delegate
 
         Args:
             public_address (str): Delegates public address from where stake is sent
             start (int, optional): The start payment in the list. Defaults to 1.
             amount (str,int, optional): Amount of payments to return from start param. Defaults to "all".
+            raw (bool, optional): Return dicts when the client returns models. Defaults to False.
 
         Returns:
-            list: Payments sent to delegate
+            list: Payments sent to delegate, Payment records when the client returns models
         """
 
 
-        response = self.get_response(
-            url=self.delegate_api + f"{self.public_address_payment_info}?public_address={public_address}&start={start}&amount={amount}")
-        return self.process_response(response)
+        payments = self.get_data(url=self.delegate_api + f"{self.public_address_payment_info}?public_address={public_address}&start={start}&amount={amount}")
+        return self.converted(payments, Payment.from_list, raw)
 
@@ -0,0 +1,203 @@
+import json
+import re
+
+from xcash.codec import get_codec
+
+_SPECIAL = re.compile(rb'["{}\[\],:]')
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# everything up to the next bracket which is not inside a string
+_SKIP = re.compile(rb'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*', re.S)
+_WHITESPACE = b" \t\r\n"
+_OPEN = b"{["
+_QUOTE, _COMMA, _COLON, _BRACE, _BRACKET, _CLOSE_BRACKET = b'",:{[]'
+
+
+class JsonStream():
+    def __init__(self, path: tuple = (), errors: tuple = ("error",), codec=None, exception=ValueError):
+        """Incremental parser which yields the items of a JSON array while the document is still
+        arriving. Only the item being parsed is buffered, so memory stays flat however long the
+        array is.
+
+        Args:
+            path (tuple, optional): Object keys leading to the array, "*" matches any key.
+                                    Defaults to (), a top level array.
+            errors (tuple, optional): Top level keys which hold an error, e.g. of a JSON-RPC response.
+                                      Defaults to ("error",).
+            codec (JsonCodec, optional): Codec decoding the items. Defaults to the shared codec.
+            exception (type, optional): Raised for error documents and incomplete documents. Defaults to ValueError.
+        """
+        self.path = tuple(path)
+        self.errors = errors
+        self.codec = codec or get_codec()
+        self.exception = exception
+
+        self._buf = bytearray()
+        self._pos = 0
+        self._stack = []  # [kind, key, target] per open container
+        self._expect_key = False
+        self._pending = None  # "item" or "error" when the next value is captured
+        self._capture = None  # [start, depth, kind, container]
+        self._started = False
+
+    def feed(self, chunk: bytes) -> list:
+        """Parse the next part of the document
+
+        Args:
+            chunk (bytes): received data
+
+        Raises:
+            exception: The document holds an error instead of the expected array
+
+        Returns:
+            list: items completed by the chunk
+        """
+        self._buf += chunk
+        items = list()
+        self.__scan(items)
+
+        keep = self._capture[0] if self._capture else self._pos
+        if keep:
+            del self._buf[:keep]
+            self._pos -= keep
+            if self._capture:
+                self._capture[0] = 0
+        return items
+
+    def close(self) -> None:
+        """Check that the whole document was parsed
+
+        Raises:
+            exception: The document ended early
+        """
+        if self._stack or self._capture or not self._started:
+            raise self.exception("Response ended before the JSON document was complete")
+
+    def __scan(self, items: list) -> None:
+        """Walk the buffered data from the last position
+
+        Args:
+            items (list): receives completed items
+        """
+        buf = self._buf
+        pos = self._pos
+        while True:
+            if self._pending:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == len(buf):
+                    break
+                if not (self._pending == "item" and buf[pos] == _CLOSE_BRACKET):
+                    self._capture = [pos, len(self._stack), self._pending, buf[pos] in _OPEN]
+                self._pending = None
+
+            if not self._started:
+                while pos < len(buf) and buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos == len(buf):
+                    break
+                self._started = True
+                if not self.path and buf[pos] == _BRACE:
+                    self._capture = [pos, 0, "error", True]
+
+            capture = self._capture
+            if capture and capture[3]:
+                pos = _SKIP.match(buf, pos).end()
+                if pos == len(buf):
+                    break
+                char = buf[pos]
+                if char != _QUOTE:
+                    pos += 1
+                    if char in _OPEN:
+                        self._stack.append([chr(char), None, False])
+                        continue
+                    self._stack.pop()
+                    if len(self._stack) == capture[1]:
+                        self.__emit(pos, items)
+                    continue
+
+            match = _SPECIAL.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+            i = match.start()
+            char = buf[i]
+
+            if char == _QUOTE:
+                string = _STRING.match(buf, i)
+                if string is None:
+                    pos = i
+                    break
+                pos = string.end()
+                if self._expect_key and not self._capture:
+                    self._stack[-1][1] = json.loads(bytes(buf[i:pos]))
+                    self._expect_key = False
+                continue
+
+            pos = i + 1
+            if char == _COMMA:
+                self.__end_scalar(i, items)
+                if self._stack and self._stack[-1][0] == "{":
+                    self._expect_key = True
+                elif self._stack and self._stack[-1][2] and not self._capture:
+                    self._pending = "item"
+            elif char == _COLON:
+                self._expect_key = False
+                if not self._capture and len(self._stack) == 1 and self._stack[0][1] in self.errors:
+                    self._pending = "error"
+            elif char == _BRACE:
+                self._stack.append(["{", None, False])
+                self._expect_key = True
+            elif char == _BRACKET:
+                target = not self._capture and self.__at_path()
+                self._stack.append(["[", None, target])
+                if target:
+                    self._pending = "item"
+            else:
+                self.__end_scalar(i, items)
+                self._stack.pop()
+                self._expect_key = False
+                capture = self._capture
+                if capture and capture[3] and len(self._stack) == capture[1]:
+                    self.__emit(i + 1, items)
+        self._pos = pos
+
+    def __at_path(self) -> bool:
+        """Check if the current position is the array to stream
+
+        Returns:
+            bool: True when the keys of the open objects match path
+        """
+        if len(self._stack) != len(self.path):
+            return False
+        for (kind, key, _), wanted in zip(self._stack, self.path):
+            if kind != "{" or (wanted != "*" and key != wanted):
+                return False
+        return True
+
+    def __end_scalar(self, end: int, items: list) -> None:
+        """Finish a captured number, string or literal at a delimiter
+
+        Args:
+            end (int): position of the delimiter
+            items (list): receives the completed item
+        """
+        capture = self._capture
+        if capture and not capture[3] and len(self._stack) == capture[1]:
+            self.__emit(end, items)
+
+    def __emit(self, end: int, items: list) -> None:
+        """Decode a captured value
+
+        Args:
+            end (int): position after the value
+            items (list): receives the completed item
+
+        Raises:
+            exception: The value is an error
+        """
+        start, _, kind, _ = self._capture
+        self._capture = None
+        value = self.codec.loads(bytes(self._buf[start:end]))
+        if kind == "error":
+            raise self.exception(f"Response returned an error: {value}")
+        items.append(value)
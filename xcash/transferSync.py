@@ -0,0 +1,201 @@
+import json
+import os
+import threading
+from collections import namedtuple
+
+from xcash.models import TRANSFER_TYPES, result
+
+TransferEvent = namedtuple("TransferEvent", ["kind", "transfer", "previous"])
+
+NEW = "new"  # first time the transfer is seen
+CONFIRMED = "confirmed"  # a pending or pool transfer was mined
+CHANGED = "changed"  # the type or height changed otherwise, e.g. pending to failed or mined again after a reorg
+REMOVED = "removed"  # the transfer left the pool or its block was rolled back
+
+CONFIRMED_TYPES = ("in", "out")
+STATE_VERSION = 2
+
+
+def transfer_key(transfer: dict) -> tuple:
+    """Identify a transfer across its pending, pool and confirmed states. A transaction paying several
+    subaddresses of the wallet is listed once per subaddress.
+
+    Args:
+        transfer (dict): transfer of get_transfers
+
+    Returns:
+        tuple: (txid, "in" or "out", account index, subaddress index)
+    """
+    direction = "in" if transfer.get("type") in ("in", "pool") else "out"
+    index = transfer.get("subaddr_index") or {}
+    return transfer.get("txid"), direction, index.get("major", 0), index.get("minor", 0)
+
+
+class TransferSync():
+    def __init__(self, wallet, path: str = None, types: tuple = TRANSFER_TYPES, rescan_depth: int = 10,
+                 start_height: int = 0, account_index: int = None, subaddr_indices: list = None):
+        """Follow the transfers of a wallet incrementally. Every sync only asks the wallet for the
+        transfers above a height cursor, and reports what is new or changed since the last sync.
+
+        Args:
+            wallet (XcashWalletRpc): Wallet rpc client
+            path (str, optional): File the cursor and seen transfers are kept in, loaded when it exists
+                                  and written after every sync. Defaults to None, kept in memory.
+            types (tuple, optional): Transfer types to follow. Defaults to all of in, out, pending, failed, pool.
+            rescan_depth (int, optional): Blocks below the cursor fetched again on every sync, to pick up
+                                          reorgs. Defaults to 10.
+            start_height (int, optional): Height the cursor starts at, to skip older history on the first
+                                          sync. Defaults to 0.
+            account_index (int, optional): Account to follow. Defaults to None, the wallet's default.
+            subaddr_indices (list, optional): Subaddresses to follow. Defaults to None, all of them.
+        """
+        self.wallet = wallet
+        self.path = path
+        self.types = tuple(types)
+        self.rescan_depth = rescan_depth
+        self.account_index = account_index
+        self.subaddr_indices = subaddr_indices
+
+        self.height = start_height  # wallet height at the last sync
+        self.seen = dict()  # key -> block height of the transfers reported which may still be fetched, None unmined
+        self.recent = dict()  # key -> transfer, for transfers which may still change
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    def params(self) -> dict:
+        """Arguments of the get_transfers call for the next sync
+
+        Returns:
+            dict: get_transfers kwargs
+        """
+        params = dict((kind, True) for kind in self.types)
+        params.update({"filter_by_height": True, "min_height": self.window_start()})
+        if self.account_index is not None:
+            params["account_index"] = self.account_index
+        if self.subaddr_indices:
+            params["subaddr_indices"] = self.subaddr_indices
+        return params
+
+    def window_start(self) -> int:
+        """Height above which transfers are fetched and may still change
+
+        Returns:
+            int: height, exclusive
+        """
+        return max(self.height - self.rescan_depth, 0)
+
+    def sync(self) -> list:
+        """Fetch the transfers above the cursor and apply them, see apply
+
+        Raises:
+            RpcError: The wallet returned an error
+
+        Returns:
+            list: TransferEvent per new, confirmed, changed or removed transfer
+        """
+        height = result(self.wallet.get_wallet_height())["height"]
+        return self.apply(height, self.wallet.get_transfers(raw=True, **self.params()))
+
+    def apply(self, height: int, data: dict) -> list:
+        """Compare a get_transfers response, made with params(), with the known transfers and move the
+        cursor. Async clients fetch the height and transfers themselves and pass them here.
+
+        Args:
+            height (int): wallet height read before the transfers were fetched
+            data (dict): get_transfers response
+
+        Raises:
+            RpcError: The wallet returned an error
+
+        Returns:
+            list: TransferEvent per new, confirmed, changed or removed transfer
+        """
+        current = dict()
+        for kind in self.types:
+            for transfer in result(data).get(kind) or []:
+                current[transfer_key(transfer)] = transfer
+
+        with self._lock:
+            window_start = self.window_start()
+            events = list()
+            for key, transfer in current.items():
+                previous = self.recent.get(key)
+                if previous is None:
+                    if key not in self.seen:
+                        events.append(TransferEvent(NEW, transfer, None))
+                elif (previous["type"], previous.get("height")) != (transfer["type"], transfer.get("height")):
+                    confirmed = previous["type"] not in CONFIRMED_TYPES and transfer["type"] in CONFIRMED_TYPES
+                    events.append(TransferEvent(CONFIRMED if confirmed else CHANGED, transfer, previous))
+
+            for key, previous in self.recent.items():
+                fetched = previous["type"] not in CONFIRMED_TYPES or (previous.get("height") or 0) > window_start
+                if key not in current and fetched:
+                    events.append(TransferEvent(REMOVED, previous, previous))
+
+            self.seen.update((key, transfer.get("height") if transfer["type"] in CONFIRMED_TYPES else None)
+                             for key, transfer in current.items())
+            self.height = max(height, self.height)
+            # transfers at or below the next window are not fetched again and can no longer change
+            window_start = self.window_start()
+            self.recent = dict((key, transfer) for key, transfer in current.items()
+                               if transfer["type"] not in CONFIRMED_TYPES or
+                               (transfer.get("height") or 0) > window_start)
+            self.seen = dict((key, mined) for key, mined in self.seen.items() if mined is None or mined > window_start)
+            for event in events:
+                if event.kind == REMOVED:
+                    self.seen.pop(transfer_key(event.transfer), None)
+
+        if self.path:
+            self.save()
+        return events
+
+    def on_rollback(self, rollback) -> None:
+        """Move the cursor back to a reorg, to subscribe to a ChainFollower. Reorgs within rescan_depth
+        blocks are found without it; for deeper ones, transfers removed below the window are not reported
+        and the ones fetched again from below it are reported as new.
+
+        Args:
+            rollback (Rollback): rollback event
+        """
+        with self._lock:
+            self.height = min(self.height, rollback.fork_height + self.rescan_depth)
+
+    def reset(self, start_height: int = 0) -> None:
+        """Forget the cursor and the seen transfers, the next sync reports every transfer as new
+
+        Args:
+            start_height (int, optional): Ignore transfers below this height. Defaults to 0.
+        """
+        with self._lock:
+            self.height = start_height
+            self.seen = dict()
+            self.recent = dict()
+        if self.path:
+            self.save()
+
+    def save(self) -> None:
+        """Write the cursor and seen transfers to path, replacing the file atomically
+        """
+        with self._lock:
+            state = {"version": STATE_VERSION, "height": self.height,
+                     "seen": [[*key, mined] for key, mined in self.seen.items()], "recent": list(self.recent.values())}
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(state, file)
+        os.replace(temporary, self.path)
+
+    def load(self) -> None:
+        """Read the cursor and seen transfers from path
+        """
+        with open(self.path) as file:
+            state = json.load(file)
+        with self._lock:
+            self.height = state["height"]
+            self.recent = dict((transfer_key(transfer), transfer) for transfer in state["recent"])
+            if state.get("version", 1) < 2:
+                # seen kept every key without heights, only the ones still in the window matter
+                self.seen = dict((key, transfer.get("height") if transfer["type"] in CONFIRMED_TYPES else None)
+                                 for key, transfer in self.recent.items())
+            else:
+                self.seen = dict((tuple(entry[:-1]), entry[-1]) for entry in state["seen"])
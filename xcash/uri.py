@@ -0,0 +1,290 @@
+import re
+from urllib.parse import unquote
+
+from xcash.address import decode_address, validate_addresses
+from xcash.helpers import DECIMALS, InvalidUri
+
+URI_SCHEME = "xcash"
+URI_FIELDS = ("amount", "payment_id", "recipient_name", "tx_description")
+MAX_URI_AMOUNT = 2 ** 64 - 1  # the wallet reads tx_amount into an unsigned 64 bit amount
+
+# characters the wallet escapes in recipient_name and tx_description, besides controls, space and bytes from "{" on
+_UNSAFE = set(b"\"<>%\\^[]`+$,@:;!#&")
+_ESCAPED = tuple(f"%{byte:02X}" if byte <= 32 or byte >= 123 or byte in _UNSAFE else chr(byte) for byte in range(256))
+_SAFE = re.compile(r"[^\x00-\x20\x7b-\U0010ffff\"<>%\\^\[\]`+$,@:;!#&]*\Z")
+_PAYMENT_ID = re.compile(r"(?:[0-9a-fA-F]{16}|[0-9a-fA-F]{64})\Z")
+_AMOUNT = re.compile(r"(\d*)(?:\.(\d*))?\Z")
+
+
+def url_encode(text: str) -> str:
+    """Escape a name or description like the wallet does. Unlike urllib, "/", "?" and "=" are kept,
+    and like the wallet's parse_uri, parse_uri refuses a parameter whose value holds "=".
+
+    Args:
+        text (str): text
+
+    Returns:
+        str: escaped text
+    """
+    if _SAFE.match(text):
+        return text
+    return "".join([_ESCAPED[byte] for byte in text.encode("utf-8")])
+
+
+def print_amount(atomic: int) -> str:
+    """Format atomic units with all six decimals, as the wallet writes tx_amount
+
+    Args:
+        atomic (int): amount in atomic units
+
+    Returns:
+        str: amount, e.g. "1.500000"
+    """
+    digits = str(atomic).rjust(DECIMALS + 1, "0")
+    return f"{digits[:-DECIMALS]}.{digits[-DECIMALS:]}"
+
+
+def parse_amount(text: str):
+    """Read tx_amount into atomic units, as the wallet does: more than six decimals are only
+    accepted when the extra digits are zeros
+
+    Args:
+        text (str): amount
+
+    Returns:
+        int: amount in atomic units, None when the text is not an amount
+    """
+    match = _AMOUNT.match(text.strip())
+    if match is None:
+        return None
+    whole, fraction = match.group(1), (match.group(2) or "")
+    fraction = fraction[:DECIMALS] + fraction[DECIMALS:].rstrip("0")
+    if len(fraction) > DECIMALS or not whole + fraction:
+        return None
+    atomic = int(whole + fraction.ljust(DECIMALS, "0"))
+    return atomic if atomic <= MAX_URI_AMOUNT else None
+
+
+def _make(address: str, info, amount: int = 0, payment_id: str = "", recipient_name: str = "",
+          tx_description: str = "", scheme: str = URI_SCHEME) -> str:
+    """Build a payment uri of an address which is already decoded
+
+    Args:
+        address (str): address
+        info (AddressInfo): decoded address
+        amount (int, optional): atomic units. Defaults to 0, left out.
+        payment_id (str, optional): 16 or 64 hex characters. Defaults to "".
+        recipient_name (str, optional): name of the payment recipient. Defaults to "".
+        tx_description (str, optional): description of the reason for the tx. Defaults to "".
+        scheme (str, optional): uri scheme. Defaults to URI_SCHEME.
+
+    Raises:
+        ValueError: The wallet would refuse to make the uri
+
+    Returns:
+        str: payment uri
+    """
+    if not info.valid:
+        raise ValueError(f"wrong address: {info.error}")
+    if payment_id:
+        if info.payment_id is not None:
+            raise ValueError("A single payment id is allowed")
+        if not isinstance(payment_id, str) or not _PAYMENT_ID.match(payment_id):
+            raise ValueError(f"Invalid payment id: {payment_id}")
+    if amount and (isinstance(amount, bool) or not isinstance(amount, int) or not 0 < amount <= MAX_URI_AMOUNT):
+        raise ValueError(f"Invalid amount {amount!r}, expected atomic units")
+
+    params = list()
+    if payment_id:
+        params.append("tx_payment_id=" + payment_id)
+    if amount:
+        params.append("tx_amount=" + print_amount(amount))
+    if recipient_name:
+        params.append("recipient_name=" + url_encode(recipient_name))
+    if tx_description:
+        params.append("tx_description=" + url_encode(tx_description))
+    uri = f"{scheme}:{address}"
+    return uri + "?" + "&".join(params) if params else uri
+
+
+def _split(uri: str, scheme: str) -> tuple:
+    """Split a payment uri into its address and parameters
+
+    Args:
+        uri (str): payment uri
+        scheme (str): uri scheme
+
+    Raises:
+        ValueError: The uri has the wrong scheme
+
+    Returns:
+        tuple: (address, parameter string or None)
+    """
+    if not isinstance(uri, str) or not uri.startswith(scheme + ":"):
+        raise ValueError(f"URI has wrong scheme (expected \"{scheme}:\"): {uri}")
+    address, separator, query = uri[len(scheme) + 1:].partition("?")
+    return address, query if separator else None
+
+
+def _parse(address: str, info, query: str) -> dict:
+    """Read the parameters of a payment uri whose address is already decoded
+
+    Args:
+        address (str): address of the uri
+        info (AddressInfo): decoded address
+        query (str): parameters, None when the uri has none
+
+    Raises:
+        ValueError: The wallet would refuse the uri
+
+    Returns:
+        dict: uri with address, payment_id, amount, recipient_name and tx_description, unknown_parameters
+    """
+    if not info.valid:
+        raise ValueError(f"URI has wrong address: {address}")
+    parsed = {"address": address, "payment_id": "", "amount": 0, "recipient_name": "", "tx_description": ""}
+    unknown = list()
+    seen = set()
+    for argument in query.split("&") if query else ():
+        pair = argument.split("=")
+        if len(pair) != 2:
+            raise ValueError(f"URI has wrong parameter: {argument}")
+        key, value = pair
+        if key in seen:
+            raise ValueError(f"URI has more than one instance of {key}")
+        seen.add(key)
+        if key == "tx_amount":
+            parsed["amount"] = parse_amount(value)
+            if parsed["amount"] is None:
+                raise ValueError(f"URI has invalid amount: {value}")
+        elif key == "tx_payment_id":
+            if info.payment_id is not None:
+                raise ValueError("Separate payment id given with an integrated address")
+            if not _PAYMENT_ID.match(value):
+                raise ValueError(f"Invalid payment id: {value}")
+            parsed["payment_id"] = value
+        elif key in ("recipient_name", "tx_description"):
+            parsed[key] = unquote(value, errors="replace")
+        else:
+            unknown.append(argument)
+    return {"uri": parsed, "unknown_parameters": unknown}
+
+
+def make_uri(address: str, amount: int = 0, payment_id: str = "", recipient_name: str = "",
+             tx_description: str = "", scheme: str = URI_SCHEME) -> str:
+    """Build a payment uri locally, the uri of the wallet's make_uri. Like the wallet, it refuses
+    addresses whose network prefix is not XCASH's, see address.decode_address
+
+    Args:
+        address (str): address, checked locally
+        amount (int, optional): the integer amount to receive, in atomic units. Defaults to 0, left out.
+        payment_id (str, optional): 16 or 64 character hexadecimal payment id. Defaults to "".
+        recipient_name (str, optional): name of the payment recipient. Defaults to "".
+        tx_description (str, optional): description of the reason for the tx. Defaults to "".
+        scheme (str, optional): uri scheme. Defaults to URI_SCHEME.
+
+    Raises:
+        InvalidUri: Invalid or non XCASH address, payment id or amount
+
+    Returns:
+        str: payment uri
+    """
+    try:
+        return _make(address, decode_address(address), amount, payment_id, recipient_name, tx_description, scheme)
+    except ValueError as err:
+        raise InvalidUri(str(err))
+
+
+def parse_uri(uri: str, scheme: str = URI_SCHEME) -> dict:
+    """Parse a payment uri locally, the result of the wallet's parse_uri. Like the wallet, it refuses
+    addresses whose network prefix is not XCASH's, see address.decode_address
+
+    Args:
+        uri (str): payment uri
+        scheme (str, optional): uri scheme. Defaults to URI_SCHEME.
+
+    Raises:
+        InvalidUri: The uri is malformed or holds an invalid or non XCASH address, payment id or amount
+
+    Returns:
+        dict: uri with address, payment_id, amount (atomic units), recipient_name and tx_description,
+              unknown_parameters
+    """
+    try:
+        address, query = _split(uri, scheme)
+        return _parse(address, decode_address(address), query)
+    except ValueError as err:
+        raise InvalidUri(str(err))
+
+
+def _raise_errors(errors: list, kind: str) -> None:
+    if errors:
+        raise InvalidUri(f"{len(errors)} invalid {kind}, first: item {errors[0][0]} {errors[0][1]}", errors=errors)
+
+
+def make_uris(rows, scheme: str = URI_SCHEME) -> list:
+    """Build many payment uris locally, with the addresses checked together, see make_uri
+
+    Args:
+        rows (iterable): dicts with address and optionally amount, payment_id, recipient_name, tx_description
+        scheme (str, optional): uri scheme. Defaults to URI_SCHEME.
+
+    Raises:
+        InvalidUri: Rows are invalid, errors lists (item index, message) for each of them
+
+    Returns:
+        list: payment uri per row
+    """
+    checked = list()
+    errors = list()
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors.append((index, "Row is not a dict"))
+            continue
+        checked.append((index, row))
+
+    uris = list()
+    for (index, row), info in zip(checked, validate_addresses(row.get("address") for _, row in checked)):
+        unknown = set(row) - set(URI_FIELDS) - {"address"}
+        try:
+            if unknown:
+                raise ValueError(f"Unknown fields {sorted(unknown)}")
+            uris.append(_make(row["address"], info, row.get("amount") or 0, row.get("payment_id") or "",
+                              row.get("recipient_name") or "", row.get("tx_description") or "", scheme))
+        except ValueError as err:
+            errors.append((index, str(err)))
+    errors.sort()
+    _raise_errors(errors, "uri rows")
+    return uris
+
+
+def parse_uris(uris, scheme: str = URI_SCHEME) -> list:
+    """Parse many payment uris locally, with the addresses checked together, see parse_uri
+
+    Args:
+        uris (iterable): payment uris
+        scheme (str, optional): uri scheme. Defaults to URI_SCHEME.
+
+    Raises:
+        InvalidUri: Uris are invalid, errors lists (item index, message) for each of them
+
+    Returns:
+        list: parse_uri result per uri
+    """
+    split = list()
+    errors = list()
+    for index, uri in enumerate(uris):
+        try:
+            split.append((index, *_split(uri, scheme)))
+        except ValueError as err:
+            errors.append((index, str(err)))
+
+    parsed = list()
+    for (index, address, query), info in zip(split, validate_addresses(address for _, address, _ in split)):
+        try:
+            parsed.append(_parse(address, info, query))
+        except ValueError as err:
+            errors.append((index, str(err)))
+    errors.sort()
+    _raise_errors(errors, "uris")
+    return parsed